@@ -7,7 +7,7 @@ from fedot.api.api_utils.assumptions.assumptions_handler import AssumptionsHandl
 from fedot.api.api_utils.metrics import ApiMetrics
 from fedot.api.api_utils.presets import change_preset_based_on_initial_fit, OperationsPreset
 from fedot.api.time import ApiTime
-from fedot.core.composer.cache import OperationsCache
+from fedot.core.composer.cache import DEFAULT_MAX_DISK_SIZE, OperationsCache
 from fedot.core.composer.composer_builder import ComposerBuilder
 from fedot.core.composer.gp_composer.gp_composer import GPComposer, PipelineComposerRequirements
 from fedot.core.composer.gp_composer.specific_operators import boosting_mutation, parameter_change_mutation
@@ -25,6 +25,7 @@ from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.operation_types_repository import get_operations_for_task
 from fedot.core.repository.quality_metrics_repository import MetricsRepository, MetricType
 from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.utilities.worker_pool import WorkerPool
 from fedot.utilities.define_metric_by_task import MetricByTask, TunerMetricByTask
 
 
@@ -33,6 +34,8 @@ class ApiComposer:
     def __init__(self, problem: str):
         self.metrics = ApiMetrics(problem)
         self.cache: Optional[OperationsCache] = None
+        # Worker processes shared by the initial assumption fit, composing and tuning
+        self.worker_pool: Optional[WorkerPool] = None
         self.preset_name = None
         self.timer = None
 
@@ -90,12 +93,24 @@ class ApiComposer:
             secondary_operations = available_operations
         return primary_operations, secondary_operations
 
-    def init_cache(self, use_cache: bool):
+    def init_cache(self, use_cache: bool, cache_max_disk_size: Optional[int] = DEFAULT_MAX_DISK_SIZE,
+                   cache_eviction_policy: str = 'lru'):
         if use_cache:
             self.cache = OperationsCache()
             #  in case of previously generated singleton cache
+            self.cache.set_disk_limit(cache_max_disk_size, cache_eviction_policy)
             self.cache.reset()
 
+    def init_worker_pool(self, n_jobs: int, log: Optional[Log] = None):
+        """ Creates the pool of worker processes (they are started on the first use) """
+        self.shutdown_worker_pool()
+        self.worker_pool = WorkerPool(n_jobs, log=log)
+
+    def shutdown_worker_pool(self):
+        """ Stops the worker processes if they are started """
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown()
+
     @staticmethod
     def _init_composer_requirements(api_params: dict,
                                     composer_params: dict,
@@ -123,7 +138,9 @@ class ApiComposer:
                                                              timeout=datetime_composing,
                                                              n_jobs=api_params['n_jobs'],
                                                              collect_intermediate_metric=composer_params[
-                                                                 'collect_intermediate_metric'])
+                                                                 'collect_intermediate_metric'],
+                                                             racing_reduction_factor=composer_params.get(
+                                                                 'racing_reduction_factor'))
         return composer_requirements
 
     @staticmethod
@@ -132,6 +149,8 @@ class ApiComposer:
         genetic_scheme_type = GeneticSchemeTypesEnum.parameter_free
         if composer_params['genetic_scheme'] == 'steady_state':
             genetic_scheme_type = GeneticSchemeTypesEnum.steady_state
+        elif composer_params['genetic_scheme'] == 'steady_state_async':
+            genetic_scheme_type = GeneticSchemeTypesEnum.steady_state_async
 
         mutations = [boosting_mutation, parameter_change_mutation,
                      MutationTypesEnum.single_change,
@@ -159,6 +178,7 @@ class ApiComposer:
         with_tuning = tuning_params['with_tuning']
         available_operations = composer_params['available_operations']
         self.timer = ApiTime(time_for_automl=timeout, with_tuning=with_tuning)
+        self.init_worker_pool(api_params['n_jobs'], log)
 
         # Work with initial assumptions
         assumption_handler = AssumptionsHandler(log, train_data)
@@ -168,7 +188,8 @@ class ApiComposer:
                                                                     available_operations)
         with self.timer.launch_assumption_fit():
             fitted_assumption = assumption_handler.fit_assumption_and_check_correctness(initial_assumption[0],
-                                                                                        self.cache)
+                                                                                        self.cache,
+                                                                                        self.worker_pool)
         log.message(f'Initial pipeline was fitted for {self.timer.assumption_fit_spend_time.total_seconds()} sec.')
         self.preset_name = assumption_handler.propose_preset(preset, self.timer)
 
@@ -190,9 +211,10 @@ class ApiComposer:
             .with_optimiser_params(parameters=self._init_optimiser_params(task, composer_params),
                                    external_parameters=composer_params.get('optimizer_external_params')) \
             .with_metrics(metric_function) \
-            .with_history(composer_params.get('history_folder')) \
+            .with_history(composer_params.get('history_folder'), composer_params.get('history_storage_path')) \
             .with_logger(log) \
-            .with_cache(self.cache)
+            .with_cache(self.cache) \
+            .with_worker_pool(self.worker_pool)
         gp_composer: GPComposer = builder.build()
 
         if self.timer.have_time_for_composing(composer_params['pop_size']):
@@ -259,6 +281,8 @@ class ApiComposer:
                 vb_number = composer_requirements.validation_blocks
                 folds = composer_requirements.cv_folds
                 timeout_for_tuning = abs(timeout_for_tuning) / 60
+                # Trials are evaluated by batches on all workers of the pool
+                batch_size = self.worker_pool.n_jobs if self.worker_pool is not None else 1
                 pipeline_gp_composed = pipeline_gp_composed. \
                     fine_tune_all_nodes(loss_function=tuner_loss,
                                         loss_params=loss_params,
@@ -266,7 +290,9 @@ class ApiComposer:
                                         iterations=DEFAULT_TUNING_ITERATIONS_NUMBER,
                                         timeout=timeout_for_tuning,
                                         cv_folds=folds,
-                                        validation_blocks=vb_number)
+                                        validation_blocks=vb_number,
+                                        worker_pool=self.worker_pool,
+                                        batch_size=batch_size)
                 log.message('Hyperparameters tuning finished')
         return pipeline_gp_composed
 
@@ -281,9 +307,10 @@ def _divide_parameters(common_dict: dict) -> List[dict]:
 
     composer_params_dict = dict(max_depth=None, max_arity=None, pop_size=None, num_of_generations=None,
                                 available_operations=None, composer_metric=None, validation_blocks=None,
-                                cv_folds=None, genetic_scheme=None, history_folder=None,
+                                cv_folds=None, genetic_scheme=None, history_folder=None, history_storage_path=None,
                                 stopping_after_n_generation=None, optimizer=None, optimizer_external_params=None,
-                                collect_intermediate_metric=False, max_pipeline_fit_time=None)
+                                collect_intermediate_metric=False, max_pipeline_fit_time=None,
+                                racing_reduction_factor=None)
 
     tuner_params_dict = dict(with_tuning=False, tuner_metric=None)
 
@@ -10,7 +10,9 @@ from fedot.core.composer.cache import OperationsCache
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.log import Log
+from fedot.core.pipelines.executor import LevelParallelExecutor
 from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.utilities.worker_pool import WorkerPool
 
 
 class AssumptionsHandler:
@@ -45,22 +47,29 @@ class AssumptionsHandler:
             initial_assumption = [initial_assumption]
         return initial_assumption
 
-    def fit_assumption_and_check_correctness(self,
-                                             pipeline: Pipeline,
-                                             cache: Optional[OperationsCache] = None) -> [Pipeline, datetime.timedelta]:
+    def fit_assumption_and_check_correctness(self, pipeline: Pipeline,
+                                             cache: Optional[OperationsCache] = None,
+                                             worker_pool: Optional[WorkerPool] = None
+                                             ) -> [Pipeline, datetime.timedelta]:
         """
         Check is initial pipeline can be fitted on a presented data
 
         :param pipeline: pipeline for checking
         :param cache: cache object
+        :param worker_pool: pool of worker processes for the concurrent fit of the independent nodes.
+        The workers are started before the fit, so they are warmed up for the next stages of composing
         """
+        executor = None
+        if worker_pool is not None and worker_pool.n_jobs > 1:
+            worker_pool.warm_up()
+            executor = LevelParallelExecutor(worker_pool.n_jobs, backend='process', worker_pool=worker_pool)
         try:
             data_train, data_test = train_test_data_setup(self.data)
             self.log.message('Initial pipeline fitting started')
-            pipeline.fit(data_train)
+            pipeline.fit(data_train, executor=executor)
             if cache is not None:
                 cache.save_pipeline(pipeline)
-            pipeline.predict(data_test)
+            pipeline.predict(data_test, executor=executor)
             self.log.message('Initial pipeline was fitted successfully')
         except Exception as ex:
             self._raise_evaluating_exception(ex)
@@ -6,7 +6,7 @@ from typing import Union
 import numpy as np
 import pandas as pd
 
-from fedot.core.data.data import InputData, array_to_input_data
+from fedot.core.data.data import InputData, array_to_input_data, autodetect_data_type
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum
@@ -82,9 +82,8 @@ class PandasStrategy(StrategyDefineData):
         else:
             target_array = target
 
-        data = array_to_input_data(features_array=np.asarray(features),
-                                   target_array=np.asarray(target_array),
-                                   task=ml_task)
+        data = InputData.from_dataframe(features, np.asarray(target_array),
+                                        task=ml_task, data_type=autodetect_data_type(ml_task))
         return data
 
 
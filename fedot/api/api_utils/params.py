@@ -128,6 +128,7 @@ class ApiParams:
                   'preset': AUTO_PRESET_NAME,
                   'genetic_scheme': None,
                   'history_folder': None,
+                  'history_storage_path': None,
                   'stopping_after_n_generation': 10}
 
         if problem in ['classification', 'regression']:
@@ -13,6 +13,7 @@ from fedot.api.api_utils.assumptions.assumptions_builder import AssumptionsBuild
 from fedot.api.api_utils.metrics import ApiMetrics
 from fedot.api.api_utils.params import ApiParams
 from fedot.api.api_utils.predefined_model import PredefinedModel
+from fedot.core.composer.cache import DEFAULT_MAX_DISK_SIZE
 from fedot.core.constants import DEFAULT_API_TIMEOUT_MINUTES
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.data_split import train_test_data_setup
@@ -72,10 +73,14 @@ class Fedot:
             'max_pipeline_fit_time' - time constraint for operation fitting (minutes)
             'validation_blocks' - number of validation blocks for time series forecasting
             'initial_assumption' - initial assumption for composer
-            'genetic_scheme' - name of the genetic scheme
+            'genetic_scheme' - name of the genetic scheme ('steady_state', 'steady_state_async'
+                or the default parameter-free scheme)
             'history_folder' - name of the folder for composing history
+            'history_storage_path' - path to the file to stream the composing history to instead of keeping it in memory
             'metric' - metric for quality calculation during composing
             'collect_intermediate_metric' - save metrics for intermediate (non-root) nodes in pipeline
+            'racing_reduction_factor' - if set, the pipelines are evaluated on all cv folds only if they are
+                in the best 1/racing_reduction_factor part on the fewer folds (successive halving)
     :param task_params:  additional parameters of the task
     :param seed: value for fixed random seed
     :param verbose_level: level of the output detailing
@@ -86,6 +91,10 @@ class Fedot:
     :param initial_assumption: initial assumption for composer
     :param n_jobs: num of n_jobs for parallelization (-1 for use all cpu's)
     :param use_cache: bool indicating if it is needed to use pipeline structures caching
+    :param cache_max_disk_size: maximal size (in bytes) of the cached operations stored on disk,
+        None means unlimited size
+    :param cache_eviction_policy: policy of removing the cached operations over the size limit
+        ('lru' - the least recently used first, 'lfu' - the least frequently used first)
     """
 
     def __init__(self,
@@ -98,7 +107,9 @@ class Fedot:
                  safe_mode=True,
                  initial_assumption: Union[Pipeline, List[Pipeline]] = None,
                  n_jobs: int = 1,
-                 use_cache: bool = False
+                 use_cache: bool = False,
+                 cache_max_disk_size: Optional[int] = DEFAULT_MAX_DISK_SIZE,
+                 cache_eviction_policy: str = 'lru'
                  ):
 
         # Classes for dealing with metrics, data sources and hyperparameters
@@ -110,7 +121,8 @@ class Fedot:
         input_params = {'problem': self.metrics.main_problem, 'preset': preset, 'timeout': timeout,
                         'composer_params': composer_params, 'task_params': task_params,
                         'seed': seed, 'verbose_level': verbose_level,
-                        'initial_assumption': initial_assumption, 'n_jobs': n_jobs, 'use_cache': use_cache}
+                        'initial_assumption': initial_assumption, 'n_jobs': n_jobs, 'use_cache': use_cache,
+                        'cache_max_disk_size': cache_max_disk_size, 'cache_eviction_policy': cache_eviction_policy}
         self.params.initialize_params(input_params)
 
         # Initialize ApiComposer's parameters via ApiParams
@@ -166,15 +178,19 @@ class Fedot:
                                                     self.train_data,
                                                     self.params.api_params['logger']).fit()
         else:
-            self.current_pipeline, self.best_models, self.history = \
-                self.api_composer.obtain_model(**self.params.api_params)
-
-            # Final fit for obtained pipeline on full dataset
-            if self.history and not self.history.is_empty() or not self.current_pipeline.is_fitted:
-                self._train_pipeline_on_full_dataset(recommendations, full_train_not_preprocessed)
-                self.params.api_params['logger'].message('Final pipeline was fitted')
-            else:
-                self.params.api_params['logger'].message('Already fitted initial pipeline is used')
+            try:
+                self.current_pipeline, self.best_models, self.history = \
+                    self.api_composer.obtain_model(**self.params.api_params)
+
+                # Final fit for obtained pipeline on full dataset
+                if self.history and not self.history.is_empty() or not self.current_pipeline.is_fitted:
+                    self._train_pipeline_on_full_dataset(recommendations, full_train_not_preprocessed)
+                    self.params.api_params['logger'].message('Final pipeline was fitted')
+                else:
+                    self.params.api_params['logger'].message('Already fitted initial pipeline is used')
+            finally:
+                # Worker processes are shared by all stages of composing, so they are stopped only in the end
+                self.api_composer.shutdown_worker_pool()
 
         # Store data encoder in the pipeline if it is required
         self.current_pipeline.preprocessor = merge_preprocessors(self.data_processor.preprocessor,
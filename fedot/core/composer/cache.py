@@ -1,8 +1,7 @@
-import re
-import string
-
+import pickle
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, List, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, TypeVar, Union
 
 from fedot.core.composer.cache_db import OperationsCacheDB
 from fedot.core.log import Log, SingletonMeta, default_log
@@ -15,38 +14,122 @@ if TYPE_CHECKING:
 
 IOperation = TypeVar('IOperation', bound=Operation)
 
+# Default limits of the sizes (in bytes) of the cache tiers
+DEFAULT_MAX_MEMORY_SIZE = 256 * 2 ** 20
+DEFAULT_MAX_DISK_SIZE = 2 ** 30
+
 
 @dataclass
 class CachedState:
     operation: IOperation
 
 
+class MemoryCacheTier:
+    """
+    In-process LRU storage of the pickled cached states bounded by their total size.
+    The states are kept pickled, so each load restores the separate copy of the operation
+    (the operations may change their state in predict), but the database is not requested.
+
+    :param max_size: maximal total size of the stored states in bytes (0 disables the tier)
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._states: 'OrderedDict[str, bytes]' = OrderedDict()
+        self.size = 0
+
+    def __getstate__(self):
+        # Stored states are not transferred to other processes
+        return {'max_size': self.max_size}
+
+    def __setstate__(self, state):
+        self.__init__(state['max_size'])
+
+    def get(self, uid: str) -> Optional[bytes]:
+        """ Returns the pickled state (None if it is not stored) """
+        pickled = self._states.get(uid)
+        if pickled is None:
+            return None
+        self._states.move_to_end(uid)
+        return pickled
+
+    def put(self, uid: str, pickled: bytes):
+        if len(pickled) > self.max_size:
+            return
+        if uid in self._states:
+            self.size -= len(self._states.pop(uid))
+        self._states[uid] = pickled
+        self.size += len(pickled)
+        while self.size > self.max_size:
+            _, evicted = self._states.popitem(last=False)
+            self.size -= len(evicted)
+
+    def clear(self):
+        self._states.clear()
+        self.size = 0
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._states
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
 class OperationsCache(metaclass=SingletonMeta):
     """
     Stores/loads nodes `fitted_operation` field to increase performance of calculations.
+    The cache consists of two tiers: in-process LRU storage of the pickled operations
+    and the database shared between processes.
 
     :param log: optional Log object to record messages
     :param db_path: optional str determining a file name for caching pipelines
+    :param safe_mode: if True, effectiveness statistics are written to the database on each lookup
+    (slower, but exact even if processes are killed abnormally)
+    :param max_memory_size: maximal size (in bytes) of the in-memory tier, 0 disables the tier
+    :param max_disk_size: maximal size (in bytes) of the operations stored in the database, None means unlimited
+    :param eviction_policy: eviction policy of the database tier ('lru' or 'lfu')
     """
 
-    def __init__(self, log: Optional[Log] = None, db_path: Optional[str] = None):
+    def __init__(self, log: Optional[Log] = None, db_path: Optional[str] = None, safe_mode: bool = False,
+                 max_memory_size: int = DEFAULT_MAX_MEMORY_SIZE, max_disk_size: Optional[int] = DEFAULT_MAX_DISK_SIZE,
+                 eviction_policy: str = 'lru'):
         self.log = log or default_log(__name__)
-        self._db = OperationsCacheDB(db_path)
+        self._memory = MemoryCacheTier(max_memory_size)
+        self._db = OperationsCacheDB(db_path, safe_mode=safe_mode,
+                                     max_size=max_disk_size, eviction_policy=eviction_policy)
 
     @property
-    def effectiveness_ratio(self):
+    def effectiveness_ratio(self) -> Dict[str, float]:
         """
-        Returns percent of how many pipelines/nodes were loaded instead of computing
+        Returns percent of how many pipelines/nodes were loaded instead of computing.
+        'memory_nodes' and 'disk_nodes' are hit rates of the separate tiers
+        (the disk tier is requested only for the nodes missed in memory)
         """
-        #  Result order corresponds to the order in self.db._effectiveness_keys
-        pipelines_hit, nodes_hit, pipelines_total, nodes_total = self._db.get_effectiveness()
+        eff = self._db.get_effectiveness()
+        disk_nodes_total = eff['nodes_total'] - eff['memory_nodes_hit']
+
+        def _ratio(hit: int, total: int) -> float:
+            return round(hit / total, 3) if total else 0.
 
         return {
-            'pipelines': round(pipelines_hit / pipelines_total, 3) if pipelines_total else 0.,
-            'nodes': round(nodes_hit / nodes_total, 3) if nodes_total else 0.
+            'pipelines': _ratio(eff['pipelines_hit'], eff['pipelines_total']),
+            'nodes': _ratio(eff['nodes_hit'], eff['nodes_total']),
+            'memory_nodes': _ratio(eff['memory_nodes_hit'], eff['nodes_total']),
+            'disk_nodes': _ratio(eff['disk_nodes_hit'], disk_nodes_total)
         }
 
+    def set_disk_limit(self, max_disk_size: Optional[int], eviction_policy: str = 'lru'):
+        """
+        Changes the size limit of the database tier (the cache is the singleton,
+        so it is configured after the creation by its users)
+
+        :param max_disk_size: maximal size (in bytes) of the operations stored in the database, None means unlimited
+        :param eviction_policy: eviction policy of the database tier ('lru' or 'lfu')
+        """
+        self._db.set_size_limit(max_disk_size, eviction_policy)
+
     def reset(self):
+        self._memory.clear()
         self._db.reset()
 
     def save_nodes(self, nodes: Union[Node, List[Node]], fold_id: Optional[int] = None):
@@ -56,12 +139,15 @@ class OperationsCache(metaclass=SingletonMeta):
                             (can be used to specify the number of CV fold)
         """
         try:
-            mapped = [
-                (_get_structural_id(node, fold_id), CachedState(node.fitted_operation))
-                for node in ensure_wrapped_in_sequence(nodes)
-                if node.fitted_operation is not None
-            ]
-            self._db.add_operations(mapped)
+            mapped = []
+            for node in ensure_wrapped_in_sequence(nodes):
+                if node.fitted_operation is None:
+                    continue
+                uid = _get_structural_id(node, fold_id)
+                pickled = pickle.dumps(CachedState(node.fitted_operation), pickle.HIGHEST_PROTOCOL)
+                self._memory.put(uid, pickled)
+                mapped.append((uid, pickled))
+            self._db.add_pickled_operations(mapped)
         except Exception as ex:
             self.log.info(f'Nodes can not be saved: {ex}. Continue')
 
@@ -83,7 +169,7 @@ class OperationsCache(metaclass=SingletonMeta):
         try:
             nodes_lst = ensure_wrapped_in_sequence(nodes)
             structural_ids = [_get_structural_id(node, fold_id) for node in nodes_lst]
-            cached_states = self._db.get_operations(structural_ids)
+            cached_states = self._load_states(structural_ids)
             for idx, cached_state in enumerate(cached_states):
                 if cached_state is not None:
                     nodes_lst[idx].fitted_operation = cached_state.operation
@@ -95,6 +181,30 @@ class OperationsCache(metaclass=SingletonMeta):
         finally:
             return cache_was_used
 
+    def _load_states(self, structural_ids: List[str]) -> List[Optional['CachedState']]:
+        """ Loads states from the memory tier and requests the database only for the missed ones.
+        Each state is unpickled separately, so the nodes do not share the loaded operations """
+        pickled_states = [self._memory.get(uid) for uid in structural_ids]
+        memory_hit = sum(pickled is not None for pickled in pickled_states)
+
+        missed_idx = [idx for idx, pickled in enumerate(pickled_states) if pickled is None]
+        disk_hit = 0
+        if missed_idx:
+            db_pickled_states = self._db.get_pickled_operations([structural_ids[idx] for idx in missed_idx])
+            for idx, pickled in zip(missed_idx, db_pickled_states):
+                if pickled is None:
+                    continue
+                pickled_states[idx] = pickled
+                self._memory.put(structural_ids[idx], pickled)
+                disk_hit += 1
+
+        cached_states = [pickle.loads(pickled) if pickled is not None else None for pickled in pickled_states]
+        nodes_hit = memory_hit + disk_hit
+        self._db.add_effectiveness(pipelines_hit=int(nodes_hit == len(structural_ids)), pipelines_total=1,
+                                   nodes_hit=nodes_hit, nodes_total=len(structural_ids),
+                                   memory_nodes_hit=memory_hit, disk_nodes_hit=disk_hit)
+        return cached_states
+
     def try_load_into_pipeline(self, pipeline: 'Pipeline', fold_id: Optional[int] = None) -> bool:
         """
         :param pipeline: pipeline for loading cache into
@@ -108,6 +218,6 @@ class OperationsCache(metaclass=SingletonMeta):
 
 
 def _get_structural_id(node: Node, fold_id: Optional[int] = None) -> str:
-    structural_id = re.sub(f'[{string.punctuation}]+', '', node.descriptive_id)
+    structural_id = node.structural_hash
     structural_id += f'_{fold_id}' if fold_id is not None else ''
     return structural_id
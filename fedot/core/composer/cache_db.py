@@ -1,9 +1,12 @@
+import os
 import pickle
 import sqlite3
+import threading
+import time
 import uuid
-from contextlib import closing
+from multiprocessing.util import Finalize
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from fedot.core.utils import default_fedot_data_dir
 
@@ -12,60 +15,192 @@ if TYPE_CHECKING:
 
 
 class OperationsCacheDB:
-    def __init__(self, db_path: str):
+    """
+    SQLite storage of the fitted operations.
+
+    Each process keeps its own persistent connection to the database in WAL journal mode,
+    so readers do not block the writer. Effectiveness counters and access statistics of the records
+    are accumulated in memory and flushed to the database in batches (and at the process exit).
+
+    :param db_path: optional path to the database file
+    :param safe_mode: if True, statistics are flushed to the database after each lookup.
+    It is slower, but the statistics stay exact even if worker processes are killed without finishing normally
+    :param stats_flush_size: number of lookups after which the statistics are flushed to the database
+    :param max_size: maximal total size (in bytes) of the pickled operations stored in the database.
+    If exceeded, the records are evicted according to the ``eviction_policy``. None means unlimited size
+    :param eviction_policy: 'lru' to evict the least recently used records first
+    or 'lfu' to evict the least frequently used ones
+    """
+
+    eviction_policies = ('lru', 'lfu')
+
+    _busy_timeout_seconds = 60
+    # SQLite versions before 3.32 limit the number of host parameters in the query by 999
+    _max_query_params = 900
+
+    def __init__(self, db_path: str, safe_mode: bool = False, stats_flush_size: int = 100,
+                 max_size: Optional[int] = None, eviction_policy: str = 'lru'):
         self.db_path = db_path or Path(default_fedot_data_dir(), f'tmp_{str(uuid.uuid4())}')
         self._db_suffix = '.cache_db'
         self.db_path = Path(self.db_path).with_suffix(self._db_suffix)
+        self.safe_mode = safe_mode
+        self.stats_flush_size = stats_flush_size
+        self.set_size_limit(max_size, eviction_policy)
 
         self._del_prev_temps()
 
-        self._effectiveness_keys = ['pipelines_hit', 'nodes_hit', 'pipelines_total', 'nodes_total']
+        self._effectiveness_keys = ['pipelines_hit', 'nodes_hit', 'pipelines_total', 'nodes_total',
+                                    'memory_nodes_hit', 'disk_nodes_hit', 'disk_evicted']
         self._eff_table = 'effectiveness'
         self._op_table = 'operations'
+
+        self._init_process_state()
         self._init_db()
 
-    def get_effectiveness(self) -> Tuple[int, int, int, int]:
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            with conn:
-                cur = conn.cursor()
-                cur.execute(f'SELECT {",".join(self._effectiveness_keys)} FROM {self._eff_table};')
-                return cur.fetchone()
+    def _init_process_state(self):
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._conn_finalizer: Optional[Finalize] = None
+        self._lock = threading.RLock()
+        self._stats = _PendingStats(self._eff_table, self._op_table, self._effectiveness_keys)
+
+    def __getstate__(self):
+        # Connection, lock and not flushed statistics belong to the current process
+        self._flush_stats()
+        state = self.__dict__.copy()
+        for key in ('_conn', '_conn_pid', '_conn_finalizer', '_lock', '_stats'):
+            del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_process_state()
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """ Persistent connection of the current process (the connection is never shared between processes) """
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(self.db_path, timeout=self._busy_timeout_seconds,
+                                         check_same_thread=False, isolation_level=None)
+            # Makes possible to return the space of the evicted records to the file system
+            # (takes effect only for the newly created database)
+            self._conn.execute('PRAGMA auto_vacuum=INCREMENTAL;')
+            self._conn.execute('PRAGMA journal_mode=WAL;')
+            self._conn.execute('PRAGMA synchronous=NORMAL;')
+            self._conn_pid = os.getpid()
+            if self._conn_finalizer is not None:
+                # The finalizer of the previous connection (e.g. inherited from the parent process)
+                self._conn_finalizer.cancel()
+            # Statistics of the process are flushed when the storage is collected or the process finishes.
+            # The finalizer does not reference the storage, otherwise it would be never collected
+            self._conn_finalizer = Finalize(self, _finalize_connection, args=(self._conn, self._stats),
+                                            exitpriority=10)
+        return self._conn
+
+    def set_size_limit(self, max_size: Optional[int], eviction_policy: str = 'lru'):
+        """ Sets the size limit of the database and the eviction policy (see the parameters of the class).
+        The records over the limit are evicted with the next added ones """
+        if eviction_policy not in self.eviction_policies:
+            raise ValueError(f'Unknown eviction policy {eviction_policy}. '
+                             f'Available policies: {self.eviction_policies}')
+        self.max_size = max_size
+        self.eviction_policy = eviction_policy
+
+    def _transaction(self, immediate: bool = False) -> '_Transaction':
+        return _Transaction(self._connection, immediate)
+
+    def get_effectiveness(self) -> Dict[str, int]:
+        with self._lock:
+            self._flush_stats()
+            cur = self._connection.execute(f'SELECT {",".join(self._effectiveness_keys)} FROM {self._eff_table};')
+            return dict(zip(self._effectiveness_keys, cur.fetchone()))
+
+    def add_effectiveness(self, **counters: int):
+        """ Increments effectiveness counters (see ``_effectiveness_keys``) of the lookup """
+        with self._lock:
+            for col, inc_val in counters.items():
+                self._inc_eff(col, inc_val)
+            self._stats.lookups += 1
+            if self.safe_mode or self._stats.lookups >= self.stats_flush_size:
+                self._flush_stats()
 
     def reset(self):
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            with conn:
-                cur = conn.cursor()
-                self._reset_eff(cur)
-                self._reset_ops(cur)
+        with self._lock, self._transaction(immediate=True) as cur:
+            self._stats.clear()
+            self._reset_eff(cur)
+            self._reset_ops(cur)
 
     def _del_prev_temps(self):
-        for file in self.db_path.parent.glob(f'tmp_*{self._db_suffix}'):
-            file.unlink()
+        # WAL mode creates additional '-wal' and '-shm' files near the database
+        for file in self.db_path.parent.glob(f'tmp_*{self._db_suffix}*'):
+            try:
+                file.unlink()
+            except FileNotFoundError:
+                pass
 
     def _init_db(self):
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            with conn:
-                cur = conn.cursor()
-                eff_type = ' INTEGER DEFAULT 0'
-                fields = f'{eff_type},'.join(self._effectiveness_keys) + eff_type
-                cur.execute((
-                    f'CREATE TABLE IF NOT EXISTS {self._eff_table} ('
-                    'id INTEGER PRIMARY KEY CHECK (id = 1),'  # noqa better viewed like that
-                    f'{fields}'  # noqa
-                    ');'
-                ))
-                cur.execute(f'INSERT INTO {self._eff_table} DEFAULT VALUES;')
-            with conn:
-                cur = conn.cursor()
-                cur.execute((
-                    f'CREATE TABLE IF NOT EXISTS {self._op_table} ('
-                    'id TEXT PRIMARY KEY,'  # noqa better viewed like that
-                    'operation BLOB'  # noqa
-                    ');'
-                ))
-
-    def _inc_eff(self, cur: sqlite3.Cursor, col: str, inc_val: int = 1):
-        cur.execute(f'UPDATE {self._eff_table} SET {col} = {col} + {inc_val};')
+        with self._transaction(immediate=True) as cur:
+            eff_type = ' INTEGER DEFAULT 0'
+            fields = f'{eff_type},'.join(self._effectiveness_keys) + eff_type
+            cur.execute((
+                f'CREATE TABLE IF NOT EXISTS {self._eff_table} ('
+                'id INTEGER PRIMARY KEY CHECK (id = 1),'  # noqa better viewed like that
+                f'{fields}'  # noqa
+                ');'
+            ))
+            cur.execute(f'INSERT OR IGNORE INTO {self._eff_table} (id) VALUES (1);')
+            cur.execute((
+                f'CREATE TABLE IF NOT EXISTS {self._op_table} ('
+                'id TEXT PRIMARY KEY,'  # noqa better viewed like that
+                'operation BLOB,'  # noqa
+                'size INTEGER,'  # noqa
+                'last_access REAL,'  # noqa
+                'hits INTEGER DEFAULT 0'  # noqa
+                ');'
+            ))
+
+    def _inc_eff(self, col: str, inc_val: int = 1):
+        self._stats.effectiveness[col] += inc_val
+
+    def _flush_stats(self, cur: Optional[sqlite3.Cursor] = None):
+        """ Writes accumulated counters and access statistics to the database """
+        if self._stats.is_empty:
+            return
+        if cur is None:
+            with self._transaction(immediate=True) as new_cur:
+                self._stats.flush(new_cur)
+        else:
+            self._stats.flush(cur)
+
+    def _register_access(self, uids: List[str]):
+        now = time.time()
+        for uid in uids:
+            hits, _ = self._stats.access.get(uid, (0, now))
+            self._stats.access[uid] = (hits + 1, now)
+
+    def _evict(self, cur: sqlite3.Cursor, new_uids: List[str]):
+        """
+        Removes the records according to the eviction policy until the size limit is satisfied.
+        Just added records are evicted last, otherwise LFU policy would remove them first
+        """
+        cur.execute(f'SELECT SUM(size) FROM {self._op_table};')
+        excess = (cur.fetchone()[0] or 0) - self.max_size
+        if excess <= 0:
+            return
+        order = 'last_access' if self.eviction_policy == 'lru' else 'hits, last_access'
+        cur.execute(f'SELECT id, size FROM {self._op_table} ORDER BY {order};')
+        new_uids = set(new_uids)
+        # sorting is stable, so the order of the policy is kept inside both groups
+        candidates = sorted(cur.fetchall(), key=lambda record: record[0] in new_uids)
+        evicted = []
+        for uid, size in candidates:
+            if excess <= 0:
+                break
+            evicted.append((uid,))
+            excess -= size
+        cur.executemany(f'DELETE FROM {self._op_table} WHERE id = ?;', evicted)
+        self._inc_eff('disk_evicted', len(evicted))
+        cur.execute('PRAGMA incremental_vacuum;')
 
     def _reset_eff(self, cur: sqlite3.Cursor):
         cur.execute(f'DELETE FROM {self._eff_table};')
@@ -74,64 +209,113 @@ class OperationsCacheDB:
     def _reset_ops(self, cur: sqlite3.Cursor):
         cur.execute(f'DELETE FROM {self._op_table};')
 
-    @staticmethod
-    def _create_temp_for_ordered_select(cur: sqlite3.Cursor, uids: List[str]):
-        _, *other = uids
-        tmp_name = 'tmp'
-        cur.execute(f'DROP TABLE IF EXISTS {tmp_name};')  # TODO: make truly temp table, not like that
-        query = (
-            f'CREATE TABLE {tmp_name} AS '
-            'SELECT 1 as id1, ? as id2'
-        )
-        for num, _ in enumerate(other, 2):
-            query += (
-                ' union '
-                f'SELECT {num} as id1, ? as id2'
-            )
-        cur.execute(query, uids)
-        return tmp_name
+    def _select_operations(self, cur: sqlite3.Cursor, uids: List[str]) -> Dict[str, bytes]:
+        unique_uids = list(dict.fromkeys(uids))
+        found = {}
+        for start in range(0, len(unique_uids), self._max_query_params):
+            chunk = unique_uids[start:start + self._max_query_params]
+            placeholders = ','.join('?' * len(chunk))
+            cur.execute(f'SELECT id, operation FROM {self._op_table} WHERE id IN ({placeholders});', chunk)
+            found.update(cur.fetchall())
+        return found
+
+    def get_pickled_operations(self, uids: List[str]) -> List[Optional[bytes]]:
+        """ Returns pickled operations in the order of ``uids`` (None for the missing ones) """
+        with self._lock:
+            with self._transaction() as cur:
+                found = self._select_operations(cur, uids)
+            self._register_access([uid for uid in uids if uid in found])
+            return [found.get(uid) for uid in uids]
 
     def get_operations(self, uids: List[str]) -> List[Optional['CachedState']]:
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            with conn:
-                cur = conn.cursor()
-                tmp_name = self._create_temp_for_ordered_select(cur, uids)
-                cur.execute((
-                    f'SELECT operation FROM {tmp_name} '
-                    f'LEFT JOIN {self._op_table} ON {self._op_table}.id = {tmp_name}.id2 '
-                    f'ORDER BY {tmp_name}.id1;'
-                ))
-                retrieved = cur.fetchall()
-                non_null = [x for (x,) in retrieved if x is not None]
-                self._inc_eff(cur, 'nodes_hit', len(non_null))
-                if len(non_null) == len(uids):
-                    self._inc_eff(cur, 'pipelines_hit')
-                retrieved = [pickle.loads(x) if x is not None else None for (x,) in retrieved]
-                self._inc_eff(cur, 'nodes_total', len(uids))
-                self._inc_eff(cur, 'pipelines_total')
-                return retrieved
-
-    def add_operation(self, conn: sqlite3.Connection, uid: str, val: 'CachedState'):
-        with conn:
-            cur = conn.cursor()
-            pdata = pickle.dumps(val, pickle.HIGHEST_PROTOCOL)
-            cur.execute(f'INSERT OR IGNORE INTO {self._op_table} VALUES (?, ?);',
-                        [uid, sqlite3.Binary(pdata)])
+        return [pickle.loads(pickled) if pickled is not None else None
+                for pickled in self.get_pickled_operations(uids)]
 
     def add_operations(self, uid_val_lst: List[Tuple[str, 'CachedState']]):
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            with conn:
-                cur = conn.cursor()
-                pickled = [
-                    (uid, sqlite3.Binary(pickle.dumps(val, pickle.HIGHEST_PROTOCOL)))
-                    for uid, val in uid_val_lst
-                ]
-                cur.executemany(f'INSERT OR IGNORE INTO {self._op_table} VALUES (?, ?);', pickled)
+        # Pickling is done before the transaction to hold the database lock as short as possible
+        self.add_pickled_operations([(uid, pickle.dumps(val, pickle.HIGHEST_PROTOCOL))
+                                     for uid, val in uid_val_lst])
+
+    def add_pickled_operations(self, uid_pickled_lst: List[Tuple[str, bytes]]):
+        now = time.time()
+        records = [(uid, sqlite3.Binary(pickled), len(pickled), now) for uid, pickled in uid_pickled_lst]
+        with self._lock, self._transaction(immediate=True) as cur:
+            cur.executemany(f'INSERT OR IGNORE INTO {self._op_table} (id, operation, size, last_access) '
+                            'VALUES (?, ?, ?, ?);', records)
+            if self.max_size is not None:
+                # Access statistics must be actual to choose the records for eviction
+                self._flush_stats(cur)
+                self._evict(cur, [uid for uid, _ in uid_pickled_lst])
+
+    @property
+    def size(self) -> int:
+        """ Total size (in bytes) of the pickled operations stored in the database """
+        with self._lock:
+            cur = self._connection.execute(f'SELECT SUM(size) FROM {self._op_table};')
+            return cur.fetchone()[0] or 0
 
     def __len__(self):
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            with conn:
-                cur = conn.cursor()
-                cur.execute(f'SELECT id FROM {self._op_table};')
-                all_rows = cur.fetchall()
-                return len(all_rows)
+        with self._lock:
+            cur = self._connection.execute(f'SELECT COUNT(*) FROM {self._op_table};')
+            return cur.fetchone()[0]
+
+
+class _PendingStats:
+    """ Effectiveness counters and access statistics of the records not flushed to the database yet """
+
+    def __init__(self, eff_table: str, op_table: str, effectiveness_keys: List[str]):
+        self._eff_table = eff_table
+        self._op_table = op_table
+        self._effectiveness_keys = effectiveness_keys
+        self.clear()
+
+    def clear(self):
+        self.effectiveness: Dict[str, int] = dict.fromkeys(self._effectiveness_keys, 0)
+        self.lookups = 0
+        # uid -> (number of hits, time of the last access)
+        self.access: Dict[str, Tuple[int, float]] = {}
+
+    @property
+    def is_empty(self) -> bool:
+        return not (any(self.effectiveness.values()) or self.access)
+
+    def flush(self, cur: sqlite3.Cursor):
+        updates = ','.join(f'{col} = {col} + ?' for col in self._effectiveness_keys)
+        cur.execute(f'UPDATE {self._eff_table} SET {updates};',
+                    [self.effectiveness[col] for col in self._effectiveness_keys])
+        cur.executemany(f'UPDATE {self._op_table} SET hits = hits + ?, last_access = MAX(last_access, ?) '
+                        'WHERE id = ?;',
+                        [(hits, last_access, uid) for uid, (hits, last_access) in self.access.items()])
+        self.clear()
+
+
+def _finalize_connection(conn: sqlite3.Connection, stats: _PendingStats):
+    try:
+        if not stats.is_empty:
+            with _Transaction(conn, immediate=True) as cur:
+                stats.flush(cur)
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+class _Transaction:
+    """ Context manager for the explicit transaction on the connection in autocommit mode.
+    Immediate transaction takes the write lock at the start, so concurrent writers
+    wait for each other with busy timeout instead of failing on the lock upgrade """
+
+    def __init__(self, conn: sqlite3.Connection, immediate: bool = False):
+        self._conn = conn
+        self._immediate = immediate
+        self._cur: Optional[sqlite3.Cursor] = None
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self._cur = self._conn.cursor()
+        self._cur.execute('BEGIN IMMEDIATE;' if self._immediate else 'BEGIN;')
+        return self._cur
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            self._cur.execute('COMMIT;' if exc_type is None else 'ROLLBACK;')
+        finally:
+            self._cur.close()
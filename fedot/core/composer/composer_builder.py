@@ -24,6 +24,7 @@ from fedot.core.repository.quality_metrics_repository import (
 )
 from fedot.core.repository.tasks import Task, TaskTypesEnum
 from fedot.core.utilities.data_structures import ensure_wrapped_in_sequence
+from fedot.core.utilities.worker_pool import WorkerPool
 from fedot.core.optimisers.objective.objective import Objective
 
 
@@ -46,8 +47,10 @@ class ComposerBuilder:
         self.initial_pipelines: Optional[Sequence[Pipeline]] = None
         self._keep_history = False
         self._history_folder: Optional[str] = None
+        self._history_storage_path: Optional[str] = None
         self.log: Optional[Log] = None
         self.cache: Optional[OperationsCache] = None
+        self.worker_pool: Optional[WorkerPool] = None
         self.composer_requirements: PipelineComposerRequirements = self._get_default_composer_params()
         self.metrics: Sequence[MetricsEnum] = self._get_default_quality_metrics(task)
 
@@ -84,9 +87,14 @@ class ComposerBuilder:
                              f'Sequence[Pipeline] or Pipeline needed, but has {type(initial_pipelines)}')
         return self
 
-    def with_history(self, history_folder: Optional[str] = None):
+    def with_history(self, history_folder: Optional[str] = None, history_storage_path: Optional[str] = None):
+        """
+        :param history_folder: folder to save the results of the generations
+        :param history_storage_path: path to the file to stream the generations to instead of keeping them in memory
+        """
         self._keep_history = True
         self._history_folder = history_folder
+        self._history_storage_path = history_storage_path
         return self
 
     def with_logger(self, logger):
@@ -97,6 +105,10 @@ class ComposerBuilder:
         self.cache = cache
         return self
 
+    def with_worker_pool(self, worker_pool: Optional[WorkerPool]):
+        self.worker_pool = worker_pool
+        return self
+
     def _get_default_composer_params(self) -> PipelineComposerRequirements:
         # Get all available operations for task
         operations = get_operations_for_task(task=self.task, mode='all')
@@ -137,11 +149,14 @@ class ComposerBuilder:
                                        parameters=self.optimiser_parameters,
                                        log=self.log,
                                        **self.optimizer_external_parameters)
+        if self.worker_pool is not None:
+            optimiser.set_worker_pool(self.worker_pool)
         history = None
         if self._keep_history:
             # fix init of GPComposer, use history
-            history = OptHistory(objective, self._history_folder)
-            history_callback = partial(log_to_history, history)
+            history = OptHistory(objective, self._history_folder, self._history_storage_path)
+            history_callback = partial(log_to_history, history,
+                                       fitness_archive=getattr(optimiser, 'fitness_archive', None))
             optimiser.set_optimisation_callback(history_callback)
 
         composer = self.composer_cls(optimiser,
@@ -30,6 +30,8 @@ class PipelineComposerRequirements(ComposerRequirements):
     :attribute validation_blocks: number of validation blocks for time series validation
     :attribute n_jobs: num of n_jobs
     :attribute collect_intermediate_metric: save metrics for intermediate (non-root) nodes in pipeline
+    :attribute racing_reduction_factor: if set, the pipelines are raced on the growing number of cv folds
+        and only 1/racing_reduction_factor of them is promoted to the next number of folds (successive halving)
     """
     pop_size: int = 20
     max_pop_size: Optional[int] = 55
@@ -43,6 +45,7 @@ class PipelineComposerRequirements(ComposerRequirements):
     validation_blocks: int = None
     n_jobs: int = 1
     collect_intermediate_metric: bool = False
+    racing_reduction_factor: Optional[int] = None
 
 
 class GPComposer(Composer):
@@ -87,7 +90,7 @@ class GPComposer(Composer):
         # Define objective function
         validation_blocks = self.composer_requirements.validation_blocks
         objective_evaluator = self.objective_builder.build(data, validation_blocks=validation_blocks)
-        objective_function = objective_evaluator.evaluate
+        objective_function = objective_evaluator
 
         # Define callback for computing intermediate metrics if needed
         if self.composer_requirements.collect_intermediate_metric:
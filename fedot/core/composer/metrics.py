@@ -1,5 +1,6 @@
 import sys
 from abc import abstractmethod
+from typing import Optional, Tuple
 
 import numpy as np
 from sklearn.metrics import (accuracy_score, f1_score, log_loss, mean_absolute_error, mean_absolute_percentage_error,
@@ -54,21 +55,56 @@ class QualityMetric:
 
     @classmethod
     def get_value(cls, pipeline: 'Pipeline', reference_data: InputData,
-                  validation_blocks: int = None) -> float:
+                  validation_blocks: int = None, predictions: Optional[dict] = None) -> float:
+        """
+        Get metric value based on pipeline and InputData for validation
+
+        :param pipeline: fitted pipeline
+        :param reference_data: data for validation
+        :param validation_blocks: number of validation blocks for time series in-sample validation
+        :param predictions: optional dictionary shared between several metrics to make a single prediction
+        per output mode (see `get_prediction`)
+        """
         metric = cls.default_value
         try:
-            if validation_blocks is None:
-                # Time series or regression classical hold-out validation
-                results, reference_data = cls._simple_prediction(pipeline, reference_data)
-            else:
-                # Perform time series in-sample validation
-                reference_data, results = cls._in_sample_prediction(pipeline, reference_data, validation_blocks)
+            reference_data, results = cls.get_prediction(pipeline, reference_data, validation_blocks, predictions)
             metric = cls.metric(reference_data, results)
         except Exception as ex:
             # TODO: use log instead of stdout
             print(f'Metric evaluation error: {ex}')
         return metric
 
+    @classmethod
+    def get_prediction(cls, pipeline: 'Pipeline', reference_data: InputData,
+                       validation_blocks: int = None,
+                       predictions: Optional[dict] = None) -> Tuple[InputData, OutputData]:
+        """
+        Obtain prediction of the pipeline prepared for metric evaluation
+
+        :param pipeline: fitted pipeline
+        :param reference_data: data for validation
+        :param validation_blocks: number of validation blocks for time series in-sample validation
+        :param predictions: optional dictionary with already obtained predictions. If it is passed,
+        the prediction is taken from it (or stored into it) by the output mode of the metric,
+        so the metrics with the same output mode reuse a single prediction
+        :return: pair of reference data and prediction
+        """
+        # In-sample forecast does not depend on the output mode
+        prediction_key = cls.output_mode if validation_blocks is None else 'in_sample'
+        if predictions is not None and prediction_key in predictions:
+            return predictions[prediction_key]
+
+        if validation_blocks is None:
+            # Time series or regression classical hold-out validation
+            results, reference_data = cls._simple_prediction(pipeline, reference_data)
+        else:
+            # Perform time series in-sample validation
+            reference_data, results = cls._in_sample_prediction(pipeline, reference_data, validation_blocks)
+
+        if predictions is not None:
+            predictions[prediction_key] = (reference_data, results)
+        return reference_data, results
+
     @classmethod
     def _simple_prediction(cls, pipeline: 'Pipeline', reference_data: InputData):
         """ Method prepares data for metric evaluation and perform simple validation """
@@ -105,8 +141,8 @@ class QualityMetric:
 
     @classmethod
     def get_value_with_penalty(cls, pipeline: 'Pipeline', reference_data: InputData,
-                               validation_blocks: int = None) -> float:
-        quality_metric = cls.get_value(pipeline, reference_data)
+                               validation_blocks: int = None, predictions: Optional[dict] = None) -> float:
+        quality_metric = cls.get_value(pipeline, reference_data, predictions=predictions)
         structural_metric = StructuralComplexity.get_value(pipeline)
 
         penalty = abs(structural_metric * quality_metric * cls.max_penalty_part)
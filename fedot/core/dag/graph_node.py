@@ -47,6 +47,10 @@ class GraphNode:
     def descriptive_id(self):
         return self._operator.descriptive_id()
 
+    @property
+    def structural_hash(self) -> str:
+        return self._operator.structural_hash()
+
     def ordered_subnodes_hierarchy(self, visited=None) -> List['GraphNode']:
         return self._operator.ordered_subnodes_hierarchy(visited)
 
@@ -116,7 +116,7 @@ class GraphOperator:
                 node in other_node.nodes_from]
 
     def connect_nodes(self, parent: GraphNode, child: GraphNode):
-        if child.descriptive_id not in [p.descriptive_id for p in parent.ordered_subnodes_hierarchy()]:
+        if child.structural_hash not in {p.structural_hash for p in parent.ordered_subnodes_hierarchy()}:
             if child.nodes_from:
                 # if not already connected
                 child.nodes_from.append(parent)
@@ -176,10 +176,10 @@ class GraphOperator:
 
     def is_graph_equal(self, other_graph: 'Graph') -> bool:
         if all(isinstance(rn, list) for rn in [self._graph.root_node, other_graph.root_node]):
-            return set(rn.descriptive_id for rn in self._graph.root_node) == \
-                   set(rn.descriptive_id for rn in other_graph.root_node)
+            return set(rn.structural_hash for rn in self._graph.root_node) == \
+                   set(rn.structural_hash for rn in other_graph.root_node)
         elif all(not isinstance(rn, list) for rn in [self._graph.root_node, other_graph.root_node]):
-            return self._graph.root_node.descriptive_id == other_graph.root_node.descriptive_id
+            return self._graph.root_node.structural_hash == other_graph.root_node.structural_hash
         else:
             return False
 
@@ -1,5 +1,6 @@
+import hashlib
 from copy import copy
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 if TYPE_CHECKING:
     from fedot.core.dag.graph_node import GraphNode
@@ -10,6 +11,10 @@ MAX_DEPTH = 1000
 class NodeOperator:
     def __init__(self, node):
         self._node = node
+        # (signature of the node content, hash of the label)
+        self._label_cache: Optional[Tuple[Tuple, str]] = None
+        # (hash of the label and hashes of the parents, structural hash of the node)
+        self._hash_cache: Optional[Tuple[Tuple, str]] = None
 
     def distance_to_primary_level(self):
         if not self._node.nodes_from:
@@ -35,21 +40,95 @@ class NodeOperator:
     def descriptive_id(self) -> str:
         return _descriptive_id_recursive(self._node, visited_nodes=[])
 
+    def structural_hash(self, memo: Optional[Dict[int, str]] = None, visiting: Optional[Set[int]] = None) -> str:
+        """
+        Merkle-style hash of the subtree of the node: hash of the node label combined with the hashes of its parents.
+        Unlike descriptive_id it does not depend on the order of parameters in the dict,
+        each node of the subtree is processed once and the results are cached in the nodes
+        (the caches are validated by the content of the node and the hashes of its parents)
 
-def _descriptive_id_recursive(current_node, visited_nodes) -> str:
+        :param memo: hashes of the already processed nodes by their ids (shared parents are processed once)
+        :param visiting: ids of the nodes on the current path to detect cycles
+        :return: hex digest of the hash
+        """
+        memo = {} if memo is None else memo
+        visiting = set() if visiting is None else visiting
+        node_id = id(self._node)
+        if node_id in memo:
+            return memo[node_id]
+        if node_id in visiting:
+            return _CYCLED_HASH
+        visiting.add(node_id)
+        parents_hashes = tuple(sorted(parent._operator.structural_hash(memo, visiting)
+                                      for parent in self._node.nodes_from or ()))
+        visiting.discard(node_id)
+
+        key = (self._label_hash(), parents_hashes)
+        if self._hash_cache is None or self._hash_cache[0] != key:
+            self._hash_cache = (key, _hash_str(f'{key[0]}({";".join(parents_hashes)})'))
+        memo[node_id] = self._hash_cache[1]
+        return memo[node_id]
+
+    def _label_hash(self) -> str:
+        content = self._node.content
+        signature = _content_signature(content)
+        if self._label_cache is None or not _is_same_signature(self._label_cache[0], signature):
+            self._label_cache = (signature, _hash_str(_node_label(content, canonical=True)))
+        return self._label_cache[1]
+
+
+_CYCLED_HASH = hashlib.sha1(b'ID_CYCLED').hexdigest()
+
+
+def _hash_str(value: str) -> str:
+    return hashlib.sha1(value.encode()).hexdigest()
+
+
+def _content_signature(content: dict) -> Tuple:
+    """ Cheap snapshot of the content that keeps the references to the name and to the values of params """
+    params = content.get('params')
+    params_items = tuple(params.items()) if isinstance(params, dict) else params
+    return content['name'], params, params_items
+
+
+def _is_same_signature(first: Tuple, second: Tuple) -> bool:
+    """ Compares the snapshots by identity of the objects (values may be not comparable, e.g. arrays) """
+    (first_name, first_params, first_items), (second_name, second_params, second_items) = first, second
+    if first_name is not second_name or first_params is not second_params:
+        return False
+    if not isinstance(first_items, tuple) or not isinstance(second_items, tuple):
+        return first_items is second_items
+    return len(first_items) == len(second_items) and \
+        all(k1 == k2 and v1 is v2 for (k1, v1), (k2, v2) in zip(first_items, second_items))
+
+
+def _node_label(content: dict, canonical: bool = False) -> str:
     """
-    Method returns verbal description of the content in the node
-    and its parameters
+    Verbal description of the content in the node and its parameters
+
+    :param content: content of the node
+    :param canonical: if True, the parameters are sorted by names
     """
-    if isinstance(current_node.content['name'], str):
+    operation_params = content.get('params')
+    if canonical and isinstance(operation_params, dict):
+        operation_params = dict(sorted(operation_params.items(), key=lambda item: str(item[0])))
+    if isinstance(content['name'], str):
         # If there is a string: name of operation (as in json repository)
-        node_label = current_node.content['name']
-        if current_node.content.get('params'):
-            node_label = f'n_{node_label}_{current_node.content["params"]}'
+        node_label = content['name']
+        if operation_params:
+            node_label = f'n_{node_label}_{operation_params}'
     else:
         # If instance of Operation is placed in 'name'
-        operation_params = current_node.content.get('params')
-        node_label = current_node.content['name'].description(operation_params)
+        node_label = content['name'].description(operation_params)
+    return node_label
+
+
+def _descriptive_id_recursive(current_node, visited_nodes) -> str:
+    """
+    Method returns verbal description of the content in the node
+    and its parameters
+    """
+    node_label = _node_label(current_node.content)
 
     full_path = ''
     if current_node in visited_nodes:
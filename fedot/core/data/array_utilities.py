@@ -1,12 +1,70 @@
 from functools import reduce
-from typing import Optional
+from typing import Iterator, Optional, Sequence, Union
 
 import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Minimal number of cells of the encoded table, starting from which it's stored as the sparse matrix
+SPARSE_MIN_SIZE = 2 ** 22
+# Maximal share of the non-zero cells of the encoded table stored as the sparse matrix
+SPARSE_MAX_DENSITY = 0.25
+# Number of rows of the memory-mapped tables processed at once
+CHUNK_ROWS = 2 ** 16
+
+
+class IndexLookup:
+    """ Hash table over the elements of the index (e.g. :attr:`Data.idx`) for the vectorized search
+    of their positions. The index elements are supposed to be unchanged after the lookup is built.
+
+    If the searched elements and the index have the different kinds (e.g. numbers and strings)
+    or are the arbitrary objects, they are compared by the string representations.
+
+    :param index: index of the data
+    """
+
+    def __init__(self, index: Union[Sequence, np.array]):
+        self.index = np.asarray(index)
+        lookup = pd.Index(self.index)
+        if lookup.is_unique:
+            self._lookup = lookup
+            self._first_positions = None
+        else:
+            # Only the first occurrence of the duplicated element is found
+            is_first = ~lookup.duplicated(keep='first')
+            self._lookup = lookup[is_first]
+            self._first_positions = np.flatnonzero(is_first)
+        self._str_lookup = None
+
+    def is_built_for(self, index: Union[Sequence, np.array]) -> bool:
+        """ Checks whether the lookup is built for the same index or for the view of its memory """
+        return is_same_array(index, self.index)
+
+    def positions(self, elements: Union[Sequence, np.array]) -> np.array:
+        """ Returns positions of the elements in the index (-1 for the missing ones) """
+        elements = np.asarray(elements)
+        if len(elements) > 0 and (elements.dtype.kind != self.index.dtype.kind or elements.dtype.kind == 'O'):
+            if self._str_lookup is None:
+                self._str_lookup = IndexLookup(self.index.astype(str))
+            return self._str_lookup.positions(elements.astype(str))
+        positions = self._lookup.get_indexer(elements)
+        if self._first_positions is not None:
+            positions = np.where(positions >= 0, self._first_positions[positions], -1)
+        return positions
+
+    def contains(self, elements: Union[Sequence, np.array]) -> np.array:
+        """ Returns mask of the elements that are in the index """
+        return self.positions(elements) >= 0
 
 
 def find_common_elements(*indices: np.array) -> np.array:
     """ Returns array with unique elements common to *all* indices
     or the first index if it's the only one. """
+    first = np.asarray(indices[0])
+    if all(index is indices[0] or np.array_equal(index, first) for index in indices[1:]) and \
+            _is_strictly_increasing(first):
+        # Indices of the outputs are usually the same, so the intersection is not needed
+        return first
     common_elements = reduce(np.intersect1d, indices[1:], indices[0])
     return common_elements
 
@@ -18,14 +76,17 @@ def flatten_extra_dim(data: Optional[np.array]) -> Optional[np.array]:
 
     :return: reshaped view of the original array or None if input is None. """
 
-    if data is not None and data.shape[-1] == 1:
+    if data is not None and not is_sparse(data) and data.shape[-1] == 1:
         return data.reshape(data.shape[:-1])
     return data
 
 
 def atleast_n_dimensions(data: np.array, ndim: int) -> np.array:
     """ Return a view with extra dimensions to the array if necessary,
-    such that the result has the required number of dimensions."""
+    such that the result has the required number of dimensions.
+    Sparse matrices are always two-dimensional and are returned as is. """
+    if is_sparse(data):
+        return data
     while data.ndim < ndim:
         data = np.expand_dims(data, axis=-1)
     return data
@@ -37,3 +98,113 @@ def atleast_2d(data: np.array) -> np.array:
 
 def atleast_4d(data: np.array) -> np.array:
     return atleast_n_dimensions(data, ndim=4)
+
+
+def readonly_view(data: Optional[np.array]) -> Optional[np.array]:
+    """ Returns read-only view of the array that shares the buffer with the original array.
+    Sparse matrices are returned as the matrices over the read-only views of their arrays.
+    Other objects that are not numpy arrays are returned as is. """
+    if isinstance(data, np.ndarray):
+        view = data.view()
+        view.flags.writeable = False
+        return view
+    if isinstance(data, (sparse.csr_matrix, sparse.csc_matrix)):
+        data_arrays = tuple(readonly_view(array) for array in (data.data, data.indices, data.indptr))
+        return type(data)(data_arrays, shape=data.shape, copy=False)
+    return data
+
+
+def writable(data: Optional[np.array]) -> Optional[np.array]:
+    """ Returns the array itself if it can be modified in-place or its copy otherwise.
+    Must be applied before in-place modifications of the arrays that can be read-only views
+    (copy is materialised only for the views, see :meth:`Data.view`). """
+    if isinstance(data, np.ndarray) and not data.flags.writeable:
+        return data.copy()
+    if isinstance(data, (sparse.csr_matrix, sparse.csc_matrix)) and not data.data.flags.writeable:
+        return data.copy()
+    return data
+
+
+def is_memory_mapped(data) -> bool:
+    """ Checks if the data is the numpy array backed by the file (see :meth:`InputData.from_npy`),
+    such arrays are processed by chunks of rows (see :func:`row_chunks`) instead of loading them at once """
+    return isinstance(data, np.memmap)
+
+
+def row_chunks(rows_number: int, chunk_size: Optional[int] = None) -> Iterator[slice]:
+    """ Returns the slices of the consecutive rows with the size of chunk_size (:data:`CHUNK_ROWS` by default) """
+    chunk_size = chunk_size or CHUNK_ROWS
+    for start in range(0, rows_number, chunk_size):
+        yield slice(start, min(start + chunk_size, rows_number))
+
+
+def is_sparse(data) -> bool:
+    """ Checks if the data is the scipy sparse matrix """
+    return sparse.issparse(data)
+
+
+def rows_number(data: Union[np.array, sparse.spmatrix]) -> int:
+    """ Returns the number of rows of the array or the sparse matrix (len is not defined for the latter) """
+    return data.shape[0] if is_sparse(data) else len(data)
+
+
+def select_rows(data: Union[np.array, sparse.spmatrix], mask: np.array) -> Union[np.array, sparse.spmatrix]:
+    """ Returns the rows of the array or the sparse matrix selected by the boolean mask """
+    if is_sparse(data):
+        return data.tocsr()[np.flatnonzero(mask)]
+    return np.asarray(data)[mask]
+
+
+def hstack_features(tables: Sequence[Union[np.array, sparse.spmatrix]]) -> Union[np.array, sparse.spmatrix]:
+    """ Stacks two-dimensional tables horizontally. If any of them is sparse,
+    the result is the CSR matrix, so the sparse tables are not densified """
+    if any(is_sparse(table) for table in tables):
+        return sparse.hstack([table if is_sparse(table) else np.asarray(table, dtype=float) for table in tables],
+                             format='csr')
+    return np.concatenate(tables, axis=-1)
+
+
+def to_dense(data: Union[np.array, sparse.spmatrix]) -> np.array:
+    """ Returns the dense array for the sparse matrix, other data is returned as is """
+    return data.toarray() if is_sparse(data) else data
+
+
+def compact_table(table: sparse.spmatrix) -> Union[np.array, sparse.spmatrix]:
+    """ Returns the sparse table (e.g. after one hot encoding or text vectorization) as the CSR matrix
+    if it is large and sparse enough (see :data:`SPARSE_MIN_SIZE` and :data:`SPARSE_MAX_DENSITY`),
+    the dense array otherwise, as most operations process small tables faster in the dense form """
+    n_rows, n_columns = table.shape
+    size = n_rows * n_columns
+    if size >= SPARSE_MIN_SIZE and table.nnz <= SPARSE_MAX_DENSITY * size:
+        return table.tocsr()
+    return table.toarray()
+
+
+def as_slice(positions: np.array) -> Union[slice, np.array]:
+    """ Returns the slice if the positions are consecutive, so the selection by them is the view of the array
+    instead of its copy. Other positions are returned as is. """
+    positions = np.asarray(positions)
+    if positions.ndim == 1 and len(positions) > 0 and positions.dtype.kind in 'iu' and \
+            positions[-1] - positions[0] == len(positions) - 1 and np.all(np.diff(positions) == 1):
+        return slice(positions[0], positions[-1] + 1)
+    return positions
+
+
+def is_same_array(data, array: np.array) -> bool:
+    """ Checks whether the data is the array itself or its view of the same memory """
+    if data is array:
+        return True
+    return isinstance(data, np.ndarray) and _memory_layout(data) == _memory_layout(array)
+
+
+def _is_numeric(data: np.array) -> bool:
+    return data.dtype.kind in 'biuf'
+
+
+def _memory_layout(data: np.array) -> tuple:
+    interface = data.__array_interface__
+    return interface['data'][0], interface['shape'], interface['strides'], interface['typestr']
+
+
+def _is_strictly_increasing(data: np.array) -> bool:
+    return data.ndim == 1 and _is_numeric(data) and bool(np.all(data[1:] > data[:-1]))
@@ -0,0 +1,108 @@
+from copy import copy
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from fedot.core.data.array_utilities import is_same_array
+
+# Types of the elements of the object table built from the numerical columns of the dtype kinds
+_NUMERICAL_ELEMENT_TYPES = {'f': float, 'i': int, 'u': int, 'b': bool}
+_INFINITE_VALUES = [np.inf, -np.inf]
+
+
+class TypedColumns:
+    """
+    Typed storage of the columns of the features table built from the pandas DataFrame.
+
+    The features are the dense table (numpy array), so the table with the columns of the different types
+    is the object array, where the types of the columns are lost and every number is the separate python object.
+    The typed columns keep them: the numerical columns are the arrays of their dtypes
+    and the string columns are dictionary-encoded (:class:`pandas.Categorical`), other columns are not stored.
+    So the types, missing and infinite values of the columns are found vectorized
+    instead of checking the elements of the table one by one.
+    The typed columns are used for the tables with the columns of the different types only,
+    as the types of the columns of the numerical table are known from its dtype.
+
+    The typed columns describe the dense table they are built with,
+    so they are valid only while this table is not replaced (see :meth:`is_built_for`).
+
+    :param data_frame: table with the features
+    """
+
+    def __init__(self, data_frame: pd.DataFrame):
+        self.table = data_frame.to_numpy()
+        self.columns: List[Optional[Union[np.array, pd.Categorical]]] = \
+            [_typed_column(data_frame.iloc[:, column_id]) for column_id in range(data_frame.shape[1])]
+
+    def is_built_for(self, table: np.array) -> bool:
+        """ Checks whether the typed columns describe the table (it is the same table or its view) """
+        return is_same_array(table, self.table)
+
+    def select_columns(self, column_ids: Sequence[int]) -> 'TypedColumns':
+        """ Returns the typed columns of the table with the selected columns only """
+        selected = copy(self)
+        selected.table = self.table[:, column_ids]
+        selected.columns = [self.columns[column_id] for column_id in column_ids]
+        return selected
+
+    def element_type(self, column_id: int) -> Optional[type]:
+        """ Returns the type of the non-missing elements of the column in the dense table
+        or None if the column is not stored """
+        column = self.columns[column_id]
+        if column is None:
+            return None
+        if isinstance(column, pd.Categorical):
+            return str
+        return _NUMERICAL_ELEMENT_TYPES[column.dtype.kind]
+
+    def missing_mask(self, column_id: int) -> Optional[np.array]:
+        """ Returns the mask of the missing elements of the column or None if the column is not stored """
+        column = self.columns[column_id]
+        if column is None:
+            return None
+        if isinstance(column, pd.Categorical):
+            return column.codes == -1
+        if column.dtype.kind == 'f':
+            return np.isnan(column)
+        return np.zeros(len(column), dtype=bool)
+
+    def replace_infinite_values(self) -> 'TypedColumns':
+        """ Returns the typed columns of the table with the infinite values replaced with nans.
+        Only the numerical and not stored columns can contain them, so the other columns are not checked,
+        and the table is copied only if there are such values (the typed columns are returned as is otherwise) """
+        infinite_masks = {}
+        for column_id, column in enumerate(self.columns):
+            if column is None:
+                infinite_mask = np.isin(self.table[:, column_id], _INFINITE_VALUES)
+            elif isinstance(column, np.ndarray) and column.dtype.kind == 'f':
+                infinite_mask = np.isinf(column)
+            else:
+                continue
+            if infinite_mask.any():
+                infinite_masks[column_id] = infinite_mask
+        if not infinite_masks:
+            return self
+
+        replaced = copy(self)
+        replaced.table = self.table.copy()
+        replaced.columns = list(self.columns)
+        for column_id, infinite_mask in infinite_masks.items():
+            replaced.table[infinite_mask, column_id] = np.nan
+            if replaced.columns[column_id] is not None:
+                replaced.columns[column_id] = np.where(infinite_mask, np.nan, replaced.columns[column_id])
+        return replaced
+
+
+def _typed_column(column: pd.Series) -> Optional[Union[np.array, pd.Categorical]]:
+    """ Returns the numerical column as the array, the string column as the dictionary-encoded one,
+    other columns (e.g. with the elements of the different types) are not stored.
+    The stored column must give the same types of the elements as the column of the dense table """
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in _NUMERICAL_ELEMENT_TYPES:
+        return column.to_numpy()
+    if column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == 'string':
+        categorical_column = pd.Categorical(column)
+        # Elements of the subtypes of str (e.g. numpy strings) have other types in the dense table
+        if all(type(category) is str for category in categorical_column.categories):
+            return categorical_column
+    return None
@@ -2,7 +2,7 @@ import glob
 import os
 from copy import copy, deepcopy
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -15,8 +15,18 @@ except ModuleNotFoundError:
     warn_requirement('opencv-python')
     cv2 = None
 
-from fedot.core.data.array_utilities import atleast_2d
+from fedot.core.data.array_utilities import (
+    CHUNK_ROWS,
+    IndexLookup,
+    as_slice,
+    atleast_2d,
+    is_sparse,
+    readonly_view,
+    rows_number
+)
+from fedot.core.data.columnar import TypedColumns
 from fedot.core.data.load_data import JSONBatchLoader, TextBatchLoader
+from fedot.core.data.memory_mapped import NpyTableWriter
 from fedot.core.data.supplementary_data import SupplementaryData
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum
@@ -36,6 +46,50 @@ class Data:
     # Object with supplementary info
     supplementary_data: SupplementaryData = field(default_factory=SupplementaryData)
 
+    # Lazily built hash table over idx (see :attr:`idx_lookup`)
+    _idx_lookup: Optional[IndexLookup] = field(default=None, init=False, repr=False, compare=False)
+    # Typed storage of the feature columns (see :attr:`typed_columns`)
+    _typed_columns: Optional[TypedColumns] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def idx_lookup(self) -> IndexLookup:
+        """ Hash table for the vectorized search of the positions of the elements in idx.
+        It is built on the first call and rebuilt only if idx is replaced """
+        if self._idx_lookup is None or not self._idx_lookup.is_built_for(self.idx):
+            self._idx_lookup = IndexLookup(self.idx)
+        return self._idx_lookup
+
+    @property
+    def typed_columns(self) -> Optional[TypedColumns]:
+        """ Typed storage of the feature columns (see :meth:`from_dataframe`).
+        It is None if the features are not the table the typed columns were built with """
+        if self._typed_columns is not None and not self._typed_columns.is_built_for(self.features):
+            # The features were replaced, so the typed columns are obsolete
+            self._typed_columns = None
+        return self._typed_columns
+
+    @typed_columns.setter
+    def typed_columns(self, typed_columns: Optional[TypedColumns]):
+        self._typed_columns = typed_columns
+
+    def view(self) -> 'Data':
+        """
+        Returns copy of the data that shares numpy arrays and sparse matrices with the original data
+        as read-only views instead of copying them. Other fields are copied. The code that modifies arrays in-place
+        must take their writable copy before (see :func:`~fedot.core.data.array_utilities.writable`),
+        so the arrays are copied only if they are actually changed.
+        """
+        data_view = copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray) or is_sparse(value):
+                setattr(data_view, name, readonly_view(value))
+            elif isinstance(value, (IndexLookup, TypedColumns)):
+                # The lookup and the typed columns are not changed, and they are valid for the views of the arrays
+                setattr(data_view, name, value)
+            else:
+                setattr(data_view, name, deepcopy(value))
+        return data_view
+
     @staticmethod
     def from_csv(file_path=None,
                  delimiter=',',
@@ -43,7 +97,9 @@ class Data:
                  data_type: DataTypesEnum = DataTypesEnum.table,
                  columns_to_drop: Optional[List] = None,
                  target_columns: Union[str, List] = '',
-                 index_col: Optional[Union[str, int]] = 0):
+                 index_col: Optional[Union[str, int]] = 0,
+                 mmap_folder: Optional[str] = None,
+                 chunk_size: Optional[int] = None):
         """
         :param file_path: the path to the CSV with data
         :param columns_to_drop: the names of columns that should be dropped
@@ -53,15 +109,78 @@ class Data:
         :param target_columns: name of target column (last column if empty and no target if None)
         :param index_col: column name or index to use as the Data.idx;
             if None then arrange new unique index
+        :param mmap_folder: folder to store the table read by chunks as the .npy files. If it's set,
+            the features are memory-mapped from the file instead of loading them (see :meth:`from_npy`),
+            so they must be numeric
+        :param chunk_size: number of rows of the chunks the table is read with (if mmap_folder is set)
         :return:
         """
+        if mmap_folder is not None:
+            paths = _csv_to_npy(file_path, mmap_folder, delimiter=delimiter, columns_to_drop=columns_to_drop,
+                                target_columns=target_columns, index_col=index_col, chunk_size=chunk_size)
+            return InputData.from_npy(*paths, task=task, data_type=data_type)
 
         data_frame = pd.read_csv(file_path, sep=delimiter, index_col=index_col)
         if columns_to_drop:
             data_frame = data_frame.drop(columns_to_drop, axis=1)
 
         idx = data_frame.index.to_numpy()
-        features, target = process_target_and_features(data_frame, target_columns)
+        features_df, target = _split_target_and_features(data_frame, target_columns)
+
+        return InputData.from_dataframe(features_df, target, idx=idx, task=task, data_type=data_type)
+
+    @staticmethod
+    def from_dataframe(features_df: pd.DataFrame,
+                       target: Optional[np.array] = None,
+                       idx: Optional[np.array] = None,
+                       task: Task = Task(TaskTypesEnum.classification),
+                       data_type: DataTypesEnum = DataTypesEnum.table) -> 'InputData':
+        """
+        Creates the data with the features from the pandas DataFrame. The features are the dense table,
+        and if its columns have different types, the dtypes of the DataFrame columns are kept
+        in the typed storage alongside it (see :attr:`typed_columns`), so the preprocessing
+        does not define the types of the columns by their elements.
+
+        :param features_df: table with the features
+        :param target: the target array
+        :param idx: the index of the data (the new range index if None)
+        :param task: the task that should be solved with data
+        :param data_type: the type of data interpretation
+        """
+        if idx is None:
+            idx = np.arange(len(features_df))
+        typed_columns = TypedColumns(features_df)
+        data = InputData(idx=idx, features=typed_columns.table, target=target, task=task, data_type=data_type)
+        if typed_columns.table.dtype == object:
+            data.typed_columns = typed_columns
+        return data
+
+    @staticmethod
+    def from_npy(features_path: str,
+                 target_path: Optional[str] = None,
+                 idx_path: Optional[str] = None,
+                 task: Task = Task(TaskTypesEnum.classification),
+                 data_type: DataTypesEnum = DataTypesEnum.table,
+                 columns: Optional[Sequence[int]] = None):
+        """
+        Creates the data with the features memory-mapped from the .npy file. The features are read from the disk
+        only when they are used: the subsets of rows read only the selected rows, the preprocessing
+        and the operations that can be trained incrementally process the table by chunks of rows.
+
+        :param features_path: the path to the .npy file with the features table
+        :param target_path: the path to the .npy file with the target (no target if None)
+        :param idx_path: the path to the .npy file with the index (new unique index if None)
+        :param task: the task that should be solved with data
+        :param data_type: the type of data interpretation
+        :param columns: positions of the columns of features to use (all columns if None).
+            Consecutive columns remain memory-mapped, other ones are loaded
+        :return:
+        """
+        features = np.load(features_path, mmap_mode='r')
+        if columns is not None:
+            features = features[:, as_slice(columns)]
+        target = np.load(target_path) if target_path is not None else None
+        idx = np.load(idx_path) if idx_path is not None else np.arange(len(features))
 
         return InputData(idx=idx, features=features, target=target, task=task, data_type=data_type)
 
@@ -331,11 +450,9 @@ class InputData(Data):
         :param selected_idx: list of indices for extraction
         :return:
         """
-        idx_list = [str(i) for i in self.idx]
-
         # extractions of row number for each existing index from selected_idx
-        row_nums = [idx_list.index(str(selected_ind)) for selected_ind in selected_idx
-                    if str(selected_ind) in idx_list]
+        row_nums = self.idx_lookup.positions(selected_idx)
+        row_nums = row_nums[row_nums >= 0]
         new_features = None
 
         if self.features is not None:
@@ -360,7 +477,7 @@ class InputData(Data):
         Shuffles features and target if possible
         """
         if self.data_type is DataTypesEnum.table:
-            shuffled_ind = np.random.permutation(len(self.features))
+            shuffled_ind = np.random.permutation(rows_number(self.features))
             idx, features, target = np.asarray(self.idx)[shuffled_ind], self.features[shuffled_ind], self.target[
                 shuffled_ind]
             self.idx = idx
@@ -371,7 +488,7 @@ class InputData(Data):
 
     def convert_non_int_indexes_for_fit(self, pipeline):
         """ Conversion non int (datetime, string, etc) indexes in integer form in fit stage """
-        copied_data = deepcopy(self)
+        copied_data = self.view()
         is_timestamp = isinstance(copied_data.idx[0], pd._libs.tslibs.timestamps.Timestamp)
         is_numpy_datetime = isinstance(copied_data.idx[0], np.datetime64)
         # if fit stage- just creating range of integers
@@ -393,7 +510,7 @@ class InputData(Data):
 
     def convert_non_int_indexes_for_predict(self, pipeline):
         """Conversion non int (datetime, string, etc) indexes in integer form in predict stage"""
-        copied_data = deepcopy(self)
+        copied_data = self.view()
         is_timestamp = isinstance(copied_data.idx[0], pd._libs.tslibs.timestamps.Timestamp)
         is_numpy_datetime = isinstance(copied_data.idx[0], np.datetime64)
         # if predict stage - calculating shift from last train part index
@@ -407,12 +524,9 @@ class InputData(Data):
             copied_data.idx = pipeline.last_idx_int + np.array(range(1, len(copied_data.idx) + 1))
         return copied_data
 
-    @staticmethod
-    def _resolve_func(pipeline, x):
-        return pipeline.last_idx_int + (x - pipeline.last_idx_dt) // pipeline.period
-
     def _resolve_non_int_idx(self, pipeline):
-        return np.array(list(map(lambda x: self._resolve_func(pipeline, x), self.idx)))
+        shifts = (pd.DatetimeIndex(self.idx) - pipeline.last_idx_dt) // pipeline.period
+        return pipeline.last_idx_int + np.asarray(shifts)
 
 
 @dataclass
@@ -446,18 +560,63 @@ def process_target_and_features(data_frame: pd.DataFrame,
     :return features: numpy array (table) with features
     :return target: numpy array (column) with target
     """
+    features_df, target = _split_target_and_features(data_frame, target_column)
+    return features_df.to_numpy(), target
+
+
+def _split_target_and_features(data_frame: pd.DataFrame,
+                               target_column: Optional[Union[str, List[str]]]
+                               ) -> Tuple[pd.DataFrame, Optional[np.ndarray]]:
+    """ Returns the DataFrame with the features and numpy array with the target
+    (see :func:`process_target_and_features`) """
     if target_column == '':
         # Take the last column in the table
         target_column = data_frame.columns[-1]
 
     if target_column:
         target = atleast_2d(data_frame[target_column].to_numpy())
-        features = data_frame.drop(columns=target_column).to_numpy()
+        features_df = data_frame.drop(columns=target_column)
     else:
         target = None
-        features = data_frame.to_numpy()
+        features_df = data_frame
 
-    return features, target
+    return features_df, target
+
+
+def _csv_to_npy(file_path: str, folder: str, delimiter: str = ',',
+                columns_to_drop: Optional[List] = None,
+                target_columns: Union[str, List] = '',
+                index_col: Optional[Union[str, int]] = 0,
+                chunk_size: Optional[int] = None) -> Tuple[str, Optional[str], str]:
+    """ Converts the CSV table into the .npy files with features, target and index reading it by chunks of rows
+
+    :return: paths to the files with features, target (None if there is no target) and index
+    """
+    os.makedirs(folder, exist_ok=True)
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    features_path, target_path, idx_path = (os.path.join(folder, f'{name}_{part}.npy')
+                                            for part in ('features', 'target', 'idx'))
+    targets, indices = [], []
+    with NpyTableWriter(features_path) as features_writer:
+        for chunk in pd.read_csv(file_path, sep=delimiter, index_col=index_col, chunksize=chunk_size or CHUNK_ROWS):
+            if columns_to_drop:
+                chunk = chunk.drop(columns_to_drop, axis=1)
+            features, target = process_target_and_features(chunk, target_columns)
+            features_writer.append(features)
+            indices.append(chunk.index.to_numpy())
+            if target is not None:
+                targets.append(target)
+
+    np.save(idx_path, _savable_array(np.concatenate(indices)))
+    if not targets:
+        return features_path, None, idx_path
+    np.save(target_path, _savable_array(np.concatenate(targets)))
+    return features_path, target_path, idx_path
+
+
+def _savable_array(array: np.array) -> np.array:
+    # Object arrays are saved without pickling, so their elements are converted into strings
+    return array.astype(str) if array.dtype == object else array
 
 
 def data_type_is_table(data: Union[InputData, OutputData]) -> bool:
@@ -3,6 +3,7 @@ from typing import Union
 import numpy as np
 import pandas as pd
 
+from fedot.core.data.array_utilities import is_memory_mapped, is_sparse, row_chunks
 from fedot.core.data.data import InputData, data_type_is_table, data_type_is_ts, data_type_is_multi_ts
 from fedot.core.repository.dataset_types import DataTypesEnum
 
@@ -14,6 +15,13 @@ def data_type_is_suitable_preprocessing(data: InputData) -> bool:
 
 
 def replace_inf_with_nans(input_data: InputData):
+    typed_columns = input_data.typed_columns
+    if typed_columns is not None:
+        replaced_typed_columns = typed_columns.replace_infinite_values()
+        if replaced_typed_columns is not typed_columns:
+            input_data.features = replaced_typed_columns.table
+            input_data.typed_columns = replaced_typed_columns
+        return
     values_to_replace = [np.inf, -np.inf]
     features_with_replaced_inf = np.where(np.isin(input_data.features,
                                                   values_to_replace),
@@ -68,6 +76,9 @@ def find_categorical_columns(table: np.array, column_types: dict = None):
     :return non_categorical_ids: indices of non categorical columns in table
     """
     if column_types is None:
+        if is_sparse(table) or table.dtype.kind in 'biufc':
+            # Numeric (and sparse) tables have no string columns, so their elements are not checked
+            return [], list(range(table.shape[1] if table.ndim > 1 else 1))
         # Define if data contains string columns for "unknown table"
         return force_categorical_determination(table)
 
@@ -116,12 +127,21 @@ def data_has_missing_values(data: Union[InputData, 'MultiModalData']) -> bool:
     if not isinstance(data, InputData):
         for data_source_name, values in data.items():
             if data_type_is_table(values):
-                return pd.DataFrame(values.features).isna().sum().sum() > 0
+                return _features_have_missing_values(values.features)
     elif data_type_is_suitable_preprocessing(data):
-        return pd.DataFrame(data.features).isna().sum().sum() > 0
+        return _features_have_missing_values(data.features)
     return False
 
 
+def _features_have_missing_values(features) -> bool:
+    if is_sparse(features):
+        # Only the stored elements of the sparse matrix can be missing
+        return bool(np.isnan(features.data).any())
+    if is_memory_mapped(features):
+        return any(np.isnan(features[rows]).any() for rows in row_chunks(len(features)))
+    return pd.DataFrame(features).isna().sum().sum() > 0
+
+
 def data_has_categorical_features(data: Union[InputData, 'MultiModalData']) -> bool:
     """
     Check data for categorical columns.
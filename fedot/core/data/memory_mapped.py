@@ -0,0 +1,70 @@
+import os
+from typing import Optional
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from fedot.core.data.array_utilities import row_chunks
+
+
+class NpyTableWriter:
+    """
+    Writer of the numeric table to the .npy file by chunks of rows, so the table is never loaded at once.
+    The file can be memory-mapped then (see :meth:`~fedot.core.data.data.InputData.from_npy`).
+
+    The number of rows is unknown until the last chunk, so the chunks are appended to the raw file first
+    and are moved to the .npy file with the final shape on :meth:`close`.
+
+    :param path: path to the .npy file
+    :param dtype: type of the elements of the table
+    """
+
+    def __init__(self, path: str, dtype: np.dtype = np.dtype(float)):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.rows_number = 0
+        self.columns_number: Optional[int] = None
+        self._raw_path = f'{path}.part'
+        self._raw_file = open(self._raw_path, mode='wb')
+
+    def append(self, chunk: np.array):
+        """ Appends the rows of the chunk to the table """
+        try:
+            chunk = np.asarray(chunk, dtype=self.dtype)
+        except (TypeError, ValueError) as ex:
+            raise ValueError(f'Only numeric tables can be memory-mapped: {ex}') from ex
+        if chunk.ndim != 2:
+            chunk = chunk.reshape((len(chunk), -1))
+        if self.columns_number is None:
+            self.columns_number = chunk.shape[1]
+        elif chunk.shape[1] != self.columns_number:
+            raise ValueError(f'Chunk has {chunk.shape[1]} columns instead of {self.columns_number}')
+        self._raw_file.write(np.ascontiguousarray(chunk).tobytes())
+        self.rows_number += len(chunk)
+
+    def close(self) -> str:
+        """ Finishes writing of the table and returns the path to the .npy file """
+        if self._raw_file.closed:
+            return self.path
+        self._raw_file.close()
+        shape = (self.rows_number, self.columns_number or 0)
+        table = open_memmap(self.path, mode='w+', dtype=self.dtype, shape=shape)
+        if self.rows_number > 0 and shape[1] > 0:
+            raw_table = np.memmap(self._raw_path, dtype=self.dtype, mode='r', shape=shape)
+            for rows in row_chunks(self.rows_number):
+                table[rows] = raw_table[rows]
+            del raw_table
+        table.flush()
+        del table
+        os.remove(self._raw_path)
+        return self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._raw_file.close()
+            os.remove(self._raw_path)
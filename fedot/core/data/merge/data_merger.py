@@ -5,7 +5,6 @@ from fedot.core.data.merge.supplementary_data_merger import SupplementaryDataMer
 from fedot.core.log import Log, default_log
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.data.array_utilities import *
-from fedot.core.utilities.data_structures import are_same_length
 
 
 class DataMerger:
@@ -30,6 +29,7 @@ class DataMerger:
         self.common_indices = find_common_elements(*idx_list)
         if len(self.common_indices) == 0:
             raise ValueError(f'There are no common indices for outputs')
+        self._common_indices_lookup = IndexLookup(self.common_indices)
 
         # Find first output with the main target & resulting task
         self.main_output = DataMerger.find_main_output(outputs)
@@ -96,11 +96,11 @@ class DataMerger:
 
         if any(is_forecast_indices):
             # Cut prediction length to minimum length
-            predict_len = min(len(output.predict) for output in self.outputs)
+            predict_len = min(rows_number(output.predict) for output in self.outputs)
             common_predicts = [output.predict[:predict_len] for output in self.outputs]
         else:
             common_predicts = [self.select_common(output.idx, output.predict) for output in self.outputs]
-            if not are_same_length(common_predicts):
+            if len({rows_number(predict) for predict in common_predicts}) > 1:
                 raise ValueError('Indices of merged data are not equal and not unique. Check validity of the pipeline.')
         return common_predicts
 
@@ -109,8 +109,8 @@ class DataMerger:
         return list(map(atleast_2d, predicts))
 
     def merge_predicts(self, predicts: List[np.array]) -> np.array:
-        # Finally, merge predictions into features for the next stage
-        return np.concatenate(predicts, axis=-1)
+        # Finally, merge predictions into features for the next stage (sparse predictions are not densified)
+        return hstack_features(predicts)
 
     def postprocess_predicts(self, merged_predicts: np.array) -> np.array:
         """ Post-process merged predictions (e.g. reshape). """
@@ -119,14 +119,14 @@ class DataMerger:
     def select_common(self, idx: Union[list, np.array], data: Union[list, np.array] = None):
         """ Select elements from data according to index for data.
          Includes only elements with index from self.common_indices. """
-        index_mask = np.isin(idx, self.common_indices)
+        index_mask = self._common_indices_lookup.contains(idx)
         sliced = data if data is not None else idx
-        sliced = np.asarray(sliced)[index_mask]
+        sliced = select_rows(sliced, index_mask)
         return sliced
 
     @staticmethod
     def is_forecast_index(output: 'OutputData'):
-        return len(output.idx) != len(output.predict)
+        return len(output.idx) != rows_number(output.predict)
 
     @staticmethod
     def find_main_output(outputs: List['OutputData']) -> 'OutputData':
@@ -16,6 +16,11 @@ class MultiModalData(dict):
         # Check if input data contains different targets
         self.contain_side_inputs = not all([value.supplementary_data.is_main_target for value in self.values()])
 
+    def view(self) -> 'MultiModalData':
+        """ Returns copy of the data with blocks that share numpy arrays with the original ones
+        (see :meth:`~fedot.core.data.data.Data.view`) """
+        return MultiModalData({data_source: input_data.view() for data_source, input_data in self.items()})
+
     @property
     def idx(self):
         for input_data in self.values():
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Callable, Union, Optional
 
 from fedot.core.data.data import InputData, OutputData
@@ -26,7 +25,7 @@ class AtomizedModel(Operation):
             is_fit_pipeline_stage: bool = True,
             use_cache: bool = True):
 
-        copied_input_data = deepcopy(data)
+        copied_input_data = data.view()
         copied_input_data = self.atomized_preprocessor.obligatory_prepare_for_fit(copied_input_data)
 
         predicted_train = self.pipeline.fit(input_data=copied_input_data)
@@ -38,7 +37,7 @@ class AtomizedModel(Operation):
                 params: Optional[Union[str, dict]] = None, output_mode: str = 'default'):
 
         # Preprocessing applied
-        copied_input_data = deepcopy(data)
+        copied_input_data = data.view()
         copied_input_data = self.atomized_preprocessor.obligatory_prepare_for_predict(copied_input_data)
 
         prediction = fitted_operation.predict(input_data=copied_input_data, output_mode=output_mode)
@@ -27,6 +27,7 @@ from sklearn.svm import LinearSVR as SklearnSVR
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 from xgboost import XGBClassifier, XGBRegressor
 
+from fedot.core.data.array_utilities import is_memory_mapped, row_chunks
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.log import Log, default_log
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -181,6 +182,9 @@ class SkLearnEvaluationStrategy(EvaluationStrategy):
             # Manually wrap the regressor into multi-output model
             operation_implementation = convert_to_multivariate_model(operation_implementation,
                                                                      train_data)
+        elif is_memory_mapped(train_data.features) and hasattr(operation_implementation, 'partial_fit') \
+                and not is_multi_target:
+            partial_fit_by_chunks(operation_implementation, train_data)
         else:
             operation_implementation.fit(train_data.features, train_data.target)
         return operation_implementation
@@ -235,6 +239,24 @@ class SkLearnEvaluationStrategy(EvaluationStrategy):
         return prediction
 
 
+def partial_fit_by_chunks(sklearn_model, train_data: InputData):
+    """
+    The function trains the model that supports incremental learning with one pass
+    over the chunks of rows of the memory-mapped features, so the features are not loaded at once
+
+    :param sklearn_model: Sklearn model with partial_fit method to train
+    :param train_data: data used for model training
+    """
+    fit_params = {}
+    if train_data.task.task_type == TaskTypesEnum.classification:
+        # All classes must be known since the first chunk
+        fit_params['classes'] = np.unique(train_data.target)
+    target = np.ravel(train_data.target)
+    for rows in row_chunks(len(train_data.features)):
+        sklearn_model.partial_fit(train_data.features[rows], target[rows], **fit_params)
+    return sklearn_model
+
+
 def convert_to_multivariate_model(sklearn_model, train_data: InputData):
     """
     The function returns an iterator for multiple target for those models for
@@ -4,6 +4,7 @@ from typing import Optional, Union
 import numpy as np
 from sklearn.preprocessing import OneHotEncoder, LabelEncoder
 
+from fedot.core.data.array_utilities import compact_table, hstack_features
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.data_preprocessing import find_categorical_columns
 from fedot.core.operations.evaluation.operation_implementations.implementation_interfaces import \
@@ -88,14 +89,15 @@ class OneHotEncodingImplementation(DataOperationImplementation):
 
     def _apply_one_hot_encoding(self, features: np.array):
         """
-        The method creates a table based on categorical and real features after One Hot Encoding transformation
+        The method creates a table based on categorical and real features after One Hot Encoding transformation.
+        Large encoded tables are kept as the sparse matrices (see :func:`compact_table`)
 
         :param features: tabular data for processing
         :return transformed_features: transformed features table
         """
 
         categorical_features = np.array(features[:, self.categorical_ids])
-        transformed_categorical = self.encoder.transform(categorical_features).toarray()
+        transformed_categorical = compact_table(self.encoder.transform(categorical_features))
 
         # If there are non-categorical features in the data
         if not self.non_categorical_ids:
@@ -104,7 +106,7 @@ class OneHotEncodingImplementation(DataOperationImplementation):
             # Stack transformed categorical and non-categorical data
             non_categorical_features = np.array(features[:, self.non_categorical_ids])
             frames = (non_categorical_features, transformed_categorical)
-            transformed_features = np.hstack(frames)
+            transformed_features = hstack_features(frames)
 
         return transformed_features
 
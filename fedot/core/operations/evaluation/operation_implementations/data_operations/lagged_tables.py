@@ -0,0 +1,166 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+
+def sliding_window_table(time_series: np.array, window_size: int) -> np.array:
+    """ Builds the table with the windows of consecutive elements of the time series in the rows
+    (from the oldest element to the newest one). The rows with the gaps (nan values) are removed.
+
+    The table is the read-only strided view of the time series without copying.
+    If the series has to be converted or the rows with gaps are removed, the table is materialized
+    and is cached (see :class:`LaggedTablesCache`), so the prefixes and extensions of the same series
+    do not build it from scratch.
+
+    :param time_series: one dimensional time series
+    :param window_size: number of elements in each window
+    :return: table with shape (len(time_series) - window_size + 1, window_size)
+    """
+    values = np.asarray(time_series)
+    if len(values) < window_size:
+        return np.empty((0, window_size), dtype=_table_dtype(values) if window_size > 1 else values.dtype)
+    if window_size > 1 and values.dtype.kind in 'iub':
+        # Integer series are converted into float as the incomplete windows were marked by nan values before
+        return lagged_tables_cache.get(values, window_size)
+    if values.dtype.kind in 'fc' and np.isnan(values).any():
+        return lagged_tables_cache.get(values, window_size)
+    return _windows_view(values, window_size)
+
+
+def _windows_view(values: np.array, window_size: int) -> np.array:
+    """ Returns the read-only strided view of the windows of the one dimensional array,
+    the array must have at least window_size elements """
+    stride = values.strides[0]
+    return as_strided(values, shape=(len(values) - window_size + 1, window_size), strides=(stride, stride),
+                      writeable=False)
+
+
+class LaggedTablesCache:
+    """
+    Cache of the materialized lagged tables of the time series.
+
+    Time series are identified by their memory (the same buffer, offset and strides), so the prefixes
+    of the series (e.g. the folds of the time series cross validation or the iterations of in-sample forecasting)
+    take the rows of the cached table and the longer series only append the rows for the new elements.
+    The elements of the series are compared with the cached ones, so the series changed in place are processed anew.
+
+    :param max_size: maximal size of the cached tables in bytes (the least recently used ones are removed)
+    """
+
+    def __init__(self, max_size: int = 256 * 2 ** 20):
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, values: np.array, window_size: int) -> np.array:
+        """ Returns the read-only lagged table of the series (see :func:`sliding_window_table`) """
+        key = _series_key(values, window_size)
+        with self._lock:
+            table = self._entries.get(key)
+            if table is not None and table.is_prefix_of(values):
+                table.extend(values)
+            elif table is None or not table.has_prefix(values):
+                table = _LaggedTable(values, window_size)
+                self._entries[key] = table
+            self._entries.move_to_end(key)
+            while self._entries and self.size > self.max_size:
+                self._entries.popitem(last=False)
+            return table.rows(len(values))
+
+    @property
+    def size(self) -> int:
+        """ Size of the cached tables in bytes """
+        return sum(table.size for table in self._entries.values())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class _LaggedTable:
+    """ Materialized lagged table of the time series that can be extended by the new elements of the series """
+
+    def __init__(self, values: np.array, window_size: int):
+        self.window_size = window_size
+        self.values = np.array([], dtype=_table_dtype(values))
+        # Number of the table rows for each length of the series prefix
+        self.rows_number = np.zeros(1, dtype=int)
+        self._table = np.empty((0, window_size), dtype=self.values.dtype)
+        self._size = 0
+        self.extend(values)
+
+    def is_prefix_of(self, values: np.array) -> bool:
+        return len(values) > len(self.values) and _is_equal(self.values, values[:len(self.values)])
+
+    def has_prefix(self, values: np.array) -> bool:
+        return len(values) <= len(self.values) and _is_equal(self.values[:len(values)], values)
+
+    def extend(self, values: np.array):
+        """ Appends the rows of the windows that end with the new elements of the series """
+        start = len(self.values)
+        self.values = np.concatenate((self.values, values[start:].astype(self.values.dtype)))
+
+        # Windows are built only for the new elements and the last elements required for them
+        first_element = max(start - self.window_size + 1, 0)
+        part = self.values[first_element:]
+        if len(part) < self.window_size:
+            self.rows_number = np.concatenate((self.rows_number, np.zeros(len(values) - start, dtype=int)))
+            return
+        windows = _windows_view(part, self.window_size)
+        is_complete = np.ones(len(windows), dtype=bool)
+        if self.values.dtype.kind in 'fc':
+            # Number of gaps in each window is obtained from the cumulative number of gaps
+            gaps_number = np.concatenate(([0], np.cumsum(np.isnan(part))))
+            is_complete = gaps_number[self.window_size:] == gaps_number[:-self.window_size]
+        self._append(windows[is_complete])
+
+        # The windows are finished with the elements starting from the (window_size - 1)
+        new_rows = np.zeros(len(values) - start, dtype=int)
+        new_rows[len(new_rows) - len(is_complete):] = is_complete
+        self.rows_number = np.concatenate((self.rows_number, self.rows_number[-1] + np.cumsum(new_rows)))
+
+    @property
+    def size(self) -> int:
+        return self._table.nbytes + self.values.nbytes + self.rows_number.nbytes
+
+    def rows(self, series_len: int) -> np.array:
+        """ Returns the read-only table for the prefix of the series with the length series_len """
+        table = self._table[:self.rows_number[series_len]]
+        table.flags.writeable = False
+        return table
+
+    def _append(self, rows: np.array):
+        required_size = self._size + len(rows)
+        if required_size > len(self._table):
+            # The capacity is doubled, so the series extended element by element are processed in linear time
+            table = np.empty((max(required_size, 2 * len(self._table)), self.window_size), dtype=self._table.dtype)
+            table[:self._size] = self._table[:self._size]
+            self._table = table
+        self._table[self._size:required_size] = rows
+        self._size = required_size
+
+
+def _series_key(values: np.array, window_size: int) -> Tuple:
+    root = values
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    offset = values.__array_interface__['data'][0] - root.__array_interface__['data'][0]
+    return id(root), offset, values.strides, values.dtype.str, window_size
+
+
+def _table_dtype(values: np.array) -> np.dtype:
+    return np.dtype(float) if values.dtype.kind in 'iub' else values.dtype
+
+
+def _is_equal(cached_values: np.array, values: np.array) -> bool:
+    return np.array_equal(cached_values, values, equal_nan=cached_values.dtype.kind in 'fc')
+
+
+# Tables of the time series shared by all lagged transformations of the process
+lagged_tables_cache = LaggedTablesCache()
@@ -6,8 +6,11 @@ import pandas as pd
 from scipy.ndimage import gaussian_filter
 from sklearn.decomposition import TruncatedSVD
 
+from fedot.core.data.array_utilities import as_slice
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.log import Log, default_log
+from fedot.core.operations.evaluation.operation_implementations.data_operations.lagged_tables import \
+    sliding_window_table
 from fedot.core.operations.evaluation.operation_implementations.implementation_interfaces import (
     DataOperationImplementation
 )
@@ -677,27 +680,12 @@ def ts_to_table(idx, time_series: np.array, window_size: int, is_lag=False):
     False needs to convert one dimensional output to lagged form.
 
     :return updated_idx: clipped indices of time series
-    :return features_columns: lagged time series feature table
+    :return features_columns: lagged time series feature table (read-only view of the time series or cached table)
     """
-    # Convert data to lagged form
-    lagged_dataframe = pd.DataFrame({'t_id': time_series})
-    vals = lagged_dataframe['t_id']
-    for i in range(1, window_size):
-        frames = [lagged_dataframe, vals.shift(i)]
-        lagged_dataframe = pd.concat(frames, axis=1)
-
-    # Remove incomplete rows
-    lagged_dataframe.dropna(inplace=True)
-
-    transformed = np.array(lagged_dataframe)
-
-    # Generate dataset with features
-    features_columns = np.fliplr(transformed)
+    features_columns = sliding_window_table(time_series, window_size)
 
     if is_lag:
-        updated_idx = list(idx[window_size:])
-        updated_idx.append(idx[-1])
-        updated_idx = np.array(updated_idx)
+        updated_idx = np.append(idx[window_size:], idx[-1])
     else:
         updated_idx = idx[:len(idx) - window_size + 1]
 
@@ -770,21 +758,14 @@ def prepare_target(all_idx, idx, features_columns: np.array, target, forecast_le
     idx = idx[: -1]
 
     # Update target (clip first "window size" values)
-    row_nums = [list(all_idx).index(i) for i in idx]
-    ts_target = target[row_nums]
+    row_nums = _first_positions(all_idx, idx)
+    # Consecutive rows are taken as the view, so the target table of the same series can be taken from cache
+    ts_target = target[as_slice(row_nums)]
 
     # Multi-target transformation
     if forecast_length > 1:
         # Target transformation
-        df = pd.DataFrame({'t_id': ts_target})
-        vals = df['t_id']
-        for i in range(1, forecast_length):
-            frames = [df, vals.shift(-i)]
-            df = pd.concat(frames, axis=1)
-
-        # Remove incomplete rows
-        df.dropna(inplace=True)
-        updated_target = np.array(df)
+        updated_target = sliding_window_table(ts_target, forecast_length)
 
         updated_idx = idx[: -forecast_length + 1]
         updated_features = features_columns[: -forecast_length]
@@ -797,6 +778,24 @@ def prepare_target(all_idx, idx, features_columns: np.array, target, forecast_le
     return updated_idx, updated_features, updated_target
 
 
+def _first_positions(all_idx, idx) -> np.array:
+    """ Returns the positions of the first occurrences of the indices idx in all_idx
+
+    :param all_idx: all indices in data
+    :param idx: indices to find
+    """
+    all_idx = np.asarray(all_idx)
+    idx = np.asarray(idx)
+    if len(idx) == 0:
+        return np.array([], dtype=int)
+    unique_idx, first_positions = np.unique(all_idx, return_index=True)
+    unique_positions = np.searchsorted(unique_idx, idx)
+    unique_positions[unique_positions == len(unique_idx)] = 0
+    if len(unique_idx) == 0 or not np.array_equal(unique_idx[unique_positions], idx):
+        raise ValueError('Indices are not found in the data')
+    return first_positions[unique_positions]
+
+
 def transform_features_and_target_into_lagged(input_data: InputData, forecast_length: int,
                                               window_size: int):
     """
@@ -3,6 +3,7 @@ from typing import Optional
 
 import numpy as np
 
+from fedot.core.data.array_utilities import is_memory_mapped, row_chunks
 from fedot.core.data.data import OutputData
 from fedot.core.log import Log, default_log
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -80,8 +81,13 @@ class EncodedInvariantImplementation(DataOperationImplementation):
         self.bool_ids = bool_ids
 
         if len(ids_to_process) > 0:
-            features_to_process = np.array(features[:, ids_to_process])
-            self.operation.fit(features_to_process)
+            if is_memory_mapped(features) and hasattr(self.operation, 'partial_fit'):
+                # Memory-mapped table is not loaded at once
+                for rows in row_chunks(len(features)):
+                    self.operation.partial_fit(np.array(features[rows, ids_to_process]))
+            else:
+                features_to_process = np.array(features[:, ids_to_process])
+                self.operation.fit(features_to_process)
         else:
             pass
 
@@ -115,6 +121,8 @@ class EncodedInvariantImplementation(DataOperationImplementation):
         :param features: tabular data for processing
         :return transformed_features: transformed features table
         """
+        if is_memory_mapped(features):
+            return self._make_new_table_by_chunks(features)
 
         features_to_process = np.array(features[:, self.ids_to_process])
         transformed_part = self.operation.transform(features_to_process)
@@ -130,6 +138,17 @@ class EncodedInvariantImplementation(DataOperationImplementation):
 
         return transformed_features
 
+    def _make_new_table_by_chunks(self, features):
+        """ Transforms the memory-mapped table by chunks of rows, so only the resulting table is loaded """
+        transformed_features = None
+        for rows in row_chunks(len(features)):
+            transformed_chunk = self._make_new_table(np.asarray(features[rows]))
+            if transformed_features is None:
+                transformed_features = np.empty((len(features), transformed_chunk.shape[1]),
+                                                dtype=transformed_chunk.dtype)
+            transformed_features[rows] = transformed_chunk
+        return transformed_features
+
     def get_params(self):
         return self.operation.get_params()
 
@@ -158,6 +177,9 @@ class EncodedInvariantImplementation(DataOperationImplementation):
         bool_ids = []
         non_bool_ids = []
 
+        if is_memory_mapped(features):
+            return EncodedInvariantImplementation._reasonability_check_by_chunks(features)
+
         # For every column in table make check
         for column_id in range(0, columns_amount):
             column = features[:, column_id] if columns_amount >= 1 else features
@@ -168,6 +190,21 @@ class EncodedInvariantImplementation(DataOperationImplementation):
 
         return bool_ids, non_bool_ids
 
+    @staticmethod
+    def _reasonability_check_by_chunks(features):
+        """ Finds boolean columns of the memory-mapped table reading it by chunks of rows
+        until all columns have more than two unique values """
+        columns_uniques = [set() for _ in range(features.shape[1])]
+        non_bool_mask = np.zeros(features.shape[1], dtype=bool)
+        for rows in row_chunks(len(features)):
+            chunk = np.asarray(features[rows])
+            for column_id in np.flatnonzero(~non_bool_mask):
+                columns_uniques[column_id].update(np.unique(chunk[:, column_id]))
+                non_bool_mask[column_id] = len(columns_uniques[column_id]) > 2
+            if non_bool_mask.all():
+                break
+        return list(np.flatnonzero(~non_bool_mask)), list(np.flatnonzero(non_bool_mask))
+
 
 class ModelImplementation(ABC):
     """ Interface for models realisations methods
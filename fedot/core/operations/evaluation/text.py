@@ -11,6 +11,7 @@ except ModuleNotFoundError:
     warn_requirement('gensim')
     Word2Vec = None
 
+from fedot.core.data.array_utilities import compact_table
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.operations.evaluation.evaluation_interfaces import EvaluationStrategy
 from fedot.core.operations.evaluation.operation_implementations.data_operations.text_preprocessing import (
@@ -49,7 +50,8 @@ class SkLearnTextVectorizeStrategy(EvaluationStrategy):
                 is_fit_pipeline_stage: bool) -> OutputData:
 
         features_list = self._convert_to_one_dim(predict_data.features)
-        predicted = trained_operation.transform(features_list).toarray()
+        # Large vectorized texts are kept as the sparse matrices
+        predicted = compact_table(trained_operation.transform(features_list))
 
         # Convert prediction to output (if it is required)
         converted = self._convert_to_output(predicted, predict_data)
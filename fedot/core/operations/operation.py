@@ -1,6 +1,8 @@
 from abc import abstractmethod
+from copy import copy
 from typing import Optional, Union
 
+from fedot.core.data.array_utilities import is_sparse
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.log import Log, default_log
 from fedot.core.operations.warnings_processor import suppress_stdout
@@ -75,6 +77,7 @@ class Operation:
         :return: tuple of trained operation and prediction on train data
         :param is_fit_pipeline_stage: is this fit or predict stage for pipeline
         """
+        data = self._densify_if_unsupported(data)
 
         self._init(data.task, params=params, n_samples_data=data.features.shape[0])
 
@@ -98,6 +101,7 @@ class Operation:
         :param output_mode: string with information about output of operation,
         for example, is the operation predict probabilities or class labels
         """
+        data = self._densify_if_unsupported(data)
         is_main_target = data.supplementary_data.is_main_target
         data_flow_length = data.supplementary_data.data_flow_length
         self._init(data.task, output_mode=output_mode, params=params)
@@ -115,6 +119,14 @@ class Operation:
         prediction.supplementary_data.was_preprocessed = True
         return prediction
 
+    def _densify_if_unsupported(self, data: InputData) -> InputData:
+        """ Returns the data with the dense features if the features are sparse
+        and the operation can't process them (it has no 'sparse_input' tag) """
+        if is_sparse(data.features) and 'sparse_input' not in (self.metadata.tags or []):
+            data = copy(data)
+            data.features = data.features.toarray()
+        return data
+
     @staticmethod
     @abstractmethod
     def assign_tabular_column_types(output_data: OutputData, output_mode: str) -> OutputData:
@@ -1,6 +1,6 @@
 from abc import abstractmethod
-from copy import deepcopy
-from typing import Any, Type, Generic, TypeVar, Optional, Dict
+from copy import copy, deepcopy
+from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar
 
 from fedot.core.dag.graph_node import GraphNode
 from fedot.core.log import default_log, Log
@@ -71,64 +71,58 @@ class DirectAdapter(BaseOptimizationAdapter[AdapteeType, AdapteeNodeType]):
 
 
 class PipelineAdapter(BaseOptimizationAdapter[Pipeline, Node]):
-    """ Optimization adapter for Pipeline class """
+    """
+    Optimization adapter for Pipeline class.
+
+    The conversion creates the new nodes of the target class linked in the same way as the source ones
+    (one pass over the nodes without the copy of the whole graph). Only the hyperparameters and the metadata
+    of the nodes are copied, the fitted operations and the data of the pipeline nodes are never transferred,
+    so the source graph stays unchanged after the modification or the fit of the converted one.
+    """
 
     def __init__(self, log: Optional[Log] = None):
         super().__init__(base_graph_class=Pipeline, base_node_class=Node, log=log)
 
-    def _transform_to_opt_node(self, node, *args, **params):
+    def _transform_to_opt_node(self, node: Node) -> OptNode:
         # Prepare content for nodes
         if type(node) == OptNode:
             self._log.warn('Unexpected: OptNode found in PipelineAdapter instead'
                            'PrimaryNode or SecondaryNode.')
-        else:
-            if type(node) == GraphNode:
-                self._log.warn('Unexpected: GraphNode found in PipelineAdapter instead'
-                               'PrimaryNode or SecondaryNode.')
-            else:
-                content = {'name': str(node.operation),
-                           'params': node.custom_params,
-                           'metadata': node.metadata}
-
-                node.__class__ = OptNode
-                node._fitted_operation = None
-                node._node_data = None
-                del node.metadata
-                node.content = content
-
-    def _transform_to_pipeline_node(self, node, *args, **params):
-        if node.nodes_from:
-            node.__class__ = params.get('secondary_class')
-        else:
-            node.__class__ = params.get('primary_class')
-        if not node.nodes_from:
-            node.__init__(operation_type=node.content['name'], content=node.content)
-        else:
-            node.__init__(nodes_from=node.nodes_from,
-                          operation_type=node.content['name'], content=node.content
-                          )
+            return _copy_node_content(node, OptNode(node.content['name'], log=node.log))
+        elif type(node) == GraphNode:
+            self._log.warn('Unexpected: GraphNode found in PipelineAdapter instead'
+                           'PrimaryNode or SecondaryNode.')
+            return _copy_node_content(node, GraphNode(node.content['name']))
+
+        opt_node = OptNode(str(node.operation), log=node.log)
+        opt_node.content = {'name': str(node.operation),
+                            'params': deepcopy(node.custom_params),
+                            'metadata': copy(node.metadata)}
+        opt_node.uid = node.uid
+        return opt_node
+
+    @staticmethod
+    def _transform_to_pipeline_node(node: OptNode) -> Node:
+        content = dict(node.content)
+        content['params'] = deepcopy(content['params'])
+        if not isinstance(content['name'], str):
+            content['name'] = deepcopy(content['name'])
+        if 'metadata' in content:
+            content['metadata'] = copy(content['metadata'])
+        node_class = SecondaryNode if node.nodes_from else PrimaryNode
+        return node_class(operation_type=content['name'], content=content, log=node.log)
 
     def _adapt(self, adaptee: Pipeline) -> OptGraph:
         """ Convert Pipeline class into OptGraph class """
-        source_pipeline = deepcopy(adaptee)
-
-        # Apply recursive transformation since root
-        for node in source_pipeline.nodes:
-            _transform_node(node=node, primary_class=OptNode,
-                            transform_func=self._transform_to_opt_node)
-        graph = OptGraph(source_pipeline.nodes)
+        graph = OptGraph()
+        graph.nodes = _map_graph_nodes(adaptee.nodes, self._transform_to_opt_node)
         return graph
 
     def _restore(self, opt_graph: OptGraph, metadata: Optional[Dict[str, Any]] = None) -> Pipeline:
         """ Convert OptGraph class into Pipeline class """
         metadata = metadata or {}
-        source_graph = deepcopy(opt_graph)
-
-        # Inverse transformation since root node
-        for node in source_graph.nodes:
-            _transform_node(node=node, primary_class=PrimaryNode, secondary_class=SecondaryNode,
-                            transform_func=self._transform_to_pipeline_node)
-        pipeline = Pipeline(source_graph.nodes)
+        pipeline = Pipeline()
+        pipeline.nodes = _map_graph_nodes(opt_graph.nodes, self._transform_to_pipeline_node)
         pipeline.computation_time = metadata.get('computation_time_in_seconds')
         return pipeline
 
@@ -147,10 +141,47 @@ def _check_nodes_references_correct(graph):
                     raise ValueError('Parent node not in graph nodes list')
 
 
-def _transform_node(node, primary_class, secondary_class=None, transform_func=None):
-    if transform_func:
-        if not secondary_class:
-            secondary_class = primary_class  # if there are no differences between primary and secondary class
-        transform_func(node=node,
-                       primary_class=primary_class,
-                       secondary_class=secondary_class)
+def _map_graph_nodes(nodes: List[Any], transform: Callable[[Any], Any]) -> List[Any]:
+    """
+    Creates the nodes of the other class for the nodes of the graph and links them in the same way
+
+    :param nodes: nodes of the source graph
+    :param transform: function that creates the new node (without parents) for the source one
+    :return: new nodes in the order of the source nodes,
+    the parents missed in the source list are appended to the end (as the graph does on adding the node)
+    """
+    new_nodes = {}
+    ordered_nodes = []
+
+    def new_node_for(source_node):
+        new_node = new_nodes.get(id(source_node))
+        if new_node is None:
+            new_node = transform(source_node)
+            new_nodes[id(source_node)] = new_node
+            ordered_nodes.append(new_node)
+        return new_node
+
+    for node in nodes:
+        new_node_for(node)
+    for node in list(nodes) + _missed_parents(nodes):
+        if node.nodes_from:
+            new_node_for(node).nodes_from = [new_node_for(parent) for parent in node.nodes_from]
+    return ordered_nodes
+
+
+def _missed_parents(nodes: List[Any]) -> List[Any]:
+    nodes_ids = {id(node) for node in nodes}
+    missed = []
+    stack = list(nodes)
+    while stack:
+        for parent in stack.pop().nodes_from or ():
+            if id(parent) not in nodes_ids:
+                nodes_ids.add(id(parent))
+                missed.append(parent)
+                stack.append(parent)
+    return missed
+
+
+def _copy_node_content(source_node, node):
+    node.content = deepcopy(source_node.content)
+    return node
@@ -1,2 +1,3 @@
 from .generation_keeper import GenerationKeeper
 from .individuals_containers import HallOfFame, ParetoFront
+from .fitness_archive import FitnessArchive, canonical_graph_hash
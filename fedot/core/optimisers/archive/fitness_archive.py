@@ -0,0 +1,56 @@
+import hashlib
+from copy import deepcopy
+from typing import Any, Dict, Optional
+
+from fedot.core.optimisers.fitness import Fitness
+from fedot.core.utilities.data_structures import ensure_wrapped_in_sequence
+
+
+class FitnessArchive:
+    """
+    Persistent archive of the already evaluated fitness values for the whole optimisation run.
+    Graphs are identified by the canonical structural hash (see `canonical_graph_hash`),
+    so the graph that was rediscovered by mutation or crossover is not evaluated again.
+    Only valid fitness values are stored.
+    """
+
+    def __init__(self):
+        self._fitness_by_key: Dict[str, Fitness] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, graph: Any) -> Optional[Fitness]:
+        """ Returns copy of the archived fitness of the graph (or None) and updates hit/miss counters """
+        fitness = self._fitness_by_key.get(canonical_graph_hash(graph))
+        if fitness is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return deepcopy(fitness)
+
+    def add(self, graph: Any, fitness: Fitness):
+        if fitness.valid:
+            self._fitness_by_key[canonical_graph_hash(graph)] = deepcopy(fitness)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self)}
+
+    def __contains__(self, graph: Any) -> bool:
+        return canonical_graph_hash(graph) in self._fitness_by_key
+
+    def __len__(self) -> int:
+        return len(self._fitness_by_key)
+
+
+def canonical_graph_hash(graph: Any) -> str:
+    """
+    Calculates hash of the graph structure that takes into account operations, their parameters and edges,
+    but does not depend on the order of the nodes and their uids
+
+    :param graph: graph with 'nodes' and 'root_node' attributes (e.g. OptGraph or Pipeline)
+    :return: hex digest of the structural hash
+    """
+    roots = ensure_wrapped_in_sequence(graph.root_node) if graph.nodes else []
+    roots_hashes = sorted(root.structural_hash for root in roots)
+    return hashlib.sha1(';'.join(roots_hashes).encode()).hexdigest()
@@ -4,7 +4,11 @@ from bisect import bisect_right
 from operator import eq
 from typing import Callable, Optional
 
+import numpy as np
+
+from fedot.core.optimisers.fitness.multi_objective_fitness import MultiObjFitness
 from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.gp_comp.operators.multi_objective import pareto_dominance
 from fedot.core.optimisers.gp_comp.operators.operator import PopulationT
 
 
@@ -133,6 +137,8 @@ class ParetoFront(HallOfFame):
 
     def __init__(self, similar: Callable = eq):
         HallOfFame.__init__(self, None, similar)
+        # Fitness values of the members in the order of items (built lazily and updated with the items)
+        self._values: Optional[np.array] = None
 
     def update(self, population: PopulationT):
         """
@@ -141,26 +147,91 @@ class ParetoFront(HallOfFame):
         of fame. If any individual in the hall of fame is dominated it is
         removed.
 
+        Individuals with the valid multi-objective fitness are compared with
+        the whole front at once by the matrix of the front fitness values.
+
         :param population: A list of individual with a fitness attribute to
                            update the hall of fame with.
         """
         for ind in population:
-            is_dominated = False
-            dominates_one = False
-            has_twin = False
-            to_remove = []
-            for i, hof_member in enumerate(self):  # hall of fame member
-                if not dominates_one and hof_member.fitness.dominates(ind.fitness):
-                    is_dominated = True
-                    break
-                elif ind.fitness.dominates(hof_member.fitness):
-                    dominates_one = True
-                    to_remove.append(i)
-                elif ind.fitness == hof_member.fitness and self.similar(ind, hof_member):
-                    has_twin = True
-                    break
-
-            for i in reversed(to_remove):  # Remove the dominated hofer
-                self.remove(i)
-            if not is_dominated and not has_twin:
-                self.insert(ind)
+            front_values = self._front_values()
+            if front_values is not None and _is_pareto_comparable(ind):
+                self._update_by_front_values(ind, front_values)
+            else:
+                self._update_by_comparisons(ind)
+
+    def insert(self, item: Individual):
+        # The same position as the one of the item inserted by the hall of fame
+        index = len(self) - bisect_right(self.keys, item.fitness)
+        super().insert(item)
+        if self._values is None:
+            return
+        values = np.array([item.fitness.values], dtype=float) if _is_pareto_comparable(item) else None
+        if values is None or (len(self._values) > 0 and values.shape[1] != self._values.shape[1]):
+            self._values = None
+        elif len(self._values) == 0:
+            self._values = values
+        else:
+            self._values = np.insert(self._values, index, values[0], axis=0)
+
+    def remove(self, index: int):
+        super().remove(index)
+        if self._values is not None:
+            self._values = np.delete(self._values, index, axis=0)
+
+    def clear(self):
+        super().clear()
+        self._values = None
+
+    def _front_values(self) -> Optional[np.array]:
+        """ Returns the matrix of the fitness values of the front members
+        or None if they can not be compared as a matrix """
+        if self._values is None and all(_is_pareto_comparable(hof_member) for hof_member in self):
+            self._values = np.array([hof_member.fitness.values for hof_member in self], dtype=float)
+        return self._values
+
+    def _update_by_front_values(self, ind: Individual, front_values: np.array):
+        if len(front_values) == 0:
+            self.insert(ind)
+            return
+        ind_values = np.array([ind.fitness.values], dtype=float)
+        if front_values.shape[1] != ind_values.shape[1]:
+            self._update_by_comparisons(ind)
+            return
+        if pareto_dominance(front_values, ind_values).any():
+            # Individual is dominated by some member of the front
+            return
+
+        equal_ids = np.flatnonzero(np.all(np.isclose(ind_values, front_values, rtol=1e-8, atol=1e-10), axis=1))
+        has_twin = any(self.similar(ind, self[i]) for i in equal_ids)
+
+        dominated_ids = np.flatnonzero(pareto_dominance(ind_values, front_values)[0])
+        for i in reversed(dominated_ids):  # Remove the dominated hofer
+            self.remove(i)
+        if not has_twin:
+            self.insert(ind)
+
+    def _update_by_comparisons(self, ind: Individual):
+        is_dominated = False
+        dominates_one = False
+        has_twin = False
+        to_remove = []
+        for i, hof_member in enumerate(self):  # hall of fame member
+            if not dominates_one and hof_member.fitness.dominates(ind.fitness):
+                is_dominated = True
+                break
+            elif ind.fitness.dominates(hof_member.fitness):
+                dominates_one = True
+                to_remove.append(i)
+            elif ind.fitness == hof_member.fitness and self.similar(ind, hof_member):
+                has_twin = True
+                break
+
+        for i in reversed(to_remove):  # Remove the dominated hofer
+            self.remove(i)
+        if not is_dominated and not has_twin:
+            self.insert(ind)
+
+
+def _is_pareto_comparable(ind: Individual) -> bool:
+    return isinstance(ind.fitness, MultiObjFitness) and ind.fitness.valid
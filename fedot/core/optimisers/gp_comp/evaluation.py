@@ -1,22 +1,34 @@
 import gc
-import multiprocessing
+import math
 import timeit
+import weakref
 from abc import ABC, abstractmethod
-from contextlib import closing
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
+from numbers import Real
+from queue import Empty, Queue
 from random import choice
-
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
 
 from fedot.core.dag.graph import Graph
 from fedot.core.log import Log, default_log
 from fedot.core.optimisers.adapters import BaseOptimizationAdapter
+from fedot.core.optimisers.archive import FitnessArchive, canonical_graph_hash
 from fedot.core.optimisers.gp_comp.individual import Individual
 from fedot.core.optimisers.gp_comp.operators.operator import EvaluationOperator, PopulationT
 from fedot.core.optimisers.graph import OptGraph
 from fedot.core.optimisers.objective import GraphFunction, ObjectiveFunction
+from fedot.core.optimisers.objective.objective_eval import ObjectiveEvaluate
 from fedot.core.optimisers.timer import Timer, get_forever_timer
+from fedot.core.utilities.shared_memory import SharedMemoryPublisher, load_published
+from fedot.core.utilities.worker_pool import WorkerPool, determine_n_jobs
 from fedot.remote.remote_evaluator import RemoteEvaluator
 
+# Key of the individual metadata with the fraction of the data folds its fitness is evaluated on
+FITNESS_BUDGET_KEY = 'fitness_budget'
+
 
 class ObjectiveEvaluationDispatcher(ABC):
     """Builder for evaluation operator.
@@ -41,11 +53,32 @@ class MultiprocessingDispatcher(ObjectiveEvaluationDispatcher):
     and optionally model evaluation cache with RemoteEvaluator.
 
     Usage: call `dispatch(objective_function)` to get evaluation function.
+    Individuals can be also evaluated asynchronously: `submit` starts the evaluation without waiting for it
+    and `next_evaluated` returns the results in the order of their completion.
+
+    If there are more jobs than individuals to evaluate and the objective is evaluated on several data folds
+    (see :meth:`ObjectiveEvaluate.evaluate_fold`), the pairs (individual, fold) are evaluated by the workers
+    separately and the fold metrics are reduced to the fitness of each individual. The folds of the individual
+    are not evaluated anymore after its first failed fold.
+
+    If racing_reduction_factor is set, the individuals are raced on the growing number of folds
+    by the successive halving: only the best ones are evaluated on all folds,
+    the others keep the fitness on the partial budget (see :meth:`_evaluate_by_racing`).
+    Such fitness is not stored in the fitness archive.
+
+    The pool of worker processes is created on the first evaluation and is reused for all next ones
+    until `shutdown` is called. The pool may be shared with the other stages of composing (see `set_worker_pool`),
+    then it is stopped by its owner. The state of the dispatcher with the objective (and the data it holds)
+    is published to the workers once per `dispatch`: its numpy arrays are placed into shared memory,
+    so the workers get zero-copy read-only views of the data instead of their own copies.
 
     :param graph_adapter: adapter for mapping between OptGraph and Graph.
     :param log: logger to use
     :param n_jobs: number of jobs for multiprocessing or 1 for no multiprocessing.
     :param graph_cleanup_fn: function to call after graph evaluation, primarily for memory cleanup.
+    :param fitness_archive: archive of fitness values of already evaluated graphs (None to evaluate all graphs).
+    :param racing_reduction_factor: ratio of the individuals evaluated on the fewer folds to the promoted ones
+        in the successive halving (None to evaluate all individuals on all folds).
     """
 
     def __init__(self,
@@ -53,43 +86,211 @@ class MultiprocessingDispatcher(ObjectiveEvaluationDispatcher):
                  timer: Timer = None,
                  log: Log = None,
                  n_jobs: int = 1,
-                 graph_cleanup_fn: Optional[GraphFunction] = None):
+                 graph_cleanup_fn: Optional[GraphFunction] = None,
+                 fitness_archive: Optional[FitnessArchive] = None,
+                 racing_reduction_factor: Optional[int] = None):
+        if racing_reduction_factor is not None and racing_reduction_factor < 2:
+            raise ValueError(f'Racing reduction factor should be at least 2, got {racing_reduction_factor}')
         self._objective_eval = None
         self._graph_adapter = graph_adapter
         self._cleanup = graph_cleanup_fn
         self._post_eval_callback = None
+        self.fitness_archive = fitness_archive
+        self._racing_reduction_factor = racing_reduction_factor
 
         self.timer = timer or get_forever_timer()
         self.logger = log or default_log(self.__class__.__name__)
         self._n_jobs = n_jobs
         self._reset_eval_cache()
 
+        self._worker_pool = WorkerPool(n_jobs, log=self.logger)
+        self._owns_worker_pool = True
+        self._publisher: Optional[SharedMemoryPublisher] = None
+        self._publisher_finalizer: Optional[weakref.finalize] = None
+        # (key, serialized state) of the dispatcher published to the workers
+        self._published_state: Optional[Tuple[str, bytes]] = None
+
+        # Results of the asynchronous evaluations: (submitted individual, evaluated individual or None)
+        self._evaluated: Queue = Queue()
+        self._n_in_flight = 0
+
     def dispatch(self, objective: ObjectiveFunction) -> EvaluationOperator:
         """Return handler to this object that hides all details
         and allows only to evaluate population with provided objective."""
         self._objective_eval = objective
+        self._reset_published_state()
         return self.evaluate_with_cache
 
     def set_evaluation_callback(self, callback: Optional[GraphFunction]):
         self._post_eval_callback = callback
+        self._reset_published_state()
+
+    def set_worker_pool(self, worker_pool: Optional[WorkerPool]):
+        """Set the external pool of worker processes (its owner is responsible for its shutdown)
+        or reset (with None) to the own pool of the dispatcher."""
+        self.shutdown()
+        if worker_pool is None:
+            self._worker_pool = WorkerPool(self._n_jobs, log=self.logger)
+            self._owns_worker_pool = True
+        else:
+            self._worker_pool = worker_pool
+            self._owns_worker_pool = False
+
+    def __getstate__(self):
+        # Archive, pool and shared memory are used only in the main process,
+        # so they are not transferred to the workers
+        state = self.__dict__.copy()
+        state['fitness_archive'] = None
+        state['_worker_pool'] = None
+        state['_publisher'] = None
+        state['_publisher_finalizer'] = None
+        state['_published_state'] = None
+        state['_evaluated'] = None
+        state['evaluation_cache'] = {}
+        return state
+
+    def shutdown(self):
+        """ Stops the own worker processes and releases the shared memory """
+        if self._owns_worker_pool:
+            self._worker_pool.shutdown()
+        self._reset_published_state()
 
     def evaluate_with_cache(self, population: PopulationT) -> PopulationT:
         reversed_population = list(reversed(population))
-        self._remote_compute_cache(reversed_population)
-        evaluated_population = self.evaluate_population(reversed_population)
-        self._reset_eval_cache()
+        archived_population, population_to_evaluate, duplicates = self._split_by_archive(reversed_population)
+
+        evaluated_population = []
+        if population_to_evaluate:
+            self._remote_compute_cache(population_to_evaluate)
+            evaluated_population = self.evaluate_population(population_to_evaluate)
+            self._reset_eval_cache()
+            self._update_archive(evaluated_population, duplicates)
+
+        evaluated_population = archived_population + evaluated_population + \
+            [duplicate for duplicate in duplicates if duplicate.fitness.valid]
         if not evaluated_population and reversed_population:
             raise AttributeError('Too many fitness evaluation errors. Composing stopped.')
         return evaluated_population
 
+    @property
+    def n_in_flight(self) -> int:
+        """ Number of the submitted individuals which results are not obtained yet with `next_evaluated` """
+        return self._n_in_flight
+
+    def submit(self, ind: Individual):
+        """ Starts the evaluation of the individual without waiting for its result (see `next_evaluated`).
+        The individuals are evaluated by the worker processes, so several evaluations are performed at once.
+        The fitness of the already evaluated graphs is taken from the archive. """
+        self._n_in_flight += 1
+        fitness = self.fitness_archive.get(ind.graph) if self.fitness_archive is not None else None
+        if fitness is not None:
+            ind.fitness = fitness
+            ind.metadata['fitness_from_archive'] = True
+            self._evaluated.put((ind, ind))
+            return
+
+        n_jobs = determine_n_jobs(self._n_jobs)
+        if n_jobs == 1:
+            self._evaluated.put((ind, self.evaluate_single(ind)))
+        else:
+            pool = self._worker_pool.get(n_jobs)
+            key, state = self._get_published_state()
+            pool.apply_async(_evaluate_in_worker, ((key, state, ind, None),),
+                             callback=partial(self._put_evaluated, self._evaluated, ind),
+                             error_callback=partial(self._put_failed, self._evaluated, ind))
+
+    def next_evaluated(self, timeout: Optional[float] = None) -> Tuple[Individual, Optional[Individual]]:
+        """ Waits for the next completed evaluation of the submitted individuals
+
+        :param timeout: seconds to wait for the evaluation (waits infinitely if None)
+        :return: submitted individual and the evaluated one (None if the evaluation is failed)
+        :raises TimeoutError: if no evaluation is completed in time (see `cancel_in_flight`)
+        """
+        if self._n_in_flight == 0:
+            raise ValueError('There are no submitted individuals to wait for')
+        try:
+            submitted, evaluated = self._evaluated.get(timeout=timeout)
+        except Empty:
+            raise TimeoutError(f'No evaluation of {self._n_in_flight} submitted individuals '
+                               f'is completed in {timeout} seconds')
+        self._n_in_flight -= 1
+        if evaluated is not None and self.fitness_archive is not None and \
+                not evaluated.metadata.get('fitness_from_archive'):
+            self.fitness_archive.add(evaluated.graph, evaluated.fitness)
+        return submitted, evaluated
+
+    def cancel_in_flight(self) -> int:
+        """ Gives up waiting for the submitted individuals (e.g. their worker is killed),
+        so their evaluations are considered failed and their late results are ignored
+
+        :return: number of the cancelled evaluations
+        """
+        cancelled_num = self._n_in_flight
+        self._n_in_flight = 0
+        # Late results are put to the queue of the cancelled evaluations
+        self._evaluated = Queue()
+        return cancelled_num
+
+    @staticmethod
+    def _put_evaluated(results: Queue, submitted: Individual, evaluated: Optional[Individual]):
+        results.put((submitted, evaluated))
+
+    def _put_failed(self, results: Queue, submitted: Individual, error: BaseException):
+        self.logger.warn(f'Evaluation of individual {submitted.uid} is failed: {error}')
+        results.put((submitted, None))
+
+    def _split_by_archive(self, population: PopulationT) -> Tuple[PopulationT, PopulationT, PopulationT]:
+        """ Splits population into the individuals with archived fitness, the individuals to evaluate
+        and the duplicates of the individuals to evaluate (they will get the fitness of the original) """
+        if self.fitness_archive is None:
+            return [], population, []
+
+        archived, to_evaluate, duplicates = [], [], []
+        keys_to_evaluate = set()
+        for ind in population:
+            key = canonical_graph_hash(ind.graph)
+            if key in keys_to_evaluate:
+                duplicates.append(ind)
+                continue
+            fitness = self.fitness_archive.get(ind.graph)
+            if fitness is not None:
+                ind.fitness = fitness
+                ind.metadata['fitness_from_archive'] = True
+                archived.append(ind)
+            else:
+                keys_to_evaluate.add(key)
+                to_evaluate.append(ind)
+        if archived or duplicates:
+            self.logger.debug(f'Fitness of {len(archived)} individuals is taken from archive, '
+                              f'{len(duplicates)} duplicates are found in population')
+        return archived, to_evaluate, duplicates
+
+    def _update_archive(self, evaluated_population: PopulationT, duplicates: PopulationT):
+        if self.fitness_archive is None:
+            return
+        for ind in evaluated_population:
+            if FITNESS_BUDGET_KEY not in ind.metadata:
+                self.fitness_archive.add(ind.graph, ind.fitness)
+        for duplicate in duplicates:
+            fitness = self.fitness_archive.get(duplicate.graph)
+            if fitness is not None:
+                duplicate.fitness = fitness
+                duplicate.metadata['fitness_from_archive'] = True
+
     def evaluate_population(self, individuals: PopulationT) -> PopulationT:
         n_jobs = determine_n_jobs(self._n_jobs, self.logger)
 
-        if n_jobs == 1:
+        if self._racing_reduction_factor and self._objective_folds_number() > 1:
+            mapped_evals = self._evaluate_by_racing(individuals, n_jobs)
+        elif n_jobs == 1:
             mapped_evals = map(self.evaluate_single, individuals)
+        elif n_jobs > len(individuals) and self._objective_folds_number() > 1:
+            mapped_evals = self._evaluate_by_folds(individuals, n_jobs)
         else:
-            with closing(multiprocessing.Pool(n_jobs)) as pool:
-                mapped_evals = list(pool.imap_unordered(self.evaluate_single, individuals))
+            pool = self._worker_pool.get(n_jobs)
+            key, state = self._get_published_state()
+            tasks = [(key, state, ind, self.evaluation_cache.get(ind.uid)) for ind in individuals]
+            mapped_evals = list(pool.imap_unordered(_evaluate_in_worker, tasks))
 
         # If there were no successful evals then try once again getting at least one,
         #  even if time limit was reached
@@ -101,6 +302,180 @@ class MultiprocessingDispatcher(ObjectiveEvaluationDispatcher):
 
         return successful_evals
 
+    def _objective_folds_number(self) -> int:
+        """ Returns the number of folds the objective can be evaluated on separately (0 if it can not) """
+        if self.evaluation_cache or not isinstance(self._objective_eval, ObjectiveEvaluate):
+            return 0
+        return self._objective_eval.folds_number() or 0
+
+    def _evaluate_by_folds(self, individuals: PopulationT, n_jobs: int) -> List[Optional[Individual]]:
+        """ Evaluates the folds of the individuals separately and reduces them to the fitness """
+        folds_number = self._objective_eval.folds_number()
+        evaluations = [_FoldsEvaluation() for _ in individuals]
+        # The first folds of all individuals go first to reveal the failed individuals as soon as possible
+        self._run_folds(individuals, evaluations,
+                        [(ind_id, fold_id) for fold_id in range(folds_number) for ind_id in range(len(individuals))],
+                        n_jobs)
+        return [self._reduce_folds(ind, evaluation, folds_number)
+                for ind, evaluation in zip(individuals, evaluations)]
+
+    def _evaluate_by_racing(self, individuals: PopulationT, n_jobs: int) -> List[Optional[Individual]]:
+        """
+        Evaluates the individuals by the successive halving over the data folds: all individuals are evaluated
+        on the smallest number of folds, only the best part of them (1 / racing_reduction_factor) is promoted
+        to the next number of folds and so on till all folds (see :func:`racing_budgets`).
+
+        The individuals that are not promoted keep the fitness on the partial budget. It is marked in their metadata
+        with 'fitness_budget' - the fraction of the evaluated folds. The partially evaluated individuals
+        that are not dominated by the fully evaluated ones are evaluated on all folds too,
+        so the best individuals always have the fitness on all folds.
+        """
+        folds_number = self._objective_eval.folds_number()
+        evaluations = [_FoldsEvaluation() for _ in individuals]
+        candidates = list(range(len(individuals)))
+        evaluated_folds = 0
+        for budget in racing_budgets(folds_number, self._racing_reduction_factor):
+            if evaluated_folds > 0:
+                candidates = self._promoted_by_racing(evaluations, candidates)
+            self._run_folds(individuals, evaluations,
+                            [(ind_id, fold_id) for fold_id in range(evaluated_folds, budget) for ind_id in candidates],
+                            n_jobs)
+            evaluated_folds = budget
+
+        evaluated_population = [self._reduce_folds(ind, evaluation, folds_number, allow_partial=True)
+                                for ind, evaluation in zip(individuals, evaluations)]
+
+        fully_evaluated = [ind.fitness for ind in evaluated_population
+                           if ind is not None and FITNESS_BUDGET_KEY not in ind.metadata]
+        to_confirm = [ind_id for ind_id, ind in enumerate(evaluated_population)
+                      if ind is not None and FITNESS_BUDGET_KEY in ind.metadata and
+                      not any(fitness.dominates(ind.fitness) for fitness in fully_evaluated)]
+        if to_confirm:
+            self._run_folds(individuals, evaluations,
+                            [(ind_id, fold_id) for fold_id in range(folds_number) for ind_id in to_confirm
+                             if fold_id not in evaluations[ind_id].metrics],
+                            n_jobs)
+            for ind_id in to_confirm:
+                evaluated_population[ind_id] = self._reduce_folds(individuals[ind_id], evaluations[ind_id],
+                                                                  folds_number, allow_partial=True)
+        return evaluated_population
+
+    def _promoted_by_racing(self, evaluations: List['_FoldsEvaluation'], candidates: List[int]) -> List[int]:
+        """ Returns the best part of the candidates by the fitness on the evaluated folds """
+        scored_candidates = []
+        for ind_id in candidates:
+            evaluation = evaluations[ind_id]
+            if evaluation.is_failed or not evaluation.evaluated_folds:
+                continue
+            fitness = self._objective_eval.reduce_folds(evaluation.folds_metrics())
+            if fitness.valid:
+                scored_candidates.append((fitness, ind_id))
+        promoted_number = math.ceil(len(scored_candidates) / self._racing_reduction_factor)
+        scored_candidates.sort(key=lambda scored: scored[0], reverse=True)
+        return sorted(ind_id for _, ind_id in scored_candidates[:promoted_number])
+
+    def _reduce_folds(self, ind: Individual, evaluation: '_FoldsEvaluation', folds_number: int,
+                      allow_partial: bool = False) -> Optional[Individual]:
+        """ Sets the fitness of the individual reduced from its folds metrics
+
+        :param allow_partial: if False, the individual that is not evaluated on all folds is treated as failed
+        """
+        evaluated_folds = evaluation.evaluated_folds
+        if evaluation.is_failed or not evaluated_folds or (evaluated_folds < folds_number and not allow_partial):
+            # The individual is failed or is not evaluated in time
+            return None
+        ind.fitness = self._objective_eval.reduce_folds(evaluation.folds_metrics())
+        if evaluation.graph is not None:
+            ind.graph = evaluation.graph
+        ind.metadata['computation_time_in_seconds'] = evaluation.computation_time
+        if evaluated_folds < folds_number:
+            ind.metadata[FITNESS_BUDGET_KEY] = evaluated_folds / folds_number
+        else:
+            ind.metadata.pop(FITNESS_BUDGET_KEY, None)
+        return ind if ind.fitness.valid else None
+
+    def _run_folds(self, individuals: PopulationT, evaluations: List['_FoldsEvaluation'],
+                   tasks: Sequence[Tuple[int, int]], n_jobs: int):
+        """ Evaluates the pairs (index of individual, fold) in the given order and stores the results
+        into the evaluations of the individuals. The tasks are submitted to the workers one by one
+        to skip the folds of the failed individuals """
+        last_folds = {}
+        for ind_id, fold_id in tasks:
+            last_folds[ind_id] = max(fold_id, last_folds.get(ind_id, fold_id))
+        pending = deque(tasks)
+
+        def next_task() -> Optional[Tuple[int, int]]:
+            while pending and not self.timer.is_time_limit_reached():
+                ind_id, fold_id = pending.popleft()
+                if not evaluations[ind_id].is_failed:
+                    return ind_id, fold_id
+            return None
+
+        if n_jobs == 1:
+            task = next_task()
+            while task is not None:
+                ind_id, fold_id = task
+                evaluations[ind_id].add(fold_id, *self.evaluate_fold(individuals[ind_id], fold_id,
+                                                                     fold_id == last_folds[ind_id]))
+                task = next_task()
+            return
+
+        pool = self._worker_pool.get(n_jobs)
+        key, state = self._get_published_state()
+        results = Queue()
+
+        def submit_next_task() -> bool:
+            task = next_task()
+            if task is None:
+                return False
+            ind_id, fold_id = task
+            pool.apply_async(_evaluate_fold_in_worker,
+                             ((key, state, individuals[ind_id], fold_id, fold_id == last_folds[ind_id]),),
+                             callback=partial(put_result, ind_id, fold_id),
+                             error_callback=partial(put_failed, ind_id, fold_id))
+            return True
+
+        def put_result(ind_id: int, fold_id: int, result: Tuple):
+            results.put((ind_id, fold_id, result))
+
+        def put_failed(ind_id: int, fold_id: int, error: BaseException):
+            self.logger.warn(f'Evaluation of individual {individuals[ind_id].uid} on fold {fold_id} is failed: {error}')
+            results.put((ind_id, fold_id, (None, None, 0.)))
+
+        in_flight = sum(submit_next_task() for _ in range(n_jobs))
+        while in_flight:
+            ind_id, fold_id, result = results.get()
+            evaluations[ind_id].add(fold_id, *result)
+            in_flight += submit_next_task() - 1
+
+    def evaluate_fold(self, ind: Individual, fold_id: int,
+                      is_last_fold: bool) -> Tuple[Optional[Sequence[Real]], Optional[OptGraph], float]:
+        """ Evaluates the individual on the single fold (see :meth:`ObjectiveEvaluate.evaluate_fold`)
+
+        :param ind: individual to evaluate
+        :param fold_id: index of the fold
+        :param is_last_fold: if True, the evaluated graph is returned (with the intermediate metrics if required)
+        :return: metric values on the fold (None if the evaluation is failed), evaluated graph and computation time
+        """
+        start_time = timeit.default_timer()
+
+        graph = ind.graph
+        _restrict_n_jobs_in_nodes(graph)
+        adapted_graph = self._graph_adapter.restore(graph)
+
+        fold_metrics = self._objective_eval.evaluate_fold(adapted_graph, fold_id)
+
+        evaluated_graph = None
+        if fold_metrics is not None and is_last_fold:
+            if self._post_eval_callback:
+                self._post_eval_callback(adapted_graph)
+            evaluated_graph = self._graph_adapter.adapt(adapted_graph)
+        if self._cleanup:
+            self._cleanup(adapted_graph)
+        gc.collect()
+
+        return fold_metrics, evaluated_graph, timeit.default_timer() - start_time
+
     def evaluate_single(self, ind: Individual, with_time_limit=True) -> Optional[Individual]:
         if with_time_limit and self.timer.is_time_limit_reached():
             return None
@@ -124,6 +499,25 @@ class MultiprocessingDispatcher(ObjectiveEvaluationDispatcher):
         ind.metadata['computation_time_in_seconds'] = end_time - start_time
         return ind if ind.fitness.valid else None
 
+    def _get_published_state(self) -> Tuple[str, bytes]:
+        """ Publishes the state of the dispatcher (with the data of the objective) to the shared memory.
+        It is done on the first evaluation after dispatch, because the timer is started only before it """
+        if self._published_state is None:
+            self._publisher = SharedMemoryPublisher()
+            self._publisher_finalizer = weakref.finalize(self, self._publisher.close)
+            self._published_state = (str(uuid4()), self._publisher.dumps(self))
+            self.logger.debug(f'{self._publisher.size} bytes of data are shared with the workers')
+        return self._published_state
+
+    def _reset_published_state(self):
+        if self._publisher is not None:
+            # The closed publisher is not referenced by the finalizer anymore
+            self._publisher_finalizer.detach()
+            self._publisher.close()
+        self._publisher = None
+        self._publisher_finalizer = None
+        self._published_state = None
+
     def _reset_eval_cache(self):
         self.evaluation_cache: Dict[int, Graph] = {}
 
@@ -180,12 +574,62 @@ class SimpleDispatcher(ObjectiveEvaluationDispatcher):
         return ind if ind.fitness.valid else None
 
 
-def determine_n_jobs(n_jobs=-1, logger=None):
-    if n_jobs > multiprocessing.cpu_count() or n_jobs == -1:
-        n_jobs = multiprocessing.cpu_count()
-    if logger:
-        logger.info(f"Number of used CPU's: {n_jobs}")
-    return n_jobs
+@dataclass
+class _FoldsEvaluation:
+    """ Results of the evaluation of the individual on the separate folds """
+    metrics: Dict[int, Sequence[Real]] = field(default_factory=dict)
+    graph: Optional[OptGraph] = None
+    computation_time: float = 0.
+    is_failed: bool = False
+
+    def add(self, fold_id: int, fold_metrics: Optional[Sequence[Real]], graph: Optional[OptGraph],
+            computation_time: float):
+        self.computation_time += computation_time
+        if fold_metrics is None:
+            self.is_failed = True
+            return
+        self.metrics[fold_id] = fold_metrics
+        if graph is not None:
+            self.graph = graph
+
+    @property
+    def evaluated_folds(self) -> int:
+        """ Number of the consecutive evaluated folds from the first one """
+        folds_number = 0
+        while folds_number in self.metrics:
+            folds_number += 1
+        return folds_number
+
+    def folds_metrics(self) -> List[Sequence[Real]]:
+        return [self.metrics[fold_id] for fold_id in range(self.evaluated_folds)]
+
+
+def racing_budgets(folds_number: int, reduction_factor: int) -> List[int]:
+    """ Returns the increasing numbers of folds for the successive halving: each next budget is larger
+    than the previous one in reduction_factor times (the last budget is all folds, the first one is a single fold)
+
+    :param folds_number: number of all folds
+    :param reduction_factor: ratio of the next budget to the previous one
+    """
+    budgets = [folds_number]
+    while budgets[0] > 1:
+        budgets.insert(0, max(budgets[0] // reduction_factor, 1))
+    return budgets
+
+
+def _evaluate_in_worker(task: Tuple[str, bytes, Individual, Optional[Graph]]) -> Optional[Individual]:
+    """ Evaluates the individual in the worker process. The dispatcher is restored once per published state """
+    key, state, ind, precomputed_graph = task
+    dispatcher = load_published(key, state)
+    dispatcher.evaluation_cache = {ind.uid: precomputed_graph} if precomputed_graph is not None else {}
+    return dispatcher.evaluate_single(ind)
+
+
+def _evaluate_fold_in_worker(task: Tuple[str, bytes, Individual, int, bool]) \
+        -> Tuple[Optional[Sequence[Real]], Optional[OptGraph], float]:
+    """ Evaluates the individual on the single fold in the worker process """
+    key, state, ind, fold_id, is_last_fold = task
+    return load_published(key, state).evaluate_fold(ind, fold_id, is_last_fold)
 
 
 def _restrict_n_jobs_in_nodes(graph: OptGraph):
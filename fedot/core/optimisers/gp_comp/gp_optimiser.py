@@ -6,7 +6,7 @@ from tqdm import tqdm
 
 from fedot.core.composer.gp_composer.gp_composer import PipelineComposerRequirements
 from fedot.core.log import Log
-from fedot.core.optimisers.archive import GenerationKeeper
+from fedot.core.optimisers.archive import FitnessArchive, GenerationKeeper, canonical_graph_hash
 from fedot.core.optimisers.gp_comp.evaluation import MultiprocessingDispatcher
 from fedot.core.optimisers.gp_comp.gp_operators import (
     clean_operators_history,
@@ -17,7 +17,7 @@ from fedot.core.optimisers.gp_comp.initial_population_builder import InitialPopu
 from fedot.core.optimisers.gp_comp.operators.crossover import CrossoverTypesEnum, crossover
 from fedot.core.optimisers.gp_comp.operators.inheritance import GeneticSchemeTypesEnum, inheritance
 from fedot.core.optimisers.gp_comp.operators.mutation import MutationTypesEnum, mutation
-from fedot.core.optimisers.gp_comp.operators.operator import PopulationT
+from fedot.core.optimisers.gp_comp.operators.operator import EvaluationOperator, PopulationT
 from fedot.core.optimisers.gp_comp.operators.regularization import RegularizationTypesEnum, regularized_population
 from fedot.core.optimisers.gp_comp.operators.selection import SelectionTypesEnum, crossover_parents_selection, selection
 from fedot.core.optimisers.gp_comp.parameters.graph_depth import AdaptiveGraphDepth
@@ -30,6 +30,7 @@ from fedot.core.optimisers.optimizer import GraphGenerationParams, GraphOptimise
 from fedot.core.optimisers.timer import OptimisationTimer
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.utilities.grouped_condition import GroupedCondition
+from fedot.core.utilities.worker_pool import WorkerPool, determine_n_jobs
 
 
 class GPGraphOptimiserParameters(GraphOptimiserParameters):
@@ -100,10 +101,14 @@ class EvoGraphOptimiser(GraphOptimiser):
         self.population = None
         self.generations = GenerationKeeper(self.objective)
         self.timer = OptimisationTimer(timeout=self.requirements.timeout, log=self.log)
+        # Fitness of the graphs that are structurally identical to already evaluated ones is taken from archive
+        self.fitness_archive = FitnessArchive()
         self.eval_dispatcher = MultiprocessingDispatcher(graph_adapter=graph_generation_params.adapter,
                                                          timer=self.timer,
                                                          n_jobs=requirements.n_jobs,
                                                          graph_cleanup_fn=_unfit_pipeline,
+                                                         fitness_archive=self.fitness_archive,
+                                                         racing_reduction_factor=requirements.racing_reduction_factor,
                                                          log=log)
 
         # stopping_after_n_generation may be None, so use some obvious max number
@@ -180,6 +185,10 @@ class EvoGraphOptimiser(GraphOptimiser):
         # Redirect callback to evaluation dispatcher
         self.eval_dispatcher.set_evaluation_callback(callback)
 
+    def set_worker_pool(self, worker_pool: Optional[WorkerPool]):
+        # Redirect pool to evaluation dispatcher
+        self.eval_dispatcher.set_worker_pool(worker_pool)
+
     def assign_positional_ids(self, pop: PopulationT):
         for ind_id, ind in enumerate(pop):
             ind.pop_num = self.generations.generation_num
@@ -194,39 +203,122 @@ class EvoGraphOptimiser(GraphOptimiser):
         with self.timer, tqdm(total=self.requirements.num_of_generations,
                               desc='Generations', unit='gen', initial=1,
                               disable=not show_progress or self.log.verbosity_level == -1):
+            try:
+                self._evolve(evaluator)
+            finally:
+                # Worker processes are reused by all generations and are stopped after the last one
+                # (the shared pool is stopped by its owner)
+                self.eval_dispatcher.shutdown()
 
-            # Adding of initial assumptions to history as zero generation
-            if self.initial_individuals:
-                self._next_population(evaluator(self.initial_individuals))
+        all_best_graphs = [ind.graph for ind in self.generations.best_individuals]
+        return all_best_graphs
 
-            pop_size = self._pop_size.initial
-            self._next_population(evaluator(self._init_population(pop_size, self._graph_depth.initial)))
+    def _evolve(self, evaluator: EvaluationOperator):
+        # Adding of initial assumptions to history as zero generation
+        if self.initial_individuals:
+            self._next_population(evaluator(self.initial_individuals))
 
-            while not self.stop_optimisation():
-                pop_size = self._pop_size.next(self.population)
-                self.max_depth = self._graph_depth.next()
-                self.log.info(f'Next population size: {pop_size}; max graph depth: {self.max_depth}')
+        pop_size = self._pop_size.initial
+        self._next_population(evaluator(self._init_population(pop_size, self._graph_depth.initial)))
 
-                individuals_to_select = regularized_population(self.parameters.regularization_type,
-                                                               self.population,
-                                                               evaluator,
-                                                               self.graph_generation_params)
+        if self.parameters.genetic_scheme_type is GeneticSchemeTypesEnum.steady_state_async:
+            self._evolve_async(pop_size)
+            return
 
-                selected_individuals = selection(types=self.parameters.selection_types,
-                                                 population=individuals_to_select,
-                                                 pop_size=pop_size,
-                                                 params=self.graph_generation_params)
-                new_population = self._reproduce(selected_individuals)
+        while not self.stop_optimisation():
+            pop_size = self._pop_size.next(self.population)
+            self.max_depth = self._graph_depth.next()
+            self.log.info(f'Next population size: {pop_size}; max graph depth: {self.max_depth}')
 
-                new_population = list(map(self._mutate, new_population))
-                new_population = evaluator(new_population)
+            individuals_to_select = regularized_population(self.parameters.regularization_type,
+                                                           self.population,
+                                                           evaluator,
+                                                           self.graph_generation_params)
 
-                new_population = self._inheritance(new_population, pop_size)
+            selected_individuals = selection(types=self.parameters.selection_types,
+                                             population=individuals_to_select,
+                                             pop_size=pop_size,
+                                             params=self.graph_generation_params)
+            new_population = self._reproduce(selected_individuals)
 
-                self._next_population(new_population)
+            new_population = list(map(self._mutate, new_population))
+            new_population = evaluator(new_population)
 
-        all_best_graphs = [ind.graph for ind in self.generations.best_individuals]
-        return all_best_graphs
+            new_population = self._inheritance(new_population, pop_size)
+
+            self._next_population(new_population)
+
+    def _evolve_async(self, pop_size: int):
+        """
+        Asynchronous steady-state evolution: evaluations of n_jobs offspring are kept in progress.
+        Each time one of them is finished, the offspring replaces the worst individual of the population,
+        and the next offspring is produced by the selection, crossover and mutation and is submitted at once,
+        so the workers do not wait for the slowest individual of the generation.
+
+        Every pop_size finished evaluations are counted as a generation
+        for the history, the adaptive parameters and the stopping criteria.
+        """
+        n_in_flight = determine_n_jobs(self.requirements.n_jobs)
+        population = list(self.population)
+        # Second offspring of the crossover waits for the next free worker
+        offspring_queue = []
+        evaluations_num = 0
+        is_stopped = False
+
+        def submit_offspring():
+            while self.eval_dispatcher.n_in_flight < n_in_flight:
+                if not offspring_queue:
+                    parents = selection(types=self.parameters.selection_types, population=population,
+                                        pop_size=2, params=self.graph_generation_params)
+                    offspring_queue.extend(self._reproduce(parents))
+                self.eval_dispatcher.submit(self._mutate(offspring_queue.pop()))
+
+        submit_offspring()
+        while self.eval_dispatcher.n_in_flight > 0:
+            try:
+                _, evaluated = self.eval_dispatcher.next_evaluated(timeout=self.timer.seconds_left)
+            except TimeoutError:
+                # The evaluations are not finished in time (e.g. their worker is killed), so they are failed
+                cancelled_num = self.eval_dispatcher.cancel_in_flight()
+                self.log.warn(f'Optimisation stopped: {cancelled_num} evaluations are not finished '
+                              f'before the time limit and are considered failed')
+                evaluations_num += cancelled_num
+                break
+            evaluations_num += 1
+            if evaluated is not None:
+                population = self._steady_state_replacement(population, evaluated, pop_size)
+
+            if evaluations_num >= pop_size:
+                evaluations_num = 0
+                self._next_population(population)
+                pop_size = self._pop_size.next(self.population)
+                self.max_depth = self._graph_depth.next()
+                is_stopped = is_stopped or self.stop_optimisation()
+            elif not is_stopped and self.timer.is_time_limit_reached():
+                # Offspring are not submitted after the time limit even in the middle of the generation
+                self.log.info('Optimisation stopped: Time limit is reached')
+                is_stopped = True
+
+            if not is_stopped:
+                submit_offspring()
+
+        if evaluations_num > 0:
+            # Offspring evaluated after the last full generation
+            self._next_population(population)
+
+    def _steady_state_replacement(self, population: PopulationT, offspring: Individual,
+                                  pop_size: int) -> PopulationT:
+        """ Adds offspring to the population removing the worst individuals over the pop_size.
+        The offspring with the structure of the individual of the population (e.g. its fitness is taken
+        from the archive) is skipped, so the population is not filled with the clones """
+        offspring_hash = canonical_graph_hash(offspring.graph)
+        if any(canonical_graph_hash(ind.graph) == offspring_hash for ind in population):
+            return population
+        candidates = list(population) + [offspring]
+        if self.objective.is_multi_objective:
+            return selection(types=self.parameters.selection_types, population=candidates,
+                             pop_size=pop_size, params=self.graph_generation_params)
+        return sorted(candidates, key=lambda ind: ind.fitness, reverse=True)[:pop_size]
 
     def with_elitism(self, pop_size: int) -> bool:
         if self.objective.is_multi_objective:
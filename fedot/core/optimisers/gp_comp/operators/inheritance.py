@@ -8,6 +8,7 @@ from fedot.core.utilities.data_structures import ComparableEnum as Enum
 
 class GeneticSchemeTypesEnum(Enum):
     steady_state = 'steady_state'
+    steady_state_async = 'steady_state_async'
     generational = 'generational'
     parameter_free = 'parameter_free'
 
@@ -21,6 +22,7 @@ def inheritance(type: GeneticSchemeTypesEnum, selection_types: List[SelectionTyp
     inheritance_type_by_genetic_scheme = {
         GeneticSchemeTypesEnum.generational: generational_scheme,
         GeneticSchemeTypesEnum.steady_state: steady_state_scheme,
+        GeneticSchemeTypesEnum.steady_state_async: steady_state_scheme,
         GeneticSchemeTypesEnum.parameter_free: steady_state_scheme
     }
     return inheritance_type_by_genetic_scheme[type]()
@@ -0,0 +1,187 @@
+import math
+from typing import List, Sequence
+
+import numpy as np
+
+from fedot.core.optimisers.fitness.multi_objective_fitness import MultiObjFitness
+from fedot.core.optimisers.gp_comp.individual import Individual
+
+
+def fitness_matrix(individuals: Sequence[Individual]) -> np.array:
+    """ Returns the matrix of the fitness values (one row per individual).
+    Values are weighted, so less value is better for each objective """
+    return np.array([ind.fitness.values for ind in individuals], dtype=float)
+
+
+def dominance_matrix(individuals: Sequence[Individual]) -> np.array:
+    """ Returns the boolean matrix where the element (i, j) is True if i-th individual dominates j-th one.
+
+    Dominance of the valid multi-objective fitness is computed for all pairs at once,
+    other fitness types are compared by their own :meth:`~Fitness.dominates`
+    """
+    if all(isinstance(ind.fitness, MultiObjFitness) and ind.fitness.valid for ind in individuals):
+        return pareto_dominance(fitness_matrix(individuals))
+
+    dominance = np.zeros((len(individuals), len(individuals)), dtype=bool)
+    for i, ind_i in enumerate(individuals):
+        for j, ind_j in enumerate(individuals):
+            dominance[i, j] = i != j and ind_i.fitness.dominates(ind_j.fitness)
+    return dominance
+
+
+def pareto_dominance(fitness: np.array, other_fitness: np.array = None) -> np.array:
+    """ Returns the boolean matrix where the element (i, j) is True if i-th row of fitness
+    dominates j-th row of other_fitness, i.e. it is not worse in all objectives and better in one of them
+
+    :param fitness: matrix of the weighted fitness values (less is better)
+    :param other_fitness: matrix of the fitness values to compare with (fitness itself by default)
+    """
+    other_fitness = fitness if other_fitness is None else other_fitness
+    left = fitness[:, np.newaxis, :]
+    right = other_fitness[np.newaxis, :, :]
+    return np.all(left <= right, axis=2) & np.any(left < right, axis=2)
+
+
+def non_dominated_sort(dominance: np.array) -> List[np.array]:
+    """ Splits the individuals into the Pareto fronts: the first front contains non-dominated individuals,
+    the next front contains individuals dominated only by the previous fronts and so on.
+
+    :param dominance: dominance matrix (see :func:`dominance_matrix`)
+    :return: list of arrays with the positions of individuals of each front
+    """
+    fronts = []
+    # Number of individuals that dominate each individual
+    dominators_number = dominance.sum(axis=0)
+    is_sorted = np.zeros(len(dominance), dtype=bool)
+    while not np.all(is_sorted):
+        front = np.flatnonzero((dominators_number == 0) & ~is_sorted)
+        fronts.append(front)
+        is_sorted[front] = True
+        dominators_number = dominators_number - dominance[front].sum(axis=0)
+    return fronts
+
+
+def crowding_distance(fitness: np.array) -> np.array:
+    """ Returns the crowding distance of the individuals of one front:
+    the sum of normalized distances between the neighbours of the individual for each objective.
+    Extreme individuals have infinite distance.
+
+    :param fitness: matrix of the fitness values of the front
+    """
+    n_individuals, n_objectives = fitness.shape
+    distance = np.zeros(n_individuals)
+    if n_individuals <= 2:
+        distance[:] = np.inf
+        return distance
+    for objective in range(n_objectives):
+        order = np.argsort(fitness[:, objective], kind='stable')
+        values = fitness[order, objective]
+        distance[order[[0, -1]]] = np.inf
+        values_range = values[-1] - values[0]
+        if values_range > 0:
+            distance[order[1:-1]] += (values[2:] - values[:-2]) / values_range
+    return distance
+
+
+def nsga2_selection(individuals: List[Individual], pop_size: int) -> List[Individual]:
+    """
+    Apply NSGA-II selection operator on the *individuals*. Individuals are taken front by front
+    (see :func:`non_dominated_sort`), the last front that doesn't fit in entirely is truncated
+    by the crowding distance (the individuals from less crowded regions are preferred).
+
+    :param individuals: A list of individuals to select from.
+    :param pop_size: The number of individuals to select.
+    :returns: A list of selected individuals
+    """
+    fitness = fitness_matrix(individuals)
+    chosen_indices = []
+    for front in non_dominated_sort(dominance_matrix(individuals)):
+        places_left = pop_size - len(chosen_indices)
+        if places_left <= 0:
+            break
+        if len(front) > places_left:
+            distance = crowding_distance(fitness[front])
+            front = front[np.argsort(-distance, kind='stable')[:places_left]]
+        chosen_indices.extend(front)
+    return [individuals[i] for i in chosen_indices]
+
+
+def spea2_selection(individuals: List[Individual], pop_size: int) -> List[Individual]:
+    """
+    Apply SPEA-II selection operator on the *individuals*. Usually, the
+    size of *individuals* will be larger than *n* because any individual
+    present in *individuals* will appear in the returned list at most once.
+    Having the size of *individuals* equals to *n* will have no effect other
+    than sorting the population according to a strength Pareto scheme. The
+    list returned contains references to the input *individuals*.
+
+    The algorithm follows the DEAP implementation (Library URL: https://github.com/DEAP/deap),
+    but dominance, density and truncation are computed with numpy for the whole population.
+
+    :param individuals: A list of individuals to select from.
+    :param pop_size: The number of individuals to select.
+    :returns: A list of selected individuals
+    """
+    inds_len = len(individuals)
+    dominance = dominance_matrix(individuals)
+    # Strength is the number of dominated individuals,
+    # raw fitness is the sum of strengths of the dominating individuals
+    strength_fits = dominance.sum(axis=1)
+    fits = (strength_fits[:, np.newaxis] * dominance).sum(axis=0).astype(float)
+
+    # Choose all non-dominated individuals
+    chosen_indices = np.flatnonzero(fits < 1)
+
+    if len(chosen_indices) < pop_size:  # The archive is too small
+        distances = _squared_distances(fitness_matrix(individuals))
+        np.fill_diagonal(distances, np.inf)
+        # Density is estimated by the distance to the k-th nearest neighbour
+        k = min(int(math.sqrt(inds_len)), inds_len - 1)
+        if k > 0:
+            kth_dist = np.partition(distances, k - 1, axis=1)[:, k - 1]
+            fits += 1.0 / (kth_dist + 2.0)
+
+        next_indices = np.setdiff1d(np.arange(inds_len), chosen_indices)
+        next_indices = next_indices[np.argsort(fits[next_indices], kind='stable')]
+        chosen_indices = np.concatenate((chosen_indices, next_indices[:pop_size - len(chosen_indices)]))
+
+    elif len(chosen_indices) > pop_size:  # The archive is too large
+        chosen_indices = chosen_indices[_truncate_by_distances(fitness_matrix(individuals)[chosen_indices], pop_size)]
+
+    return [individuals[i] for i in chosen_indices]
+
+
+def _squared_distances(fitness: np.array) -> np.array:
+    difference = fitness[:, np.newaxis, :] - fitness[np.newaxis, :, :]
+    return np.einsum('ijk,ijk->ij', difference, difference)
+
+
+def _truncate_by_distances(fitness: np.array, size: int) -> np.array:
+    """ Iteratively removes the individual which has the lexicographically smallest vector
+    of the sorted distances to other ones until the required size is reached.
+
+    :return: positions of the remained individuals
+    """
+    distances = _squared_distances(fitness)
+    np.fill_diagonal(distances, np.inf)
+    remained = np.arange(len(fitness))
+    # Neighbours of each individual ordered by the distance, the individual itself is the last one
+    neighbours = np.argsort(distances, axis=1, kind='stable')
+    while len(remained) > size:
+        neighbours_distances = np.take_along_axis(distances, neighbours, axis=1)
+        # Lexicographic minimum is found by narrowing the candidates column by column
+        candidates = np.arange(len(remained))
+        for column in range(neighbours.shape[1] - 1):
+            column_distances = neighbours_distances[candidates, column]
+            candidates = candidates[column_distances == column_distances.min()]
+            if len(candidates) == 1:
+                break
+        removed = candidates[0]
+
+        remained = np.delete(remained, removed)
+        neighbours = np.delete(neighbours, removed, axis=0)
+        # Positions of the neighbours are shifted after removal
+        neighbours = neighbours[neighbours != removed].reshape(len(remained), -1)
+        neighbours[neighbours > removed] -= 1
+        distances = np.delete(np.delete(distances, removed, axis=0), removed, axis=1)
+    return remained
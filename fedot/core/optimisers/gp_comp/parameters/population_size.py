@@ -62,7 +62,7 @@ class AdaptivePopulationSize(PopulationSize):
 def init_adaptive_pop_size(genetic_scheme_type: GeneticSchemeTypesEnum,
                            requirements: PipelineComposerRequirements,
                            improvement_watcher: ImprovementWatcher) -> PopulationSize:
-    if genetic_scheme_type == GeneticSchemeTypesEnum.steady_state:
+    if genetic_scheme_type in (GeneticSchemeTypesEnum.steady_state, GeneticSchemeTypesEnum.steady_state_async):
         pop_size = ConstRatePopulationSize(
             pop_size=requirements.pop_size,
             offspring_rate=1.0,
@@ -71,6 +71,10 @@ class OptNode:
     def descriptive_id(self):
         return self._operator.descriptive_id()
 
+    @property
+    def structural_hash(self) -> str:
+        return self._operator.structural_hash()
+
     def ordered_subnodes_hierarchy(self, visited=None) -> List['OptNode']:
         nodes = self._operator.ordered_subnodes_hierarchy(visited)
         return [self._node_adapter.adapt(node) for node in nodes]
@@ -0,0 +1,179 @@
+import json
+import os
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.graph import OptGraph
+from fedot.core.optimisers.objective import Objective
+from fedot.core.serializers import Serializer
+
+HEADER_KIND = 'header'
+INDIVIDUALS_KIND = 'individuals'
+ARCHIVE_KIND = 'archive'
+FITNESS_ARCHIVE_STATS_KIND = 'fitness_archive_stats'
+
+# Records are written with the kind as the first key, so the file is indexed without parsing the generations
+_KIND_PATTERN = re.compile(rb'^\{"kind":"(\w+)"')
+
+
+class GenerationsStorage:
+    """
+    Append-only storage of the optimisation history in the JSON-lines file.
+
+    Each generation is written as one compact record as soon as it is produced,
+    graphs are stored structurally (without fitted operations and data) and the parent individuals
+    are referenced by their uids. The generations are read back lazily one by one,
+    only the recently used ones are kept in memory.
+
+    :param path: path to the file of the storage
+    :param cache_size: number of the recently read generations kept in memory
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], cache_size: int = 2):
+        self.path = str(path)
+        self.cache_size = cache_size
+        # kind of the records -> offsets of the records in the file
+        self._offsets: Dict[str, List[int]] = {INDIVIDUALS_KIND: [], ARCHIVE_KIND: []}
+        self._cache: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def create(path: Union[str, os.PathLike], objective: Objective,
+               save_folder: Optional[str] = None, cache_size: int = 2) -> 'GenerationsStorage':
+        """ Creates the empty storage (the existing file is overwritten) """
+        storage = GenerationsStorage(path, cache_size)
+        folder = os.path.dirname(storage.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(storage.path, mode='wb'):
+            pass
+        storage._append_record(HEADER_KIND, objective=objective, save_folder=save_folder)
+        return storage
+
+    @staticmethod
+    def open(path: Union[str, os.PathLike], cache_size: int = 2) -> 'GenerationsStorage':
+        """ Opens the existing storage indexing its records """
+        storage = GenerationsStorage(path, cache_size)
+        with open(storage.path, mode='rb') as file:
+            offset = file.tell()
+            for line in iter(file.readline, b''):
+                kind = _record_kind(line)
+                if kind in storage._offsets:
+                    storage._offsets[kind].append(offset)
+                offset = file.tell()
+        return storage
+
+    @staticmethod
+    def is_storage_file(path: Union[str, os.PathLike]) -> bool:
+        """ Checks if the file was written by the storage """
+        try:
+            with open(path, mode='rb') as file:
+                return _record_kind(file.readline(64)) == HEADER_KIND
+        except (OSError, TypeError, ValueError):
+            return False
+
+    def header(self) -> Dict[str, Any]:
+        """ Returns the objective and the save folder of the history """
+        with open(self.path, mode='rb') as file:
+            return self._decode(file.readline())
+
+    def fitness_archive_stats(self) -> List[Dict[str, int]]:
+        stats = []
+        with open(self.path, mode='rb') as file:
+            for line in iter(file.readline, b''):
+                if _record_kind(line) == FITNESS_ARCHIVE_STATS_KIND:
+                    stats.append(self._decode(line)['stats'])
+        return stats
+
+    def generations(self, kind: str) -> 'StoredGenerations':
+        return StoredGenerations(self, kind)
+
+    def append_generation(self, kind: str, individuals: Sequence[Individual]):
+        self._offsets[kind].append(self._append_record(kind, individuals=list(individuals)))
+
+    def append_fitness_archive_stats(self, stats: Dict[str, int]):
+        self._append_record(FITNESS_ARCHIVE_STATS_KIND, stats=stats)
+
+    def generations_number(self, kind: str) -> int:
+        return len(self._offsets[kind])
+
+    def read_generation(self, kind: str, gen_num: int) -> List[Individual]:
+        key = (kind, gen_num)
+        generation = self._cache.get(key)
+        if generation is None:
+            with open(self.path, mode='rb') as file:
+                file.seek(self._offsets[kind][gen_num])
+                generation = self._decode(file.readline())['individuals']
+            self._resolve_parents(generation)
+            self._cache[key] = generation
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        self._cache.move_to_end(key)
+        return generation
+
+    def _resolve_parents(self, generation: List[Individual]):
+        """ Replaces the uids of the parents with the individuals of the generation and the cached ones,
+        the parents that are not in memory are replaced with the empty individuals with the same uids """
+        lookup_dict = {ind.uid: ind for cached in self._cache.values() for ind in cached}
+        lookup_dict.update((ind.uid, ind) for ind in generation)
+        for ind in generation:
+            for parent_op in ind.parent_operators:
+                for parent_ind_idx, parent_ind_uid in enumerate(parent_op.parent_individuals):
+                    parent_ind = lookup_dict.get(parent_ind_uid)
+                    if parent_ind is None:
+                        parent_ind = Individual(graph=OptGraph())
+                        parent_ind.uid = parent_ind_uid
+                    parent_op.parent_individuals[parent_ind_idx] = parent_ind
+
+    def _append_record(self, kind: str, **content) -> int:
+        record = json.dumps({'kind': kind, **content}, cls=Serializer, separators=(',', ':'))
+        with open(self.path, mode='ab') as file:
+            offset = file.tell()
+            file.write(record.encode('utf-8') + b'\n')
+        return offset
+
+    @staticmethod
+    def _decode(line: bytes) -> Dict[str, Any]:
+        return json.loads(line, cls=Serializer)
+
+    def __getstate__(self):
+        # The generations are read from the file again
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        return state
+
+
+class StoredGenerations(Sequence):
+    """ Lazy sequence of the generations of the one kind saved in :class:`GenerationsStorage` """
+
+    def __init__(self, storage: GenerationsStorage, kind: str):
+        self._storage = storage
+        self._kind = kind
+
+    def append(self, individuals: Sequence[Individual]):
+        self._storage.append_generation(self._kind, individuals)
+
+    def __getitem__(self, gen_num: Union[int, slice]) -> Union[List[Individual], List[List[Individual]]]:
+        if isinstance(gen_num, slice):
+            return [self[i] for i in range(*gen_num.indices(len(self)))]
+        if gen_num < 0:
+            gen_num += len(self)
+        if not 0 <= gen_num < len(self):
+            raise IndexError('Generation index out of range')
+        return self._storage.read_generation(self._kind, gen_num)
+
+    def __iter__(self) -> Iterator[List[Individual]]:
+        for gen_num in range(len(self)):
+            yield self[gen_num]
+
+    def __len__(self) -> int:
+        return self._storage.generations_number(self._kind)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._storage.path!r}, {self._kind!r}, generations={len(self)})'
+
+
+def _record_kind(line: bytes) -> Optional[str]:
+    match = _KIND_PATTERN.match(line)
+    return match.group(1).decode() if match else None
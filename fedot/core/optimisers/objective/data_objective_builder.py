@@ -60,7 +60,8 @@ class DataObjectiveBuilder:
         train_data, test_data = train_test_data_setup(data, split_ratio,
                                                       **{'validation_blocks': kwargs.get('validation_blocks')})
 
-        def data_producer(): yield train_data, test_data
+        # Producer must be picklable to be passed to the worker processes
+        data_producer = partial(_hold_out_producer, train_data, test_data)
 
         if RemoteEvaluator().use_remote:
             init_data_for_remote_execution(train_data)
@@ -88,3 +89,7 @@ class DataObjectiveBuilder:
                                    self.cv_folds,
                                    self.advisor.propose_kfold(data))
         return cv_generator
+
+
+def _hold_out_producer(train_data: InputData, test_data: InputData):
+    yield train_data, test_data
@@ -1,5 +1,7 @@
 from datetime import timedelta
-from typing import Optional, Callable, Iterable, Tuple
+from itertools import islice
+from numbers import Real
+from typing import Optional, Callable, Iterable, Sequence, Tuple
 
 import numpy as np
 
@@ -23,6 +25,9 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
     :param objective: Objective for evaluating metrics on pipelines.
     :param data_producer: Producer of data folds, each fold is a tuple of (train_data, test_data).
     If it returns a single fold, it's effectively a hold-out validation. For many folds it's k-folds.
+    The producer must return the same folds on each call, so the folds can be evaluated separately
+    (see :meth:`evaluate_fold`). Graph that fails on some fold is not evaluated on the rest of them
+    and gets invalid fitness.
     :param time_constraint: Optional time constraint for pipeline.fit.
     :param validation_blocks: Number of validation blocks, optional, used only for time series validation.
     :param cache: Cache manager for fitted models, optional.
@@ -42,6 +47,7 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
         self._validation_blocks = validation_blocks
         self._cache = cache
         self._log = log or default_log(__name__)
+        self._folds_number: Optional[int] = None
 
     def evaluate(self, graph: Pipeline) -> Fitness:
         # Seems like a workaround for situation when logger is lost
@@ -53,27 +59,55 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
 
         folds_metrics = []
         for fold_id, (train_data, test_data) in enumerate(self._data_producer()):
-            try:
-                prepared_pipeline = self.prepare_graph(graph, train_data, fold_id)
-            except Exception as ex:
-                self._log.warn(f'Continuing after pipeline fit error <{ex}> for graph: {graph_id}')
-                continue
-            evaluated_fitness = self._objective(prepared_pipeline,
-                                                reference_data=test_data,
-                                                validation_blocks=self._validation_blocks)
-            if evaluated_fitness.valid:
-                folds_metrics.append(evaluated_fitness.values)
-            else:
-                self._log.warn(f'Continuing after objective evaluation error for graph: {graph_id}')
-                continue
+            fold_metrics = self._evaluate_on_data(graph, train_data, test_data, fold_id)
+            if fold_metrics is None:
+                # Graph can not be compared with others by the part of folds, so the rest of them are skipped
+                folds_metrics = []
+                break
+            folds_metrics.append(fold_metrics)
+
+        fitness = self.reduce_folds(folds_metrics)
+        if fitness.valid:
+            self._log.debug(f'Pipeline {graph_id} with evaluated metrics: {fitness.values}')
+        return fitness
+
+    def folds_number(self) -> int:
+        if self._folds_number is None:
+            self._folds_number = sum(1 for _ in self._data_producer())
+        return self._folds_number
 
+    def evaluate_fold(self, graph: Pipeline, fold_id: int) -> Optional[Sequence[Real]]:
+        graph.log = self._log
+        fold = next(islice(self._data_producer(), fold_id, None), None)
+        if fold is None:
+            return None
+        train_data, test_data = fold
+        return self._evaluate_on_data(graph, train_data, test_data, fold_id)
+
+    def reduce_folds(self, folds_metrics: Sequence[Sequence[Real]]) -> Fitness:
         if folds_metrics:
             folds_metrics = tuple(np.mean(folds_metrics, axis=0))  # averages for each metric over folds
-            self._log.debug(f'Pipeline {graph_id} with evaluated metrics: {folds_metrics}')
         else:
             folds_metrics = None
         return to_fitness(folds_metrics, self._objective.is_multi_objective)
 
+    def _evaluate_on_data(self, graph: Pipeline, train_data: InputData, test_data: InputData,
+                          fold_id: int) -> Optional[Sequence[Real]]:
+        try:
+            prepared_pipeline = self.prepare_graph(graph, train_data, fold_id)
+        except Exception as ex:
+            self._log.warn(f'Stopping after pipeline fit error <{ex}> '
+                           f'for graph: {graph.root_node.descriptive_id}')
+            return None
+        evaluated_fitness = self._objective(prepared_pipeline,
+                                            reference_data=test_data,
+                                            validation_blocks=self._validation_blocks)
+        if not evaluated_fitness.valid:
+            self._log.warn(f'Stopping after objective evaluation error '
+                           f'for graph: {graph.root_node.descriptive_id}')
+            return None
+        return evaluated_fitness.values
+
     def prepare_graph(self, graph: Pipeline, train_data: InputData, fold_id: Optional[int] = None) -> Pipeline:
         """
         Fit pipeline before metric evaluation can be performed.
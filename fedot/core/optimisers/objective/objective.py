@@ -1,6 +1,7 @@
 from numbers import Real
 from typing import Any, Optional, Union, Iterable, Callable, Sequence, TypeVar
 
+from fedot.core.composer.metrics import QualityMetric
 from fedot.core.dag.graph import Graph
 from fedot.core.log import Log, default_log
 from fedot.core.optimisers.fitness import *
@@ -26,10 +27,15 @@ class Objective:
 
     def __call__(self, graph: Graph, **kwargs: Any) -> Fitness:
         evaluated_metrics = []
+        # Predictions shared between quality metrics: graph is applied once per output mode
+        predictions = {}
         for metric in self.metrics:
             metric_func = MetricsRepository().metric_by_id(metric, default_callable=metric)
             try:
-                metric_value = metric_func(graph, **kwargs)
+                if _is_quality_metric(metric_func):
+                    metric_value = metric_func(graph, predictions=predictions, **kwargs)
+                else:
+                    metric_value = metric_func(graph, **kwargs)
                 evaluated_metrics.append(metric_value)
             except Exception as ex:
                 self._log.error(f'Objective evaluation error for graph {graph} on metric {metric}: {ex}')
@@ -41,6 +47,12 @@ class Objective:
         return [str(metric) for metric in self.metrics]
 
 
+def _is_quality_metric(metric_func: Callable) -> bool:
+    """ Checks if the metric is a method of QualityMetric, so it can reuse the predictions of the graph """
+    metric_cls = getattr(metric_func, '__self__', None)
+    return isinstance(metric_cls, type) and issubclass(metric_cls, QualityMetric)
+
+
 def to_fitness(metric_values: Optional[Sequence[Real]], multi_objective: bool = False) -> Fitness:
     if metric_values is None:
         return null_fitness()
@@ -1,5 +1,6 @@
 from abc import ABC
-from typing import TypeVar, Generic
+from numbers import Real
+from typing import Generic, Optional, Sequence, TypeVar
 
 from fedot.core.dag.graph import Graph
 from fedot.core.optimisers.fitness import Fitness
@@ -35,6 +36,22 @@ class ObjectiveEvaluate(ABC, Generic[G]):
         """Evaluate graph and compute its fitness."""
         return self._objective(graph, **self._objective_kwargs)
 
+    def folds_number(self) -> Optional[int]:
+        """Number of the data folds the graph can be evaluated on separately
+        (see :meth:`evaluate_fold`), None if the evaluation can not be split by folds."""
+        return None
+
+    def evaluate_fold(self, graph: G, fold_id: int) -> Optional[Sequence[Real]]:
+        """Evaluate graph on the single data fold.
+
+        :return: metric values on the fold or None if the evaluation is failed
+        """
+        raise NotImplementedError()
+
+    def reduce_folds(self, folds_metrics: Sequence[Sequence[Real]]) -> Fitness:
+        """Compute fitness of the graph from its metric values on all folds (see :meth:`evaluate_fold`)."""
+        raise NotImplementedError()
+
     def evaluate_intermediate_metrics(self, graph: G):
         """Compute intermediate metrics for each graph node and store it there."""
         pass
@@ -4,17 +4,21 @@ import json
 import os
 import shutil
 import warnings
-from copy import deepcopy
+import weakref
+from copy import copy, deepcopy
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, List, Optional, Sequence, Union
+from typing import Dict, List, Optional, Sequence, Union
 
 from fedot.core.optimisers.adapters import PipelineAdapter
-from fedot.core.optimisers.archive import GenerationKeeper
+from fedot.core.optimisers.archive import FitnessArchive, GenerationKeeper
 # ParentOperator is needed for backward compatibility with older optimization histories.
 # This is a temporary solution until the issue #699 (https://github.com/nccr-itmo/FEDOT/issues/699) is closed.
 from fedot.core.optimisers.gp_comp.individual import Individual, ParentOperator  # noqa
 from fedot.core.optimisers.gp_comp.individual import Individual
 from fedot.core.optimisers.gp_comp.operators.operator import PopulationT
+from fedot.core.optimisers.history_storage import ARCHIVE_KIND, GenerationsStorage, INDIVIDUALS_KIND, \
+    StoredGenerations
 from fedot.core.optimisers.objective import Objective
 from fedot.core.optimisers.utils.population_utils import get_metric_position
 from fedot.core.repository.quality_metrics_repository import QualityMetricsEnum
@@ -26,57 +30,112 @@ from fedot.core.visualisation.opt_viz import PipelineEvolutionVisualiser, PlotTy
 class OptHistory:
     """
     Contain history, convert Pipeline to PipelineTemplate, save history to csv
+
+    :param objective: objective of the optimisation
+    :param save_folder: folder to save the results of the generations
+    :param storage_path: path to the JSON-lines file to stream the generations to (see :class:`GenerationsStorage`).
+    If set, the generations are not kept in memory and are read from the file lazily
     """
 
-    def __init__(self, objective: Objective = None, save_folder: Optional[str] = None):
+    def __init__(self, objective: Objective = None, save_folder: Optional[str] = None,
+                 storage_path: Optional[Union[str, os.PathLike]] = None):
         self._objective = objective or Objective([])
-        self.individuals: List[List[Individual]] = []
-        self.archive_history: List[List[Individual]] = []
+        self.individuals: Union[List[List[Individual]], StoredGenerations] = []
+        self.archive_history: Union[List[List[Individual]], StoredGenerations] = []
+        # Cumulative hit/miss counts of the fitness archive after each generation
+        self.fitness_archive_stats: List[Dict[str, int]] = []
         self.save_folder: Optional[str] = save_folder
+        self._storage: Optional[GenerationsStorage] = None
+        # Copies of the individuals saved in history by their uids, they are shared by the descendants.
+        # The copies are kept only while they are referenced by the history or by the copied descendants
+        self._copied_individuals: 'weakref.WeakValueDictionary[str, Individual]' = weakref.WeakValueDictionary()
+        if storage_path is not None:
+            self._attach_storage(GenerationsStorage.create(storage_path, self._objective, save_folder))
+
+    def __getstate__(self):
+        # Weak references are not pickled, the copies of the next generations are shared anew
+        state = self.__dict__.copy()
+        del state['_copied_individuals']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._copied_individuals = weakref.WeakValueDictionary()
+
+    @property
+    def storage(self) -> Optional[GenerationsStorage]:
+        return self._storage
 
     def is_empty(self) -> bool:
         return not self.individuals
 
     def add_to_history(self, individuals: List[Individual]):
-        new_inds = deepcopy(individuals)
-        self.individuals.append(new_inds)
+        self.individuals.append(self._copy_individuals(individuals))
 
     def add_to_archive_history(self, individuals: List[Individual]):
-        new_inds = deepcopy(individuals)
-        self.archive_history.append(new_inds)
+        self.archive_history.append(self._copy_individuals(individuals))
+
+    def add_fitness_archive_stats(self, fitness_archive: FitnessArchive):
+        self.fitness_archive_stats.append(fitness_archive.stats)
+        if self._storage is not None:
+            self._storage.append_fitness_archive_stats(fitness_archive.stats)
+
+    def _attach_storage(self, storage: GenerationsStorage):
+        self._storage = storage
+        self.individuals = storage.generations(INDIVIDUALS_KIND)
+        self.archive_history = storage.generations(ARCHIVE_KIND)
+
+    def _copy_individuals(self, individuals: List[Individual]) -> List[Individual]:
+        if self._storage is not None:
+            # Individuals are serialized by the storage right away
+            return individuals
+        return [self._copy_individual(ind) for ind in individuals]
+
+    def _copy_individual(self, individual: Individual) -> Individual:
+        """ Copies the graph and the fitness of the individual. Unlike the deepcopy, the parents
+        that are already saved in history are referenced instead of copying the whole ancestry again """
+        copied = copy(individual)
+        copied.graph = deepcopy(individual.graph)
+        copied.fitness = deepcopy(individual.fitness)
+        copied.metadata = deepcopy(individual.metadata)
+        copied.parent_operators = [
+            replace(parent_op, parent_individuals=[self._copied_parent(parent_ind)
+                                                   for parent_ind in parent_op.parent_individuals])
+            for parent_op in individual.parent_operators
+        ]
+        self._copied_individuals.setdefault(individual.uid, copied)
+        return copied
+
+    def _copied_parent(self, parent: Individual) -> Individual:
+        copied = self._copied_individuals.get(parent.uid)
+        if copied is None:
+            copied = self._copy_individual(parent)
+        return copied
 
     def write_composer_history_to_csv(self, file='history.csv'):
         history_dir = self._get_save_path()
         file = os.path.join(history_dir, file)
         if not os.path.isdir(history_dir):
             os.mkdir(history_dir)
-        self._write_header_to_csv(file)
-        idx = 0
-        adapter = PipelineAdapter()
-        for gen_num, gen_inds in enumerate(self.individuals):
-            for ind_num, ind in enumerate(gen_inds):
-                ind_pipeline_template = adapter.restore_as_template(ind.graph, ind.metadata)
-                row = [
-                    idx, gen_num, ind.fitness.values,
-                    len(ind_pipeline_template.operation_templates), ind_pipeline_template.depth, ind.metadata
-                ]
-                self._add_history_to_csv(file, row)
-                idx += 1
-
-    def _write_header_to_csv(self, f):
-        with open(f, 'w', newline='') as file:
-            writer = csv.writer(file, quoting=csv.QUOTE_ALL)
-            metric_str = 'metric'
-            if self._objective.is_multi_objective:
-                metric_str += 's'
-            row = ['index', 'generation', metric_str, 'quantity_of_operations', 'depth', 'metadata']
-            writer.writerow(row)
-
-    @staticmethod
-    def _add_history_to_csv(f: str, row: List[Any]):
-        with open(f, 'a', newline='') as file:
-            writer = csv.writer(file, quoting=csv.QUOTE_ALL)
-            writer.writerow(row)
+        with open(file, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file, quoting=csv.QUOTE_ALL)
+            writer.writerow(self._csv_header())
+            idx = 0
+            adapter = PipelineAdapter()
+            for gen_num, gen_inds in enumerate(self.individuals):
+                for ind in gen_inds:
+                    ind_pipeline_template = adapter.restore_as_template(ind.graph, ind.metadata)
+                    writer.writerow([
+                        idx, gen_num, ind.fitness.values,
+                        len(ind_pipeline_template.operation_templates), ind_pipeline_template.depth, ind.metadata
+                    ])
+                    idx += 1
+
+    def _csv_header(self) -> List[str]:
+        metric_str = 'metric'
+        if self._objective.is_multi_objective:
+            metric_str += 's'
+        return ['index', 'generation', metric_str, 'quantity_of_operations', 'depth', 'metadata']
 
     def save_current_results(self, path: Optional[str] = None):
         if not path:
@@ -105,7 +164,11 @@ class OptHistory:
 
     @staticmethod
     def load(json_str_or_file_path: Union[str, os.PathLike] = None) -> 'OptHistory':
+        """ Loads the history saved by :meth:`save` or streamed to the storage file.
+        The generations of the storage are read lazily on access """
         def load_as_file_path():
+            if GenerationsStorage.is_storage_file(json_str_or_file_path):
+                return OptHistory._load_storage(json_str_or_file_path)
             with open(json_str_or_file_path, mode='r') as json_file:
                 return json.load(json_file, cls=Serializer)
 
@@ -120,6 +183,15 @@ class OptHistory:
         except json.JSONDecodeError:
             return load_as_file_path()
 
+    @staticmethod
+    def _load_storage(path: Union[str, os.PathLike]) -> 'OptHistory':
+        storage = GenerationsStorage.open(path)
+        header = storage.header()
+        history = OptHistory(header['objective'], header['save_folder'])
+        history._attach_storage(storage)
+        history.fitness_archive_stats = storage.fitness_archive_stats()
+        return history
+
     def clean_results(self, path: Optional[str] = None):
         if not path and self.save_folder is not None:
             path = os.path.join(default_fedot_data_dir(), self.save_folder)
@@ -282,14 +354,18 @@ class OptHistory:
                                   f'{individual.graph.descriptive_id}']))
 
 
-def log_to_history(history: OptHistory, population: PopulationT, generations: GenerationKeeper):
+def log_to_history(history: OptHistory, population: PopulationT, generations: GenerationKeeper,
+                   fitness_archive: Optional[FitnessArchive] = None):
     """
     Default variant of callback that preserves optimisation history
     :param history: OptHistory for logging
     :param population: list of individuals obtained in last iteration
     :param generations: keeper of the best individuals from all iterations
+    :param fitness_archive: optional archive of evaluated fitness which hit/miss counts are logged
     """
     history.add_to_history(population)
     history.add_to_archive_history(generations.best_individuals)
+    if fitness_archive is not None:
+        history.add_fitness_archive_stats(fitness_archive)
     if history.save_folder:
         history.save_current_results()
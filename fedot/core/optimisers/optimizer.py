@@ -13,6 +13,7 @@ from fedot.core.optimisers.graph import OptGraph
 from fedot.core.optimisers.objective import Objective, ObjectiveFunction, GraphFunction
 from fedot.core.dag.graph_verifier import GraphVerifier, VerifierRuleType
 from fedot.core.utilities.data_structures import ensure_wrapped_in_sequence
+from fedot.core.utilities.worker_pool import WorkerPool
 
 OptimisationCallback = Callable[[PopulationT, GenerationKeeper], Any]
 
@@ -123,3 +124,8 @@ class GraphOptimiser:
         """Set or reset (with None) post-evaluation callback
         that's called on each graph after its evaluation."""
         pass
+
+    def set_worker_pool(self, worker_pool: Optional[WorkerPool]):
+        """Set or reset (with None) the pool of worker processes
+        shared with the other stages of composing."""
+        pass
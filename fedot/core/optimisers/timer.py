@@ -31,6 +31,13 @@ class Timer(ABC):
     def seconds_from_start(self) -> float:
         return self.spent_time.total_seconds()
 
+    @property
+    def seconds_left(self) -> Optional[float]:
+        """ Seconds remaining until the time limit (None if there is no limit) """
+        if self.timeout is None:
+            return None
+        return max((self.timeout - self.spent_time).total_seconds(), 0.)
+
     def is_time_limit_reached(self) -> bool:
         self.process_terminated = False
         if self.timeout is not None:
@@ -0,0 +1,34 @@
+from typing import TYPE_CHECKING, Dict, Optional
+
+from fedot.core.data.data import OutputData
+
+if TYPE_CHECKING:
+    from fedot.core.pipelines.node import Node
+
+
+class ExecutionContext:
+    """
+    Context of a single fit or predict pass through the pipeline.
+    Memoizes the outputs of the nodes, so each node is run exactly once per pass
+    even if it is the parent of several nodes. Nodes are identified by the object identity,
+    because copied nodes may have the same uid
+
+    :param mode: type of the pass ('fit' or 'predict')
+    """
+
+    def __init__(self, mode: str = 'fit'):
+        self.mode = mode
+        self._outputs: Dict[int, OutputData] = {}
+
+    def get_output(self, node: 'Node') -> Optional[OutputData]:
+        """ Returns memoized output of the node or None if the node was not run during this pass """
+        return self._outputs.get(id(node))
+
+    def save_output(self, node: 'Node', output: OutputData):
+        self._outputs[id(node)] = output
+
+    def __contains__(self, node: 'Node') -> bool:
+        return id(node) in self._outputs
+
+    def __len__(self) -> int:
+        return len(self._outputs)
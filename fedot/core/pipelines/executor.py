@@ -0,0 +1,221 @@
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from multiprocessing.pool import Pool
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from fedot.core.dag.node_operator import NodeOperator
+from fedot.core.data.data import InputData, OutputData
+from fedot.core.pipelines.execution_context import ExecutionContext
+from fedot.core.pipelines.node import Node, PrimaryNode
+from fedot.core.utilities.worker_pool import WorkerPool
+
+if TYPE_CHECKING:
+    from fedot.core.pipelines.pipeline import Pipeline
+
+BACKENDS = ('thread', 'process')
+
+
+class LevelParallelExecutor:
+    """
+    Executor for the pipeline that splits the nodes into topological levels and
+    fits (or applies) the independent nodes of each level concurrently.
+    Outputs of the nodes are shared between the levels through the ExecutionContext,
+    so each node is run exactly once per pass.
+
+    :param n_jobs: number of workers for concurrent run of the nodes (-1 for use all cpu's)
+    :param backend: 'thread' for the thread pool or 'process' for the process pool.
+    With the process backend fitted operations are transferred back from the workers, so they must be picklable
+    :param worker_pool: shared pool of worker processes for the process backend
+    (if None, the own pool is started for each pass)
+    """
+
+    def __init__(self, n_jobs: int = -1, backend: str = 'thread', worker_pool: Optional[WorkerPool] = None):
+        if backend not in BACKENDS:
+            raise ValueError(f'Unknown executor backend {backend}. Available backends: {BACKENDS}')
+        if n_jobs == -1:
+            n_jobs = multiprocessing.cpu_count()
+        self.n_jobs = max(n_jobs, 1)
+        self.backend = backend
+        self.worker_pool = worker_pool
+
+    def n_jobs_per_node(self, n_jobs: int) -> int:
+        """ Returns the number of jobs for the operations of the nodes,
+        so the concurrently fitted nodes do not oversubscribe the cpu's """
+        if n_jobs == -1:
+            n_jobs = multiprocessing.cpu_count()
+        return max(n_jobs // self.n_jobs, 1)
+
+    def fit(self, pipeline: 'Pipeline', input_data: Optional[InputData]) -> OutputData:
+        """
+        Run training process in all nodes of the pipeline level by level
+
+        :param pipeline: pipeline to fit
+        :param input_data: data used for operation training (None if data was assigned to the primary nodes)
+        :return: output of the root node
+        """
+        context = ExecutionContext(mode='fit')
+        return self._run(pipeline, input_data, context)
+
+    def predict(self, pipeline: 'Pipeline', input_data: Optional[InputData],
+                output_mode: str = 'default') -> OutputData:
+        """
+        Run the predict process in all nodes of the pipeline level by level
+
+        :param pipeline: fitted pipeline
+        :param input_data: data for prediction (None if data was assigned to the primary nodes)
+        :param output_mode: desired form of output for the root node
+        :return: output of the root node
+        """
+        context = ExecutionContext(mode='predict')
+        return self._run(pipeline, input_data, context, output_mode)
+
+    def _run(self, pipeline: 'Pipeline', input_data: Optional[InputData],
+             context: ExecutionContext, output_mode: str = 'default') -> OutputData:
+        root = pipeline.root_node
+        levels = topological_levels(pipeline.nodes)
+
+        if self.n_jobs == 1 or max(map(len, levels)) == 1:
+            # There are no independent nodes, so the pool is redundant
+            for level in levels:
+                for node in level:
+                    node_output_mode = output_mode if node is root else 'default'
+                    context.save_output(node, _run_node(node, input_data, context, node_output_mode))
+            return context.get_output(root)
+
+        with self._get_executor() as pool:
+            for level in levels:
+                outputs = self._run_level(pool, level, root, input_data, context, output_mode)
+                # Outputs are saved only after the whole level is completed
+                # so the nodes of the same level do not see each other
+                for node, output in zip(level, outputs):
+                    context.save_output(node, output)
+        return context.get_output(root)
+
+    def _get_executor(self) -> Executor:
+        if self.backend == 'thread':
+            return ThreadPoolExecutor(max_workers=self.n_jobs)
+        if self.worker_pool is not None:
+            return _WorkerPoolExecutor(self.worker_pool.get())
+        return ProcessPoolExecutor(max_workers=self.n_jobs)
+
+    def _run_level(self, pool: Executor, level: List[Node], root: Node, input_data: Optional[InputData],
+                   context: ExecutionContext, output_mode: str) -> List[OutputData]:
+        futures = []
+        for node in level:
+            node_output_mode = output_mode if node is root else 'default'
+            if self.backend == 'thread':
+                futures.append(pool.submit(_run_node, node, input_data, context, node_output_mode))
+            else:
+                node_input = _prepare_node_input(node, input_data, context)
+                futures.append(pool.submit(_run_detached_node, _detached_copy(node),
+                                           node_input, context.mode, node_output_mode))
+
+        outputs = []
+        for node, future in zip(level, futures):
+            if self.backend == 'thread':
+                outputs.append(future.result())
+            else:
+                output, state = future.result()
+                _restore_node_state(node, state)
+                outputs.append(output)
+        return outputs
+
+
+class _WorkerPoolExecutor(Executor):
+    """ Executor interface for the shared pool of worker processes.
+    The pool is not stopped on the exit, because it belongs to its owner """
+
+    def __init__(self, pool: Pool):
+        self._pool = pool
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+        self._pool.apply_async(fn, args, kwargs, callback=future.set_result, error_callback=future.set_exception)
+        return future
+
+
+def topological_levels(nodes: List[Node]) -> List[List[Node]]:
+    """
+    Splits the nodes of the graph into levels, so each node is placed strictly after all its parents
+    and the nodes of the same level are independent of each other
+
+    :param nodes: nodes of the graph
+    :return: list of levels starting from the primary nodes
+    """
+    # nodes are identified by the object identity, because copied nodes may have the same uid
+    level_by_id: Dict[int, int] = {}
+    for node in nodes:
+        stack = [node]
+        in_progress = set()
+        while stack:
+            current = stack[-1]
+            if id(current) in level_by_id:
+                stack.pop()
+                continue
+            parents = current.nodes_from or []
+            unknown_parents = [parent for parent in parents if id(parent) not in level_by_id]
+            if unknown_parents:
+                if id(current) in in_progress:
+                    raise ValueError('Graph has cycle')
+                in_progress.add(id(current))
+                stack.extend(unknown_parents)
+                continue
+            level_by_id[id(current)] = 1 + max((level_by_id[id(parent)] for parent in parents), default=-1)
+            in_progress.discard(id(current))
+            stack.pop()
+
+    levels = [[] for _ in range(max(level_by_id.values(), default=-1) + 1)]
+    for node in nodes:
+        levels[level_by_id[id(node)]].append(node)
+    return levels
+
+
+def _run_node(node: Node, input_data: Optional[InputData], context: ExecutionContext,
+              output_mode: str = 'default') -> OutputData:
+    """ Runs the node with all parents outputs already stored in the context """
+    if context.mode == 'fit':
+        return node.fit(input_data=input_data, context=context)
+    return node.predict(input_data=input_data, output_mode=output_mode, context=context)
+
+
+def _prepare_node_input(node: Node, input_data: Optional[InputData], context: ExecutionContext) -> InputData:
+    """ Obtains the input of the node in the same way as the node itself does it during the fit or predict """
+    if isinstance(node, PrimaryNode):
+        if node.direct_set:
+            return node.node_data
+        node.node_data = input_data
+        return input_data
+    return node._input_from_parents(input_data=input_data, parent_operation=context.mode, context=context)
+
+
+def _detached_copy(node: Node) -> Node:
+    """ Returns shallow copy of the node without links to the other nodes and data,
+    so only the node itself is transferred to the worker process """
+    detached = copy(node)
+    detached.nodes_from = None
+    detached._operator = NodeOperator(detached)
+    if isinstance(detached, PrimaryNode):
+        detached.node_data = None
+    return detached
+
+
+def _run_detached_node(node: Node, node_input: InputData, mode: str,
+                       output_mode: str = 'default') -> Tuple[OutputData, dict]:
+    """ Runs the operation of the detached node in the worker and returns its output with the fitted state """
+    if mode == 'fit':
+        output = Node.fit(node, node_input)
+    else:
+        output = Node.predict(node, node_input, output_mode)
+    state = {'fitted_operation': node.fitted_operation,
+             'params': node.content['params'],
+             'fit_time_in_seconds': node.fit_time_in_seconds,
+             'inference_time_in_seconds': node.inference_time_in_seconds}
+    return output, state
+
+
+def _restore_node_state(node: Node, state: dict):
+    node.fitted_operation = state['fitted_operation']
+    node.content['params'] = state['params']
+    node.fit_time_in_seconds = state['fit_time_in_seconds']
+    node.inference_time_in_seconds = state['inference_time_in_seconds']
@@ -8,6 +8,7 @@ from fedot.core.log import Log, default_log
 from fedot.core.operations.factory import OperationFactory
 from fedot.core.operations.operation import Operation
 from fedot.core.optimisers.timer import Timer
+from fedot.core.pipelines.execution_context import ExecutionContext
 from fedot.core.repository.default_params_repository import DefaultOperationParamsRepository
 from fedot.core.repository.operation_types_repository import OperationTypesRepository
 from fedot.core.utils import DEFAULT_PARAMS_STUB
@@ -257,11 +258,12 @@ class PrimaryNode(Node):
             # Was the data passed directly to the node or not
             self.direct_set = True
 
-    def fit(self, input_data: InputData, **kwargs) -> OutputData:
+    def fit(self, input_data: InputData, context: Optional[ExecutionContext] = None, **kwargs) -> OutputData:
         """
         Fit the operation located in the primary node
 
         :param input_data: data used for operation training
+        :param context: context of the current pipeline pass (not used by primary nodes)
         """
         self.log.ext_debug(f'Trying to fit primary node with operation: {self.operation}')
 
@@ -277,12 +279,13 @@ class PrimaryNode(Node):
             self.node_data = None
 
     def predict(self, input_data: InputData,
-                output_mode: str = 'default') -> OutputData:
+                output_mode: str = 'default', context: Optional[ExecutionContext] = None) -> OutputData:
         """
         Predict using the operation located in the primary node
 
         :param input_data: data used for prediction
         :param output_mode: desired output for operations (e.g. labels, probs, full_probs)
+        :param context: context of the current pipeline pass (not used by primary nodes)
         """
         self.log.ext_debug(f'Predict in primary node by operation: {self.operation}')
 
@@ -327,34 +330,40 @@ class SecondaryNode(Node):
             nodes_from = []
         super().__init__(nodes_from=nodes_from, operation_type=operation_type, **kwargs)
 
-    def fit(self, input_data: InputData, **kwargs) -> OutputData:
+    def fit(self, input_data: InputData, context: Optional[ExecutionContext] = None, **kwargs) -> OutputData:
         """
         Fit the operation located in the secondary node
 
         :param input_data: data used for operation training
+        :param context: context of the current pipeline pass with memoized outputs of already fitted nodes
         """
         self.log.ext_debug(f'Trying to fit secondary node with operation: {self.operation}')
 
-        secondary_input = self._input_from_parents(input_data=input_data, parent_operation='fit')
+        secondary_input = self._input_from_parents(input_data=input_data, parent_operation='fit',
+                                                   context=context)
 
         return super().fit(input_data=secondary_input)
 
-    def predict(self, input_data: InputData, output_mode: str = 'default') -> OutputData:
+    def predict(self, input_data: InputData, output_mode: str = 'default',
+                context: Optional[ExecutionContext] = None) -> OutputData:
         """
         Predict using the operation located in the secondary node
 
         :param input_data: data used for prediction
         :param output_mode: desired output for operations (e.g. labels, probs, full_probs)
+        :param context: context of the current pipeline pass with memoized outputs of already applied nodes
         """
         self.log.ext_debug(f'Obtain prediction in secondary node with operation: {self.operation}')
 
         secondary_input = self._input_from_parents(input_data=input_data,
-                                                   parent_operation='predict')
+                                                   parent_operation='predict',
+                                                   context=context)
 
         return super().predict(input_data=secondary_input, output_mode=output_mode)
 
     def _input_from_parents(self, input_data: InputData,
-                            parent_operation: str) -> InputData:
+                            parent_operation: str,
+                            context: Optional[ExecutionContext] = None) -> InputData:
         if len(self.nodes_from) == 0:
             raise ValueError('No parent nodes found')
 
@@ -363,7 +372,7 @@ class SecondaryNode(Node):
         parent_nodes = self._nodes_from_with_fixed_order()
 
         parent_results, target = _combine_parents(parent_nodes, input_data,
-                                                  parent_operation)
+                                                  parent_operation, context)
 
         secondary_input = DataMerger.get(parent_results, log=self.log).merge()
 
@@ -381,7 +390,8 @@ class SecondaryNode(Node):
 
 def _combine_parents(parent_nodes: List[Node],
                      input_data: InputData,
-                     parent_operation: str):
+                     parent_operation: str,
+                     context: Optional[ExecutionContext] = None):
     """
     Method for combining predictions from parent node or nodes
 
@@ -389,6 +399,8 @@ def _combine_parents(parent_nodes: List[Node],
     be combined
     :param input_data: input data from pipeline abstraction (source input data)
     :param parent_operation: name of parent operation (fit or predict)
+    :param context: context of the current pipeline pass. If it is set, each parent
+    is run only once and its output is reused by the other children
     :return parent_results: list with OutputData from parent nodes
     :return target: target for final pipeline prediction
     """
@@ -398,14 +410,17 @@ def _combine_parents(parent_nodes: List[Node],
         target = input_data.target
     parent_results = []
     for parent in parent_nodes:
-        if parent_operation == 'predict':
-            prediction = parent.predict(input_data=input_data)
-            parent_results.append(prediction)
-        elif parent_operation == 'fit':
-            prediction = parent.fit(input_data=input_data)
-            parent_results.append(prediction)
-        else:
-            raise NotImplementedError()
+        prediction = context.get_output(parent) if context is not None else None
+        if prediction is None:
+            if parent_operation == 'predict':
+                prediction = parent.predict(input_data=input_data, context=context)
+            elif parent_operation == 'fit':
+                prediction = parent.fit(input_data=input_data, context=context)
+            else:
+                raise NotImplementedError()
+            if context is not None:
+                context.save_output(parent, prediction)
+        parent_results.append(prediction)
 
         if input_data is None:
             # InputData was set to primary nodes
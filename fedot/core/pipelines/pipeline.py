@@ -1,6 +1,6 @@
 from copy import deepcopy
 from datetime import timedelta
-from typing import Callable, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
 
 import func_timeout
 
@@ -14,12 +14,17 @@ from fedot.core.log import Log, default_log
 from fedot.core.operations.data_operation import DataOperation
 from fedot.core.operations.model import Model
 from fedot.core.optimisers.timer import Timer
+from fedot.core.pipelines.execution_context import ExecutionContext
 from fedot.core.pipelines.node import Node, PrimaryNode, SecondaryNode
 from fedot.core.pipelines.template import PipelineTemplate
 from fedot.core.pipelines.tuning.unified import PipelineTuner
 from fedot.core.repository.tasks import TaskTypesEnum
+from fedot.core.utilities.worker_pool import WorkerPool
 from fedot.preprocessing.preprocessing import DataPreprocessor, update_indices_for_time_series
 
+if TYPE_CHECKING:
+    from fedot.core.pipelines.executor import LevelParallelExecutor
+
 ERROR_PREFIX = 'Invalid pipeline configuration:'
 
 
@@ -74,7 +79,8 @@ class Pipeline(Graph):
         self.fit(input_data, use_fitted=False)
 
     def _fit_with_time_limit(self, input_data: Optional[InputData] = None, use_fitted_operations=False,
-                             time: int = 3):
+                             time: int = 3, executor: Optional['LevelParallelExecutor'] = None,
+                             context: Optional[ExecutionContext] = None):
         """
         Run training process with time limit. Create
 
@@ -82,6 +88,8 @@ class Pipeline(Graph):
         :param use_fitted_operations: flag defining whether use saved information about previous executions or not,
         default True
         :param time: time constraint for operation fitting process (seconds)
+        :param executor: executor for the level-parallel fit of the nodes (None for the sequential fit)
+        :param context: context of the fit pass with the outputs of the already fitted nodes
         """
         time = int(timedelta(minutes=time).total_seconds())
         process_state_dict = {}
@@ -89,7 +97,7 @@ class Pipeline(Graph):
         try:
             func_timeout.func_timeout(
                 time, self._fit,
-                args=(input_data, use_fitted_operations, process_state_dict, fitted_operations)
+                args=(input_data, use_fitted_operations, process_state_dict, fitted_operations, executor, context)
             )
         except func_timeout.FunctionTimedOut:
             raise TimeoutError(f'Pipeline fitness evaluation time limit is expired')
@@ -100,7 +108,8 @@ class Pipeline(Graph):
         return process_state_dict['train_predicted']
 
     def _fit(self, input_data: InputData, use_fitted_operations=False, process_state_dict: dict = None,
-             fitted_operations: list = None):
+             fitted_operations: list = None, executor: Optional['LevelParallelExecutor'] = None,
+             context: Optional[ExecutionContext] = None):
         """
         Run training process in all nodes in pipeline starting with root.
 
@@ -110,12 +119,20 @@ class Pipeline(Graph):
         :param process_state_dict: this dictionary is used for saving required pipeline parameters (which were changed
         inside the process) in a case of operation fit time control (when process created)
         :param fitted_operations: this list is used for saving fitted operations of pipeline nodes
+        :param executor: executor for the level-parallel fit of the nodes (None for the sequential fit)
+        :param context: context of the fit pass with the outputs of the already fitted nodes
+        (they are not fitted again), new context is used if None
         """
 
         with Timer(log=self.log) as t:
             computation_time_update = not use_fitted_operations or not self.root_node.fitted_operation or \
                                       self.computation_time is None
-            train_predicted = self.root_node.fit(input_data=input_data)
+            if executor is None:
+                if context is None:
+                    context = ExecutionContext(mode='fit')
+                train_predicted = self.root_node.fit(input_data=input_data, context=context)
+            else:
+                train_predicted = executor.fit(self, input_data)
             if computation_time_update:
                 self.computation_time = round(t.minutes_from_start, 3)
 
@@ -128,7 +145,9 @@ class Pipeline(Graph):
                 fitted_operations.append(node.fitted_operation)
 
     def fit(self, input_data: Union[InputData, MultiModalData], use_fitted=False,
-            time_constraint: Optional[timedelta] = None, n_jobs=1) -> OutputData:
+            time_constraint: Optional[timedelta] = None, n_jobs=1,
+            executor: Optional['LevelParallelExecutor'] = None,
+            context: Optional[ExecutionContext] = None) -> OutputData:
         """
         Run training process in all nodes in pipeline starting with root.
 
@@ -136,8 +155,15 @@ class Pipeline(Graph):
         :param use_fitted: flag defining whether use saved information about previous fits or not
         :param time_constraint: time constraint for operation fitting (seconds)
         :param n_jobs: number of threads for nodes fitting
+        :param executor: executor for the concurrent fit of the independent nodes.
+        If it is set, n_jobs are split between the concurrently fitted nodes
+        :param context: context of the fit pass with the outputs of the already fitted nodes
+        (they are not fitted again and their fitted operations should be restored by the caller),
+        it is not used by the executor
 
         """
+        if executor is not None:
+            n_jobs = executor.n_jobs_per_node(n_jobs)
         _replace_n_jobs_in_nodes(self, n_jobs)
 
         if not use_fitted:
@@ -145,8 +171,8 @@ class Pipeline(Graph):
         else:
             self.unfit(mode='data_operations', unfit_preprocessor=False)
 
-        # Make copy of the input data to avoid performing inplace operations
-        copied_input_data = deepcopy(input_data)
+        # Make copy of the input data to avoid performing inplace operations (arrays are shared as read-only views)
+        copied_input_data = input_data.view()
         copied_input_data = self.preprocessor.obligatory_prepare_for_fit(copied_input_data)
         # Make additional preprocessing if it is needed
         copied_input_data = self.preprocessor.optional_prepare_for_fit(pipeline=self,
@@ -159,11 +185,15 @@ class Pipeline(Graph):
 
         if time_constraint is None:
             train_predicted = self._fit(input_data=copied_input_data,
-                                        use_fitted_operations=use_fitted)
+                                        use_fitted_operations=use_fitted,
+                                        executor=executor,
+                                        context=context)
         else:
             train_predicted = self._fit_with_time_limit(input_data=copied_input_data,
                                                         use_fitted_operations=use_fitted,
-                                                        time=time_constraint)
+                                                        time=time_constraint,
+                                                        executor=executor,
+                                                        context=context)
         return train_predicted
 
     @property
@@ -189,7 +219,9 @@ class Pipeline(Graph):
     def fit_from_cache(self, cache: Optional[OperationsCache], fold_num: Optional[int] = None) -> bool:
         return cache.try_load_into_pipeline(self, fold_num) if cache is not None else False
 
-    def predict(self, input_data: Union[InputData, MultiModalData], output_mode: str = 'default') -> OutputData:
+    def predict(self, input_data: Union[InputData, MultiModalData], output_mode: str = 'default',
+                executor: Optional['LevelParallelExecutor'] = None,
+                context: Optional[ExecutionContext] = None) -> OutputData:
         """
         Run the predict process in all nodes in pipeline starting with root.
 
@@ -199,6 +231,9 @@ class Pipeline(Graph):
                 'labels' (numbers of classes - for classification) ,
                 'probs' (probabilities - for classification == 'default'),
                 'full_probs' (return all probabilities - for binary classification).
+        :param executor: executor for the concurrent predict of the independent nodes
+        :param context: context of the predict pass with the outputs of the already applied nodes,
+        it is not used by the executor
         :return: OutputData with prediction
         """
 
@@ -207,8 +242,8 @@ class Pipeline(Graph):
             self.log.error(ex)
             raise ValueError(ex)
 
-        # Make copy of the input data to avoid performing inplace operations
-        copied_input_data = deepcopy(input_data)
+        # Make copy of the input data to avoid performing inplace operations (arrays are shared as read-only views)
+        copied_input_data = input_data.view()
         copied_input_data = self.preprocessor.obligatory_prepare_for_predict(copied_input_data)
         # Make additional preprocessing if it is needed
         copied_input_data = self.preprocessor.optional_prepare_for_predict(pipeline=self,
@@ -219,7 +254,12 @@ class Pipeline(Graph):
 
         copied_input_data = self._assign_data_to_nodes(copied_input_data)
 
-        result = self.root_node.predict(input_data=copied_input_data, output_mode=output_mode)
+        if executor is None:
+            if context is None:
+                context = ExecutionContext(mode='predict')
+            result = self.root_node.predict(input_data=copied_input_data, output_mode=output_mode, context=context)
+        else:
+            result = executor.predict(self, copied_input_data, output_mode=output_mode)
 
         result = self.preprocessor.restore_index(copied_input_data, result)
         # Prediction should be converted into source labels (if it is needed)
@@ -232,10 +272,15 @@ class Pipeline(Graph):
                             input_data: Union[InputData, MultiModalData] = None,
                             iterations=50, timeout: Optional[float] = 5,
                             cv_folds: int = None,
-                            validation_blocks: int = 3) -> 'Pipeline':
+                            validation_blocks: int = 3,
+                            worker_pool: Optional[WorkerPool] = None,
+                            batch_size: int = 1) -> 'Pipeline':
         """ Tune all hyperparameters of nodes simultaneously via black-box
             optimization using PipelineTuner. For details, see
         :meth:`~fedot.core.pipelines.tuning.unified.PipelineTuner.tune_pipeline`
+
+        :param worker_pool: pool of worker processes for the concurrent validation of the folds
+        :param batch_size: number of the trials evaluated concurrently on the worker pool
         """
         # Make copy of the input data to avoid performing inplace operations
         copied_input_data = deepcopy(input_data)
@@ -245,7 +290,9 @@ class Pipeline(Graph):
         pipeline_tuner = PipelineTuner(pipeline=self,
                                        task=copied_input_data.task,
                                        iterations=iterations,
-                                       timeout=timeout)
+                                       timeout=timeout,
+                                       worker_pool=worker_pool,
+                                       batch_size=batch_size)
         self.log.info('Start pipeline tuning')
 
         tuned_pipeline = pipeline_tuner.tune_pipeline(input_data=copied_input_data,
@@ -282,7 +329,7 @@ class Pipeline(Graph):
         self.template.import_pipeline(source, dict_fitted_operations)
 
     def __eq__(self, other) -> bool:
-        return self.root_node.descriptive_id == other.root_node.descriptive_id
+        return self.root_node.structural_hash == other.root_node.structural_hash
 
     def __str__(self):
         description = {
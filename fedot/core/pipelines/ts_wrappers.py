@@ -35,6 +35,13 @@ def out_of_sample_ts_forecast(pipeline, input_data: InputData,
         scope_len = task.task_params.forecast_length
         number_of_iterations = _calculate_number_of_steps(scope_len, horizon)
 
+        # Predictions are added to the historical data in the buffer,
+        # so the time series of the iterations are the prefixes of the same array
+        history_len = len(pre_history_ts)
+        history_buffer = np.empty(history_len + number_of_iterations * scope_len,
+                                  dtype=np.result_type(pre_history_ts.dtype, float))
+        history_buffer[:history_len] = pre_history_ts
+
         # Make forecast iteratively moving throw the horizon
         final_forecast = []
         for _ in range(0, number_of_iterations):
@@ -43,10 +50,11 @@ def out_of_sample_ts_forecast(pipeline, input_data: InputData,
             final_forecast.append(iter_predict)
 
             # Add prediction to the historical data - update it
-            pre_history_ts = np.hstack((pre_history_ts, iter_predict))
+            history_buffer = _append_to_buffer(history_buffer, history_len, iter_predict)
+            history_len += len(iter_predict)
 
             # Prepare InputData for next iteration
-            input_data = _update_input(pre_history_ts, scope_len, task)
+            input_data = _update_input(history_buffer[:history_len], scope_len, task)
     elif isinstance(input_data, MultiModalData):
         data = MultiModalData()
         for data_id in input_data.keys():
@@ -283,6 +291,17 @@ def _update_input(pre_history_ts, scope_len, task):
     return input_data
 
 
+def _append_to_buffer(buffer: np.array, filled_len: int, values: np.array) -> np.array:
+    """ Writes the values after the filled part of the buffer extending it if necessary """
+    required_len = filled_len + len(values)
+    if required_len > len(buffer):
+        extended_buffer = np.empty(required_len, dtype=buffer.dtype)
+        extended_buffer[:filled_len] = buffer[:filled_len]
+        buffer = extended_buffer
+    buffer[filled_len:required_len] = values
+    return buffer
+
+
 def _calculate_intervals(last_index_pre_history, amount_of_iterations, scope_len):
     """ Function calculate
 
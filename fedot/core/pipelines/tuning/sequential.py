@@ -1,17 +1,24 @@
 from datetime import timedelta
 from functools import partial
-from typing import Callable, ClassVar, Optional
+from typing import Callable, ClassVar, List, Optional
 
-from hyperopt import fmin, space_eval, tpe
+from hyperopt import tpe
 
 from fedot.core.log import Log
 from fedot.core.pipelines.tuning.search_space import SearchSpace, convert_params
 from fedot.core.pipelines.tuning.tuner_interface import HyperoptTuner, _greater_is_better
+from fedot.core.pipelines.tuning.unified import PipelineTuner
+from fedot.core.utilities.worker_pool import WorkerPool
 
 
 class SequentialTuner(HyperoptTuner):
     """
     Class for hyperparameters optimization for all nodes sequentially
+
+    If batch_size is more than 1, the independent nodes (none of them is an ancestor of another one)
+    are tuned concurrently in the joint search space (see :meth:`get_independent_groups`),
+    so the batches of the trials are evaluated on the worker pool for all of them at once.
+    As TPE models each hyperparameter separately, the joint search is close to the separate ones.
     """
 
     def __init__(self, pipeline, task,
@@ -19,13 +26,17 @@ class SequentialTuner(HyperoptTuner):
                  timeout: timedelta = timedelta(minutes=5),
                  inverse_node_order=False, log: Optional[Log] = None,
                  search_space: ClassVar = SearchSpace(),
-                 algo: Callable = tpe.suggest):
+                 algo: Callable = tpe.suggest,
+                 worker_pool: Optional[WorkerPool] = None,
+                 batch_size: int = 1):
         super().__init__(pipeline=pipeline, task=task,
                          iterations=iterations, early_stopping_rounds=early_stopping_rounds,
                          timeout=timeout,
                          log=log,
                          search_space=search_space,
-                         algo=algo)
+                         algo=algo,
+                         worker_pool=worker_pool,
+                         batch_size=batch_size)
         self.inverse_node_order = inverse_node_order
 
     def tune_pipeline(self, input_data, loss_function, loss_params=None,
@@ -55,20 +66,24 @@ class SequentialTuner(HyperoptTuner):
         else:
             seconds_per_node = None
 
-        # Tuning performed sequentially for every node - so get ids of nodes
+        # Tuning performed sequentially for every node (or group of independent nodes) - so get ids of nodes
         nodes_ids = self.get_nodes_order(nodes_number=nodes_amount)
-        for node_id in nodes_ids:
-            node = self.pipeline.nodes[node_id]
-            operation_name = node.operation.operation_type
-
-            # Get node's parameters to optimize
-            node_params = self.search_space.get_node_params(node_id=node_id,
-                                                            operation_name=operation_name)
-
-            if node_params is None:
-                self.log.info(f'"{operation_name}" operation has no parameters to optimize')
-            else:
+        nodes_groups = self.get_independent_groups(nodes_ids) if self.batch_size > 1 else [[i] for i in nodes_ids]
+        for nodes_group in nodes_groups:
+            nodes_params = {}
+            for node_id in nodes_group:
+                operation_name = self.pipeline.nodes[node_id].operation.operation_type
+                # Get node's parameters to optimize
+                node_params = self.search_space.get_node_params(node_id=node_id,
+                                                                operation_name=operation_name)
+                if node_params is None:
+                    self.log.info(f'"{operation_name}" operation has no parameters to optimize')
+                else:
+                    nodes_params[node_id] = node_params
+
+            if len(nodes_params) == 1:
                 # Apply tuning for current node
+                node_id, node_params = next(iter(nodes_params.items()))
                 self._optimize_node(node_id=node_id,
                                     data=input_data,
                                     node_params=node_params,
@@ -76,6 +91,13 @@ class SequentialTuner(HyperoptTuner):
                                     seconds_per_node=seconds_per_node,
                                     loss_function=loss_function,
                                     loss_params=loss_params)
+            elif nodes_params:
+                self._optimize_nodes(data=input_data,
+                                     nodes_params=nodes_params,
+                                     iterations=iterations_per_node * len(nodes_params),
+                                     seconds=seconds_per_node * len(nodes_params) if seconds_per_node else None,
+                                     loss_function=loss_function,
+                                     loss_params=loss_params)
 
         # Validation is the optimization do well
         final_pipeline = self.final_check(data=input_data,
@@ -135,6 +157,26 @@ class SequentialTuner(HyperoptTuner):
 
         return nodes_ids
 
+    def get_independent_groups(self, nodes_ids) -> List[List[int]]:
+        """ Method splits the ordered nodes into the groups where none of the nodes is an ancestor of another one.
+        Each node is placed into the group next to the last group with the connected node,
+        so the connected nodes are tuned in the same order as without grouping """
+        groups = []
+        for node_id in nodes_ids:
+            node = self.pipeline.nodes[node_id]
+            connected_groups = [group_id for group_id, group in enumerate(groups)
+                                if any(self._is_connected(node, self.pipeline.nodes[other_id]) for other_id in group)]
+            group_id = max(connected_groups, default=-1) + 1
+            if group_id < len(groups):
+                groups[group_id].append(node_id)
+            else:
+                groups.append([node_id])
+        return groups
+
+    @staticmethod
+    def _is_connected(node, other_node) -> bool:
+        return node in other_node.ordered_subnodes_hierarchy() or other_node in node.ordered_subnodes_hierarchy()
+
     def _optimize_node(self, node_id, data, node_params, iterations_per_node,
                        seconds_per_node, loss_function, loss_params):
         """
@@ -149,20 +191,15 @@ class SequentialTuner(HyperoptTuner):
 
         :return : updated pipeline with tuned parameters in particular node
         """
-        best_parameters = fmin(partial(self._objective,
-                                       pipeline=self.pipeline,
-                                       node_id=node_id,
-                                       data=data,
-                                       loss_function=loss_function,
-                                       loss_params=loss_params),
-                               node_params,
-                               algo=self.algo,
-                               max_evals=iterations_per_node,
-                               early_stop_fn=self.early_stop_fn,
-                               timeout=seconds_per_node)
-
-        best_parameters = space_eval(space=node_params,
-                                     hp_assignment=best_parameters)
+        best_parameters = self._minimize(partial(self._objective,
+                                                 pipeline=self.pipeline,
+                                                 node_id=node_id,
+                                                 data=data,
+                                                 loss_function=loss_function,
+                                                 loss_params=loss_params),
+                                         node_params,
+                                         max_evals=iterations_per_node,
+                                         timeout=seconds_per_node)
 
         # Set best params for this node in the pipeline
         self.pipeline = self.set_arg_node(pipeline=self.pipeline,
@@ -170,6 +207,32 @@ class SequentialTuner(HyperoptTuner):
                                           node_params=best_parameters)
         return self.pipeline
 
+    def _optimize_nodes(self, data, nodes_params, iterations, seconds, loss_function, loss_params):
+        """
+        Method for concurrent optimization of the independent nodes in the joint search space
+
+        :param data: InputData for validation
+        :param nodes_params: dictionary with ids of the nodes and their parameters
+        :param iterations: amount of iterations to produce
+        :param seconds: amount of seconds to produce
+        :param loss_function: loss function to minimize
+
+        :return : updated pipeline with tuned parameters in the nodes
+        """
+        best_parameters = self._minimize(partial(self._nodes_objective,
+                                                 pipeline=self.pipeline,
+                                                 data=data,
+                                                 loss_function=loss_function,
+                                                 loss_params=loss_params),
+                                         nodes_params,
+                                         max_evals=iterations,
+                                         timeout=seconds)
+
+        # Set best params for these nodes in the pipeline
+        self.pipeline = PipelineTuner.set_arg_pipeline(pipeline=self.pipeline,
+                                                       parameters=best_parameters)
+        return self.pipeline
+
     @staticmethod
     def set_arg_node(pipeline, node_id, node_params):
         """ Method for parameters setting to a pipeline
@@ -208,5 +271,29 @@ class SequentialTuner(HyperoptTuner):
         metric_value = self.get_metric_value(data=data,
                                              pipeline=pipeline,
                                              loss_function=loss_function,
-                                             loss_params=loss_params)
+                                             loss_params=loss_params,
+                                             use_fitted_nodes=True)
+        return metric_value
+
+    def _nodes_objective(self, nodes_params, pipeline, data, loss_function, loss_params: dict):
+        """
+        Objective function for the concurrent optimization of the nodes
+
+        :param nodes_params: dictionary with ids of the nodes and their parameters
+        :param pipeline: pipeline to optimize
+        :param data: InputData for validation
+        :param loss_function: loss function to optimize
+        :param loss_params: parameters for loss function
+
+        :return metric_value: value of objective function
+        """
+
+        # Set hyperparameters for the nodes
+        pipeline = PipelineTuner.set_arg_pipeline(pipeline=pipeline, parameters=nodes_params)
+
+        metric_value = self.get_metric_value(data=data,
+                                             pipeline=pipeline,
+                                             loss_function=loss_function,
+                                             loss_params=loss_params,
+                                             use_fitted_nodes=True)
         return metric_value
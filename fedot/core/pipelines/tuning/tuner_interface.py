@@ -1,10 +1,14 @@
 import sys
+import timeit
+from hyperopt import JOB_STATE_DONE, STATUS_OK, Domain, Trials, fmin, space_eval
+from hyperopt.base import spec_from_misc
 from hyperopt.early_stop import no_progress_loss
 
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import timedelta
-from typing import Callable, ClassVar, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+from uuid import uuid4
 
 import numpy as np
 
@@ -13,6 +17,9 @@ from fedot.core.log import Log, default_log
 from fedot.core.pipelines.tuning.search_space import SearchSpace
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import TaskTypesEnum
+from fedot.core.utilities.shared_memory import SharedMemoryPublisher, load_published
+from fedot.core.utilities.worker_pool import WorkerPool
+from fedot.core.validation.tune.cache import FittedNodesCache
 from fedot.core.validation.tune.simple import fit_predict_one_fold
 from fedot.core.validation.tune.tabular import cv_tabular_predictions
 from fedot.core.validation.tune.time_series import cv_time_series_predictions
@@ -30,6 +37,12 @@ class HyperoptTuner(ABC):
     :attribute iterations: max number of iterations
     :attribute search_space: SearchSpace instance
     :attribute algo: algorithm for hyperparameters optimization with signature similar to hyperopt.tse.suggest
+    :attribute worker_pool: pool of worker processes for the concurrent validation of the folds
+    (or of the trials if batch_size is more than 1)
+    :attribute batch_size: number of the configurations proposed at once and evaluated concurrently
+    on the worker pool (see :meth:`_minimize`), 1 for the sequential trials
+    :attribute fitted_nodes_cache: cache of the fitted nodes of the trials, so only the nodes
+    with the changed params (or the changed params of their ancestors) are fitted in the next trials
     """
 
     def __init__(self, pipeline, task,
@@ -37,7 +50,11 @@ class HyperoptTuner(ABC):
                  timeout: timedelta = timedelta(minutes=5),
                  log: Optional[Log] = None,
                  search_space: ClassVar = SearchSpace(),
-                 algo: Callable = None):
+                 algo: Callable = None,
+                 worker_pool: Optional[WorkerPool] = None,
+                 batch_size: int = 1):
+        if batch_size < 1:
+            raise ValueError(f'Batch size should be positive, got {batch_size}')
         self.pipeline = pipeline
         self.task = task
         self.iterations = iterations
@@ -52,6 +69,9 @@ class HyperoptTuner(ABC):
         self.validation_blocks = None
         self.search_space = search_space
         self.algo = algo
+        self.worker_pool = worker_pool
+        self.batch_size = batch_size
+        self.fitted_nodes_cache = FittedNodesCache()
 
         self.log = log or default_log(__name__)
 
@@ -73,7 +93,57 @@ class HyperoptTuner(ABC):
         """
         raise NotImplementedError()
 
-    def get_metric_value(self, data, pipeline, loss_function, loss_params):
+    def _minimize(self, objective: Callable[[Dict], float], space: Dict,
+                  max_evals: int, timeout: Optional[int]) -> Dict:
+        """
+        Minimizes the objective over the search space with hyperopt
+
+        If batch_size is more than 1, the configurations are proposed by batches: each configuration
+        of the batch is proposed with the previous ones pending, TPE treats the pending trials
+        as the worst ones (constant liar), so the batch is spread over the search space.
+        The batch is evaluated concurrently on the worker pool and the results are put into the trials,
+        then the early stopping and the timeout are checked before the next batch.
+
+        :param objective: function of the parameters dictionary to minimize
+        :param space: search space of the parameters
+        :param max_evals: maximal number of the trials
+        :param timeout: time limit of the optimization (seconds)
+
+        :return: best parameters
+        """
+        if self.batch_size == 1:
+            best = fmin(objective, space, algo=self.algo, max_evals=max_evals,
+                        early_stop_fn=self.early_stop_fn, timeout=timeout)
+            return space_eval(space=space, hp_assignment=best)
+
+        start_time = timeit.default_timer()
+        domain = Domain(objective, space)
+        trials = Trials()
+        early_stop_args = []
+        is_stopped = False
+        with _TrialsEvaluator(objective, self.worker_pool) as evaluator:
+            while len(trials) < max_evals and not is_stopped and \
+                    (timeout is None or timeit.default_timer() - start_time < timeout):
+                batch = []
+                for new_id in trials.new_trial_ids(min(self.batch_size, max_evals - len(trials))):
+                    new_docs = self.algo([new_id], domain, trials, np.random.randint(2 ** 31 - 1))
+                    trials.insert_trial_docs(new_docs)
+                    trials.refresh()
+                    batch.extend(new_docs)
+                if not batch:
+                    break
+
+                losses = evaluator.evaluate([space_eval(space, spec_from_misc(doc['misc'])) for doc in batch])
+                for doc, loss in zip(batch, losses):
+                    doc['state'] = JOB_STATE_DONE
+                    doc['result'] = {'loss': loss, 'status': STATUS_OK}
+                trials.refresh()
+                if self.early_stop_fn is not None:
+                    is_stopped, early_stop_args = self.early_stop_fn(trials, *early_stop_args)
+        self.log.debug(f'{len(trials)} trials are evaluated by batches of {self.batch_size}')
+        return space_eval(space=space, hp_assignment=trials.argmin)
+
+    def get_metric_value(self, data, pipeline, loss_function, loss_params, use_fitted_nodes: bool = False):
         """
         Method calculates metric for algorithm validation
 
@@ -81,15 +151,18 @@ class HyperoptTuner(ABC):
         :param pipeline: pipeline to validate
         :param loss_function: function to minimize (or maximize)
         :param loss_params: parameters for loss function
+        :param use_fitted_nodes: if True, the unchanged nodes of the previous trials are not fitted again
+        (see :class:`FittedNodesCache`), otherwise the pipeline is fitted from scratch
 
         :return: value of loss function
         """
 
+        cache = self.fitted_nodes_cache if use_fitted_nodes else None
         try:
             if self.cv_folds is None:
-                preds, test_target = self._one_fold_validation(data, pipeline)
+                preds, test_target = self._one_fold_validation(data, pipeline, cache)
             else:
-                preds, test_target = self._cross_validation(data, pipeline)
+                preds, test_target = self._cross_validation(data, pipeline, cache)
 
             # Calculate metric
             metric_value = _calculate_loss_function(loss_function, loss_params, test_target, preds)
@@ -130,6 +203,8 @@ class HyperoptTuner(ABC):
         :param loss_function: function to minimize (or maximize)
         :param loss_params: parameters for loss function
         """
+        # Fitted nodes of the trials are not required anymore
+        self.fitted_nodes_cache.clear()
 
         self.obtained_metric = self.get_metric_value(data=data,
                                                      pipeline=tuned_pipeline,
@@ -179,28 +254,30 @@ class HyperoptTuner(ABC):
                 return self.init_pipeline
 
     @staticmethod
-    def _one_fold_validation(data, pipeline):
+    def _one_fold_validation(data, pipeline, cache: Optional[FittedNodesCache] = None):
         """ Perform simple (hold-out) validation """
 
         if data.task.task_type is TaskTypesEnum.classification:
-            test_target, preds = fit_predict_one_fold(data, pipeline)
+            test_target, preds = fit_predict_one_fold(data, pipeline, cache)
         else:
             # For regression and time series forecasting
-            test_target, preds = fit_predict_one_fold(data, pipeline)
+            test_target, preds = fit_predict_one_fold(data, pipeline, cache)
             # Convert predictions into one dimensional array
             preds = np.ravel(np.array(preds))
             test_target = np.ravel(test_target)
 
         return preds, test_target
 
-    def _cross_validation(self, data, pipeline):
+    def _cross_validation(self, data, pipeline, cache: Optional[FittedNodesCache] = None):
         """ Perform cross validation for metric evaluation """
 
         preds, test_target = [], []
         if data.data_type is DataTypesEnum.table or data.data_type is DataTypesEnum.text or \
                 data.data_type is DataTypesEnum.image:
             preds, test_target = cv_tabular_predictions(pipeline, data,
-                                                        cv_folds=self.cv_folds)
+                                                        cv_folds=self.cv_folds,
+                                                        worker_pool=self.worker_pool,
+                                                        cache=cache)
 
         elif data_type_is_ts(data):
             if self.validation_blocks is None:
@@ -209,7 +286,9 @@ class HyperoptTuner(ABC):
 
             preds, test_target = cv_time_series_predictions(pipeline, data, log=self.log,
                                                             cv_folds=self.cv_folds,
-                                                            validation_blocks=self.validation_blocks)
+                                                            validation_blocks=self.validation_blocks,
+                                                            worker_pool=self.worker_pool,
+                                                            cache=cache)
         return preds, test_target
 
     @property
@@ -219,6 +298,62 @@ class HyperoptTuner(ABC):
         else:
             return MAX_METRIC_VALUE
 
+    def __getstate__(self):
+        # Tuner is passed to the workers only to evaluate the trials,
+        # so the folds are validated sequentially there and the search settings are not required
+        state = self.__dict__.copy()
+        state['worker_pool'] = None
+        state['early_stop_fn'] = None
+        state['algo'] = None
+        state['init_pipeline'] = None
+        return state
+
+
+class _TrialsEvaluator:
+    """
+    Evaluates the trials of the objective on the worker pool (in the current process if there is no pool).
+    The objective (with the data it holds) is published to the workers once, its numpy arrays
+    are placed into shared memory (see :class:`SharedMemoryPublisher`).
+
+    :param objective: function of the parameters dictionary to minimize
+    :param worker_pool: pool of the worker processes
+    """
+
+    def __init__(self, objective: Callable[[Dict], float], worker_pool: Optional[WorkerPool] = None):
+        self.objective = objective
+        self.worker_pool = worker_pool
+        self._publisher: Optional[SharedMemoryPublisher] = None
+        self._published_state: Optional[Tuple[str, bytes]] = None
+
+    def evaluate(self, parameters: List[Dict]) -> List[float]:
+        """ Returns the values of the objective for each parameters dictionary """
+        if self.worker_pool is None or self.worker_pool.n_jobs == 1 or len(parameters) == 1:
+            return [self.objective(params) for params in parameters]
+        if self._published_state is None:
+            self._publisher = SharedMemoryPublisher()
+            self._published_state = (str(uuid4()), self._publisher.dumps(self.objective))
+        key, state = self._published_state
+        return self.worker_pool.get().map(_evaluate_trial_in_worker,
+                                          [(key, state, params) for params in parameters])
+
+    def close(self):
+        if self._publisher is not None:
+            self._publisher.close()
+        self._publisher = None
+        self._published_state = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _evaluate_trial_in_worker(task: Tuple[str, bytes, Dict[str, Any]]) -> float:
+    """ Evaluates the objective in the worker process. The objective is restored once per published state """
+    key, state, params = task
+    return load_published(key, state)(params)
+
 
 def _create_multi_target_prediction(target):
     """ Function creates an array of shape (target len, num classes)
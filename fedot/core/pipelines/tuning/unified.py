@@ -2,11 +2,12 @@ from datetime import timedelta
 from functools import partial
 from typing import Callable, ClassVar, Optional
 
-from hyperopt import fmin, space_eval, tpe
+from hyperopt import tpe
 
 from fedot.core.log import Log
 from fedot.core.pipelines.tuning.search_space import SearchSpace, convert_params
 from fedot.core.pipelines.tuning.tuner_interface import HyperoptTuner, _greater_is_better
+from fedot.core.utilities.worker_pool import WorkerPool
 
 
 class PipelineTuner(HyperoptTuner):
@@ -19,13 +20,17 @@ class PipelineTuner(HyperoptTuner):
                  timeout: timedelta = timedelta(minutes=5),
                  log: Optional[Log] = None,
                  search_space: ClassVar = SearchSpace(),
-                 algo: Callable = tpe.suggest):
+                 algo: Callable = tpe.suggest,
+                 worker_pool: Optional[WorkerPool] = None,
+                 batch_size: int = 1):
         super().__init__(pipeline=pipeline, task=task,
                          iterations=iterations, early_stopping_rounds=early_stopping_rounds,
                          timeout=timeout,
                          log=log,
                          search_space=search_space,
-                         algo=algo)
+                         algo=algo,
+                         worker_pool=worker_pool,
+                         batch_size=batch_size)
 
     def tune_pipeline(self, input_data, loss_function, loss_params=None,
                       cv_folds: int = None, validation_blocks: int = None):
@@ -44,18 +49,14 @@ class PipelineTuner(HyperoptTuner):
         # Check source metrics for data
         self.init_check(input_data, loss_function, loss_params)
 
-        best = fmin(partial(self._objective,
-                            pipeline=self.pipeline,
-                            data=input_data,
-                            loss_function=loss_function,
-                            loss_params=loss_params),
-                    parameters_dict,
-                    algo=self.algo,
-                    max_evals=self.iterations,
-                    early_stop_fn=self.early_stop_fn,
-                    timeout=self.max_seconds)
-
-        best = space_eval(space=parameters_dict, hp_assignment=best)
+        best = self._minimize(partial(self._objective,
+                                      pipeline=self.pipeline,
+                                      data=input_data,
+                                      loss_function=loss_function,
+                                      loss_params=loss_params),
+                              parameters_dict,
+                              max_evals=self.iterations,
+                              timeout=self.max_seconds)
 
         tuned_pipeline = self.set_arg_pipeline(pipeline=self.pipeline,
                                                parameters=best)
@@ -131,5 +132,6 @@ class PipelineTuner(HyperoptTuner):
         metric_value = self.get_metric_value(data=data,
                                              pipeline=pipeline,
                                              loss_function=loss_function,
-                                             loss_params=loss_params)
+                                             loss_params=loss_params,
+                                             use_fitted_nodes=True)
         return metric_value
@@ -6,7 +6,7 @@ from fedot.core.optimisers.gp_comp.individual import Individual
 from fedot.core.optimisers.graph import OptGraph
 from fedot.core.optimisers.opt_history import OptHistory
 
-from . import any_from_json
+from . import any_from_json, any_to_json
 
 
 def _convert_parent_individuals(individuals: List[List['Individual']]) -> List[List['Individual']]:
@@ -25,6 +25,21 @@ def _convert_parent_individuals(individuals: List[List['Individual']]) -> List[L
     return individuals
 
 
+def opt_history_to_json(obj: OptHistory) -> Dict[str, Any]:
+    """
+    Uses regular serialization but reads the generations from the storage
+    and excludes the service fields that are not the part of the history
+    """
+    serialized_obj = {
+        k: v
+        for k, v in any_to_json(obj).items()
+        if k not in ('_storage', '_copied_individuals')
+    }
+    serialized_obj['individuals'] = list(obj.individuals)
+    serialized_obj['archive_history'] = list(obj.archive_history)
+    return serialized_obj
+
+
 def opt_history_from_json(cls: Type[OptHistory], json_obj: Dict[str, Any]) -> OptHistory:
     deserialized = any_from_json(cls, json_obj)
     deserialized.individuals = _convert_parent_individuals(deserialized.individuals)
@@ -48,6 +48,7 @@ class Serializer(JSONEncoder, JSONDecoder):
                 individual_from_json,
                 operation_to_json,
                 opt_history_from_json,
+                opt_history_to_json,
                 parent_operator_to_json,
                 uuid_from_json,
                 uuid_to_json
@@ -63,7 +64,7 @@ class Serializer(JSONEncoder, JSONDecoder):
                 GraphNode: {_to_json: graph_node_to_json, _from_json: any_from_json},
                 Graph: {_to_json: graph_to_json, _from_json: graph_from_json},
                 Operation: {_to_json: operation_to_json, _from_json: any_from_json},
-                OptHistory: {_to_json: any_to_json, _from_json: opt_history_from_json},
+                OptHistory: {_to_json: opt_history_to_json, _from_json: opt_history_from_json},
                 ParentOperator: {_to_json: parent_operator_to_json, _from_json: any_from_json},
                 UUID: {_to_json: uuid_to_json, _from_json: uuid_from_json},
                 ComparableEnum: {_to_json: enum_to_json, _from_json: enum_from_json},
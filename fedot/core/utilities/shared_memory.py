@@ -0,0 +1,134 @@
+import gc
+import io
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    # Shared memory is available since Python 3.8, the arrays are pickled as usual otherwise
+    SharedMemory = None
+
+# Shared memory blocks attached in the current process by their names.
+# Blocks must be referenced while the arrays created over their buffers are alive.
+_attached_blocks: Dict[str, 'SharedMemory'] = {}
+
+# Object restored from the published state in the worker process: (key of the state, object)
+_published_object: Optional[Tuple[str, Any]] = None
+
+
+class SharedMemoryPublisher:
+    """
+    Serializes objects so that their numpy arrays are placed into shared memory only once
+    and are passed to other processes by the names of the memory blocks.
+    Deserialized arrays (see :func:`load_shared`) are read-only zero-copy views of the shared blocks.
+
+    The blocks are owned by the publisher and are released with :meth:`close`.
+    If shared memory is not supported (Python < 3.8), the objects are pickled as usual.
+
+    :param min_array_size: minimal size of the array (in bytes) to be placed into shared memory,
+    smaller arrays are pickled as usual
+    """
+
+    def __init__(self, min_array_size: int = 2 ** 16):
+        self.min_array_size = min_array_size
+        self._blocks: List['SharedMemory'] = []
+        # id of the published array -> (array, arguments for its reconstruction)
+        self._published: Dict[int, Tuple[np.ndarray, Tuple]] = {}
+
+    def dumps(self, obj: Any) -> bytes:
+        """ Pickles the object moving its numpy arrays into shared memory """
+        buffer = io.BytesIO()
+        _SharedArraysPickler(buffer, self).dump(obj)
+        return buffer.getvalue()
+
+    def is_shareable(self, array: Any) -> bool:
+        return (SharedMemory is not None and type(array) is np.ndarray and not array.dtype.hasobject and
+                array.nbytes > 0 and array.nbytes >= self.min_array_size)
+
+    def share(self, array: np.ndarray) -> Tuple[str, Tuple[int, ...], np.dtype]:
+        """ Copies the array into new shared memory block (once per array object) """
+        published = self._published.get(id(array))
+        if published is None:
+            block = SharedMemory(create=True, size=array.nbytes)
+            shared_array = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            shared_array[...] = array
+            del shared_array
+            self._blocks.append(block)
+            # the array is referenced to guarantee that its id is not reused by other object
+            published = (array, (block.name, array.shape, array.dtype))
+            self._published[id(array)] = published
+        return published[1]
+
+    @property
+    def size(self) -> int:
+        """ Total size of the published arrays in bytes """
+        return sum(block.size for block in self._blocks)
+
+    def close(self):
+        """ Releases all shared memory blocks of the publisher """
+        for block in self._blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+        self._published = {}
+
+    def __getstate__(self):
+        raise TypeError('SharedMemoryPublisher can not be passed to other processes')
+
+
+class _SharedArraysPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, publisher: SharedMemoryPublisher):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._publisher = publisher
+
+    def reducer_override(self, obj: Any):
+        if self._publisher.is_shareable(obj):
+            return _attach_shared_array, self._publisher.share(obj)
+        return NotImplemented
+
+
+def load_shared(payload: bytes) -> Any:
+    """ Restores the object serialized by :meth:`SharedMemoryPublisher.dumps` """
+    return pickle.loads(payload)
+
+
+def load_published(key: str, payload: bytes) -> Any:
+    """ Returns the object restored from the payload published with the key.
+    The object is restored once per key and is reused by the next calls,
+    the data of the previously restored object is released """
+    global _published_object
+    if _published_object is None or _published_object[0] != key:
+        # Data of the previous state is not used anymore
+        _published_object = None
+        gc.collect()
+        release_shared_blocks()
+        _published_object = (key, load_shared(payload))
+    return _published_object[1]
+
+
+def release_shared_blocks():
+    """ Detaches the shared memory blocks attached in the current process.
+    The blocks that are still used by some arrays stay attached. """
+    for name, block in list(_attached_blocks.items()):
+        try:
+            block.close()
+        except BufferError:
+            # there are arrays created over the block buffer
+            continue
+        del _attached_blocks[name]
+
+
+def _attach_shared_array(name: str, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    block = _attached_blocks.get(name)
+    if block is None:
+        block = SharedMemory(name=name)
+        _attached_blocks[name] = block
+    array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    array.flags.writeable = False
+    return array
@@ -0,0 +1,113 @@
+import importlib
+import multiprocessing
+import weakref
+from multiprocessing.pool import Pool
+from typing import Optional, Sequence
+
+from fedot.core.log import Log, default_log
+
+# Modules with the implementations of the operations, that are imported by the workers on start
+WARM_UP_MODULES = ('fedot.core.pipelines.pipeline',
+                   'fedot.core.operations.evaluation.common_preprocessing',
+                   'fedot.core.operations.evaluation.classification',
+                   'fedot.core.operations.evaluation.regression',
+                   'fedot.core.operations.evaluation.time_series')
+
+
+class WorkerPool:
+    """
+    Long-lived pool of worker processes shared by the stages of the composing
+    (initial assumption fit, evolutionary optimisation and tuning).
+
+    The processes are started lazily on the first request and warmed up once by importing
+    the modules of the operations, so the next stages do not pay for the process spawn and imports.
+    The pool is alive until :meth:`shutdown` is called.
+
+    :param n_jobs: number of worker processes (-1 for use all cpu's)
+    :param log: logger to use
+    :param warm_up_modules: modules to import in the workers on start
+    """
+
+    def __init__(self, n_jobs: int = -1, log: Optional[Log] = None,
+                 warm_up_modules: Sequence[str] = WARM_UP_MODULES):
+        self._n_jobs = n_jobs
+        self.log = log or default_log(self.__class__.__name__)
+        self.warm_up_modules = tuple(warm_up_modules)
+        self._pool: Optional[Pool] = None
+        self._pool_size = 0
+        self._pool_finalizer: Optional[weakref.finalize] = None
+
+    @property
+    def n_jobs(self) -> int:
+        """ Number of the worker processes limited by the number of cpu's """
+        return determine_n_jobs(self._n_jobs)
+
+    @property
+    def is_started(self) -> bool:
+        return self._pool is not None
+
+    def get(self, n_jobs: Optional[int] = None) -> Pool:
+        """
+        Returns the running pool starting it if necessary
+
+        :param n_jobs: required number of workers (the number of the pool is used if None).
+        The pool is restarted if it has the other number of workers
+        """
+        n_jobs = self.n_jobs if n_jobs is None else determine_n_jobs(n_jobs)
+        if self._pool is not None and self._pool_size != n_jobs:
+            self.shutdown()
+        if self._pool is None:
+            self.log.debug(f'Starting pool of {n_jobs} worker processes')
+            self._pool = multiprocessing.Pool(n_jobs, initializer=_warm_up, initargs=(self.warm_up_modules,))
+            self._pool_size = n_jobs
+            # Workers are stopped if the pool is collected without shutdown
+            self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def warm_up(self):
+        """ Starts the workers in advance if more than one job is available,
+        so they are importing the modules while the main process is busy """
+        if self.n_jobs > 1:
+            self.get()
+
+    def shutdown(self):
+        """ Stops the worker processes """
+        if self._pool is not None:
+            # The stopped pool is not referenced by the finalizer anymore
+            self._pool_finalizer.detach()
+            self._pool_finalizer = None
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def __getstate__(self):
+        # Processes belong to the owner of the pool, so only the settings are transferred
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        state['_pool_size'] = 0
+        state['_pool_finalizer'] = None
+        return state
+
+
+def determine_n_jobs(n_jobs=-1, logger=None):
+    if n_jobs > multiprocessing.cpu_count() or n_jobs == -1:
+        n_jobs = multiprocessing.cpu_count()
+    if logger:
+        logger.info(f"Number of used CPU's: {n_jobs}")
+    return n_jobs
+
+
+def _warm_up(modules: Sequence[str]):
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            # Optional dependencies may be unavailable, the operations will fail in the usual way
+            pass
@@ -4,6 +4,7 @@ import numpy as np
 from sklearn.model_selection import KFold, TimeSeriesSplit
 from sklearn.model_selection._split import _BaseKFold
 
+from fedot.core.data.array_utilities import as_slice, readonly_view
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.log import Log, default_log
@@ -94,8 +95,8 @@ def tabular_cv_generator(data: InputData,
         train_features, train_target = _table_data_by_index(train_idxs, data)
         test_features, test_target = _table_data_by_index(test_idxs, data)
 
-        idx_for_train = np.arange(0, len(train_features))
-        idx_for_test = np.arange(0, len(test_features))
+        idx_for_train = np.arange(0, len(train_idxs))
+        idx_for_test = np.arange(0, len(test_idxs))
 
         train_data = InputData(idx=idx_for_train,
                                features=train_features,
@@ -149,8 +150,9 @@ def _table_data_by_index(index, values: InputData):
 
 
 def _ts_data_by_index(train_ids, test_ids, data):
-    """ Allow to get time series data by indexes of elements """
-    features = data.features[train_ids]
-    target = data.target[test_ids]
+    """ Allow to get time series data by indexes of elements
+    (consecutive elements are taken as views, so the folds share the memory of the series) """
+    features = readonly_view(data.features[as_slice(train_ids)])
+    target = readonly_view(data.target[as_slice(test_ids)])
 
     return features, target
@@ -0,0 +1,79 @@
+from typing import Any, Dict, Hashable, NamedTuple, Set, Tuple
+
+from fedot.core.data.data import InputData, OutputData
+from fedot.core.pipelines.execution_context import ExecutionContext
+
+
+class _FittedNode(NamedTuple):
+    # Structural hashes of the subgraph of the node before and after the fit (the params may be corrected by fit)
+    hashes: Set[str]
+    fitted_operation: Any
+    fit_output: OutputData
+    predict_output: OutputData
+
+
+class FittedNodesCache:
+    """
+    Cache of the fitted nodes of the tuned pipeline for each validation fold.
+
+    The tuners change the hyperparameters of the same pipeline from trial to trial,
+    so the nodes with unchanged params (and unchanged params of all their ancestors) are not fitted again:
+    their fitted operations are restored and their outputs on the train and test data of the fold
+    are taken from the cache. Only the last fitted state of each node is kept for each fold.
+    The nodes are identified by their positions in the pipeline and are validated
+    by the structural hashes of their subgraphs.
+    """
+
+    def __init__(self):
+        # (fold key, position of the node) -> fitted state of the node
+        self._entries: Dict[Tuple[Hashable, int], _FittedNode] = {}
+
+    def fit_predict(self, pipeline, train_data: InputData, test_data: InputData, fold_key: Hashable) -> OutputData:
+        """
+        Fits the pipeline on the train data of the fold from scratch and predicts the test data,
+        the unchanged nodes are restored from the cache
+
+        :param pipeline: pipeline to fit
+        :param train_data: train data of the fold
+        :param test_data: test data of the fold
+        :param fold_key: key of the fold, that is the same for the same train and test data
+
+        :return: prediction on the test data
+        """
+        hashes = [node.structural_hash for node in pipeline.nodes]
+        fit_context = ExecutionContext(mode='fit')
+        predict_context = ExecutionContext(mode='predict')
+        restored_operations = {}
+        for position, node in enumerate(pipeline.nodes):
+            entry = self._entries.get((fold_key, position))
+            if node is not pipeline.root_node and entry is not None and hashes[position] in entry.hashes:
+                # Outputs are passed as read-only views, so they are not changed by the next nodes
+                fit_context.save_output(node, entry.fit_output.view())
+                predict_context.save_output(node, entry.predict_output.view())
+                restored_operations[position] = entry.fitted_operation
+
+        pipeline.fit(train_data, context=fit_context)
+        for position, fitted_operation in restored_operations.items():
+            pipeline.nodes[position].fitted_operation = fitted_operation
+        prediction = pipeline.predict(test_data, context=predict_context)
+
+        for position, node in enumerate(pipeline.nodes):
+            fit_output = fit_context.get_output(node)
+            predict_output = predict_context.get_output(node)
+            if fit_output is not None and predict_output is not None:
+                self._entries[(fold_key, position)] = _FittedNode({hashes[position], node.structural_hash},
+                                                                  node.fitted_operation,
+                                                                  fit_output.view(), predict_output.view())
+        return prediction
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # Fitted nodes are not transferred to other processes
+        state = self.__dict__.copy()
+        state['_entries'] = {}
+        return state
@@ -1,21 +1,28 @@
+from typing import Optional
+
 import numpy as np
 
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.validation.tune.cache import FittedNodesCache
 
 
-def fit_predict_one_fold(data, pipeline):
+def fit_predict_one_fold(data, pipeline, cache: Optional[FittedNodesCache] = None):
     """ Simple strategy for model evaluation based on one folder check
 
     :param data: InputData for validation
     :param pipeline: Pipeline to validate
+    :param cache: cache of the fitted nodes to reuse the unchanged ones (the pipeline is fitted from scratch if None)
     """
 
     # Train test split
     train_input, predict_input = train_test_data_setup(data)
     test_target = np.array(predict_input.target)
 
-    pipeline.fit_from_scratch(train_input)
-    predicted_output = pipeline.predict(predict_input)
+    if cache is not None:
+        predicted_output = cache.fit_predict(pipeline, train_input, predict_input, fold_key=None)
+    else:
+        pipeline.fit_from_scratch(train_input)
+        predicted_output = pipeline.predict(predict_input)
     predictions = np.array(predicted_output.predict)
 
     return test_target, predictions
@@ -1,21 +1,41 @@
+from typing import Optional
+
 import numpy as np
 
 from fedot.core.validation.split import tabular_cv_generator
 from fedot.core.data.data import InputData
+from fedot.core.utilities.worker_pool import WorkerPool
+from fedot.core.validation.tune.cache import FittedNodesCache
+
 
+def cv_tabular_predictions(pipeline, reference_data: InputData, cv_folds: int,
+                           worker_pool: Optional[WorkerPool] = None,
+                           cache: Optional[FittedNodesCache] = None):
+    """ Provide K-fold cross validation for tabular data
 
-def cv_tabular_predictions(pipeline, reference_data: InputData, cv_folds: int):
-    """ Provide K-fold cross validation for tabular data"""
+    :param worker_pool: pool of worker processes to validate the folds concurrently
+    (the folds are validated sequentially if None)
+    :param cache: cache of the fitted nodes to reuse the unchanged ones in the sequentially validated folds
+    """
 
     predictions = []
     targets = []
 
-    for train_data, test_data in tabular_cv_generator(reference_data, cv_folds):
-        pipeline.fit_from_scratch(train_data)
-        predicted_values = pipeline.predict(test_data).predict
-        actual_values = test_data.target
-        predictions.extend(predicted_values)
-        targets.extend(actual_values)
+    if worker_pool is not None and worker_pool.n_jobs > 1:
+        folds = list(tabular_cv_generator(reference_data, cv_folds))
+        # Each worker fits its own copy of the pipeline
+        folds_results = worker_pool.get().starmap(_fit_predict_fold,
+                                                  [(pipeline, train_data, test_data)
+                                                   for train_data, test_data in folds])
+        for predicted_values, actual_values in folds_results:
+            predictions.extend(predicted_values)
+            targets.extend(actual_values)
+        train_data = folds[-1][0]
+    else:
+        for fold_id, (train_data, test_data) in enumerate(tabular_cv_generator(reference_data, cv_folds)):
+            predicted_values, actual_values = _fit_predict_fold(pipeline, train_data, test_data, cache, fold_id)
+            predictions.extend(predicted_values)
+            targets.extend(actual_values)
 
     predictions, targets = np.array(predictions), np.array(targets)
 
@@ -23,3 +43,13 @@ def cv_tabular_predictions(pipeline, reference_data: InputData, cv_folds: int):
         predictions, targets = np.ravel(predictions), np.ravel(targets)
 
     return predictions, targets
+
+
+def _fit_predict_fold(pipeline, train_data: InputData, test_data: InputData,
+                      cache: Optional[FittedNodesCache] = None, fold_id: Optional[int] = None):
+    if cache is not None:
+        predicted_values = cache.fit_predict(pipeline, train_data, test_data, fold_key=fold_id).predict
+    else:
+        pipeline.fit_from_scratch(train_data)
+        predicted_values = pipeline.predict(test_data).predict
+    return predicted_values, test_data.target
@@ -1,40 +1,68 @@
+from typing import Optional
+
 import numpy as np
 
 from fedot.core.pipelines.ts_wrappers import in_sample_ts_forecast
 from fedot.core.data.data import InputData
+from fedot.core.utilities.worker_pool import WorkerPool
 from fedot.core.validation.split import ts_cv_generator
+from fedot.core.validation.tune.cache import FittedNodesCache
 
 
 def cv_time_series_predictions(pipeline, reference_data: InputData, log,
-                               cv_folds: int, validation_blocks=None):
+                               cv_folds: int, validation_blocks=None,
+                               worker_pool: Optional[WorkerPool] = None,
+                               cache: Optional[FittedNodesCache] = None):
     """ Provide K-fold cross validation for time series with using in-sample
     forecasting on each step (fold)
+
+    :param worker_pool: pool of worker processes to validate the folds concurrently
+    (the folds are validated sequentially if None)
+    :param cache: cache of the fitted nodes to reuse the unchanged ones in the one fold validation
+    (in-sample forecasting predicts the pipeline many times, so the pipeline is fitted from scratch there)
     """
 
     # Place where predictions and actual values will be loaded
     predictions = []
     targets = []
-    for train_data, test_data in ts_cv_generator(reference_data, cv_folds, validation_blocks, log):
-        if validation_blocks is None:
-            # One fold validation
-            pipeline.fit_from_scratch(train_data)
-            output_pred = pipeline.predict(test_data)
+    folds = ts_cv_generator(reference_data, cv_folds, validation_blocks, log)
+    if validation_blocks is None:
+        # One fold validation
+        for train_data, test_data in folds:
+            if cache is not None:
+                output_pred = cache.fit_predict(pipeline, train_data, test_data, fold_key=None)
+            else:
+                pipeline.fit_from_scratch(train_data)
+                output_pred = pipeline.predict(test_data)
             predictions = output_pred.predict
             targets = output_pred.target
             break
+    else:
+        if worker_pool is not None and worker_pool.n_jobs > 1:
+            # Each worker fits its own copy of the pipeline
+            folds_results = worker_pool.get().starmap(_fit_forecast_fold,
+                                                      [(pipeline, train_data, test_data, validation_blocks)
+                                                       for train_data, test_data in folds])
         else:
-            # Cross validation: get number of validation blocks per each fold
-            horizon = test_data.task.task_params.forecast_length * validation_blocks
-
-            pipeline.fit_from_scratch(train_data)
-
-            predicted_values = in_sample_ts_forecast(pipeline=pipeline,
-                                                     input_data=test_data,
-                                                     horizon=horizon)
-            # Clip actual data by the forecast horizon length
-            actual_values = test_data.target[-horizon:]
+            folds_results = (_fit_forecast_fold(pipeline, train_data, test_data, validation_blocks)
+                             for train_data, test_data in folds)
+        for predicted_values, actual_values in folds_results:
             predictions.extend(predicted_values)
             targets.extend(actual_values)
 
     predictions, targets = np.ravel(np.array(predictions)), np.ravel(np.array(targets))
     return predictions, targets
+
+
+def _fit_forecast_fold(pipeline, train_data: InputData, test_data: InputData, validation_blocks: int):
+    # Cross validation: get number of validation blocks per each fold
+    horizon = test_data.task.task_params.forecast_length * validation_blocks
+
+    pipeline.fit_from_scratch(train_data)
+
+    predicted_values = in_sample_ts_forecast(pipeline=pipeline,
+                                             input_data=test_data,
+                                             horizon=horizon)
+    # Clip actual data by the forecast horizon length
+    actual_values = test_data.target[-horizon:]
+    return predicted_values, actual_values
@@ -1,9 +1,11 @@
 from copy import copy
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
 
+from fedot.core.data.array_utilities import is_memory_mapped, is_sparse, writable
+from fedot.core.data.columnar import TypedColumns
 from fedot.core.log import Log, default_log
 from fedot.core.repository.tasks import Task, TaskTypesEnum
 
@@ -16,6 +18,10 @@ FEDOT_STR_NAN = 'fedot_nan'
 CATEGORICAL_UNIQUE_TH = 13
 MAX_CATEGORIES_TH = 30
 
+_NONE_TYPE = type(None)
+# Vectorized obtaining of the types of elements in the object array
+_element_type = np.frompyfunc(type, 1, 1)
+
 
 class TableTypesCorrector:
     """
@@ -54,11 +60,16 @@ class TableTypesCorrector:
 
     def convert_data_for_fit(self, data: 'InputData'):
         """ If column contain several data types - perform correction procedure """
+        if is_passed_as_is(data.features):
+            return self._convert_target_only(data, is_fit=True)
+
+        # Typed columns describe the features before the conversion
+        typed_columns = data.typed_columns
         # Convert features to have an ability to insert str into float table or vice versa
         data.features = data.features.astype(object)
 
         # Determine types for each column in features and target if it is necessary
-        self.features_columns_info = define_column_types(data.features)
+        self.features_columns_info = define_column_types(data.features, typed_columns)
         self.target_columns_info = define_column_types(data.target)
 
         # Correct types in features table
@@ -84,6 +95,9 @@ class TableTypesCorrector:
 
     def convert_data_for_predict(self, data: 'InputData'):
         """ Prepare data for predict stage. Include only column types transformation """
+        if is_passed_as_is(data.features):
+            return self._convert_target_only(data, is_fit=False)
+
         # Ordering is important because after removing incorrect features - indices are obsolete
         data.features = data.features.astype(object)
         data.features = self.remove_incorrect_features(data.features, self.features_converted_columns)
@@ -99,6 +113,21 @@ class TableTypesCorrector:
         self._retain_columns_info_without_types_conflicts(data)
         return data
 
+    def _convert_target_only(self, data: 'InputData', is_fit: bool):
+        """ Features are passed as is (see :func:`is_passed_as_is`) and only the target types are corrected """
+        if is_fit:
+            self.target_columns_info = define_column_types(data.target)
+            data.target = self.target_types_converting(target=data.target, task=data.task)
+        else:
+            data.target = apply_type_transformation(data.target, self.target_types, self.log)
+        data.supplementary_data.column_types = self.prepare_column_types_info(predictors=data.features,
+                                                                              target=data.target,
+                                                                              task=data.task)
+        if is_fit:
+            self.features_types = copy(data.supplementary_data.column_types['features'])
+            self.target_types = copy(data.supplementary_data.column_types.get('target'))
+        return data
+
     def remove_incorrect_features(self, table: np.array, converted_columns: dict):
         """
         Remove from the table columns with conflicts with types were not resolved
@@ -128,6 +157,7 @@ class TableTypesCorrector:
 
         if not features_with_mixed_types:
             return features
+        features = writable(features)
 
         # There are mixed-types columns in features table - convert them
         for mixed_column_id in features_with_mixed_types:
@@ -156,6 +186,7 @@ class TableTypesCorrector:
 
         if not target_with_mixed_types:
             return target
+        target = writable(target)
 
         # There are mixed-types columns in features table - convert them
         for mixed_column_id in target_with_mixed_types:
@@ -303,6 +334,7 @@ class TableTypesCorrector:
                     converted_array = convert_num_column_into_string_array(numerical_column)
 
                     # Store converted column into features table
+                    data.features = writable(data.features)
                     data.features[:, column_id] = converted_array
 
                     # Update information about column types (in-place)
@@ -321,6 +353,7 @@ class TableTypesCorrector:
                 numerical_column = pd.Series(data.features[:, column_id])
                 # Column must be converted into categorical
                 converted_array = convert_num_column_into_string_array(numerical_column)
+                data.features = writable(data.features)
                 data.features[:, column_id] = converted_array
 
                 # Update information about column types (in-place)
@@ -355,6 +388,7 @@ class TableTypesCorrector:
                     is_column_contain_numerical_objects = failed_ratio != 1
                     if failed_ratio < 0.5:
                         # The majority of objects can be converted into numerical
+                        data.features = writable(data.features)
                         data.features[:, column_id] = converted_column.values
 
                         # Update information about column types (in-place)
@@ -379,6 +413,7 @@ class TableTypesCorrector:
 
                 # Column must be converted into float from categorical
                 converted_column = pd.to_numeric(string_column, errors='coerce')
+                data.features = writable(data.features)
                 data.features[:, column_id] = converted_column.values
 
                 # Update information about column types (in-place)
@@ -386,48 +421,60 @@ class TableTypesCorrector:
                 features_types[column_id] = NAME_CLASS_FLOAT
 
 
-def define_column_types(table: np.array):
+def is_passed_as_is(features) -> bool:
+    """ Checks if the features are passed through the preprocessing of the tables as is.
+    Sparse features (e.g. encoded categories or vectorized texts) and memory-mapped ones are numeric,
+    and they are not converted into the object table to keep them compact """
+    return is_sparse(features) or is_memory_mapped(features)
+
+
+def define_column_types(table: np.array, typed_columns: Optional[TypedColumns] = None):
     """ Prepare information about types per columns. For each column store unique
     types, which column contains. If column with mixed type contain str object
-    additional field 'str_ids' with indices of string objects is prepared
-    """
-
-    # TODO: current processing is relatively computationally expensive - probably refactor needed
+    additional field 'str_ids' with indices of string objects is prepared.
 
-    def type_ignoring_nans(item):
-        """ Return type of element in the array. If item is np.nan - return NoneType """
-        current_type = type(item)
-        if current_type is float and np.isnan(item):
-            # Check is current element is nan or not (np.nan is a float type)
-            return type(None)
-        return current_type
+    Types are determined for the whole columns at once: the columns of the numerical
+    (non object) table contain the elements of the single type, and for the object columns
+    the types of the elements are obtained with the numpy ufunc and are compared vectorized.
+    If the typed columns of the table are known, the types of the elements of the stored columns
+    are defined by their dtypes, and only the types of the missing elements are obtained.
 
+    :param table: table to define the types of its columns
+    :param typed_columns: typed storage of the columns of the table (see :attr:`InputData.typed_columns`)
+    """
     if table is None:
         return {}
 
     n_rows, n_columns = table.shape
+    if table.dtype != object:
+        # All elements of the homogeneous table are the numpy scalars of the same type
+        column_types_names = [str(table.dtype.type)] if n_rows > 0 else []
+        return {column_id: {'types': list(column_types_names)} for column_id in range(n_columns)}
+
     columns_info = {}
     for column_id in range(n_columns):
-        current_column = table[:, column_id]
-
-        # Check every element in numpy array - it can take a long time!
-        column_types = list(map(type_ignoring_nans, current_column))
-
-        # Store only unique values
-        set_column_types = set(column_types)
-        # Convert types into string names
-        column_types_names = list(map(str, set_column_types))
+        column_types = None
+        if typed_columns is not None:
+            column_types = _typed_column_element_types(table[:, column_id], typed_columns, column_id)
+        if column_types is None:
+            column_types = _column_element_types(table[:, column_id])
+        elif not isinstance(column_types, np.ndarray):
+            # Stored column without missing elements contains the elements of its type only
+            columns_info.update({column_id: {'types': [str(column_types)]}})
+            continue
+
+        # Store only unique types (in order of their appearance) converted into string names
+        column_types_names = [str(column_type) for column_type in pd.unique(column_types)]
 
         if len(column_types_names) > 1:
             # There are several types in one column
-            types_names = np.array(column_types, dtype=str)
             # Calculate number of string objects in the dataset
-            str_number = len(np.argwhere(types_names == NAME_CLASS_STR))
-            int_number = len(np.argwhere(types_names == NAME_CLASS_INT))
-            float_number = len(np.argwhere(types_names == NAME_CLASS_FLOAT))
+            str_number = np.count_nonzero(column_types == str)
+            int_number = np.count_nonzero(column_types == int)
+            float_number = np.count_nonzero(column_types == float)
 
             # Store information about nans in the target
-            nan_ids = np.ravel(np.argwhere(types_names == NAME_CLASS_NONE))
+            nan_ids = np.flatnonzero(column_types == _NONE_TYPE)
             nan_number = len(nan_ids)
             columns_info.update({column_id: {'types': column_types_names,
                                              'str_number': str_number,
@@ -441,6 +488,31 @@ def define_column_types(table: np.array):
     return columns_info
 
 
+def _column_element_types(column: np.array) -> np.array:
+    """ Return array with types of elements in the object column. Type of np.nan elements is NoneType """
+    column_types = _element_type(column)
+    # np.nan is a float type, such elements are considered as NoneType
+    nan_mask = np.logical_and(column_types == float, pd.isna(column))
+    column_types[nan_mask] = _NONE_TYPE
+    return column_types
+
+
+def _typed_column_element_types(column: np.array, typed_columns: TypedColumns,
+                                column_id: int) -> Optional[Union[np.array, type]]:
+    """ Return array with types of elements in the object column by the type of the stored typed column,
+    only the types of the missing elements are obtained one by one. If the column has no missing elements,
+    the type of the column is returned instead of the array. None is returned if the column is not stored """
+    element_type = typed_columns.element_type(column_id)
+    if element_type is None:
+        return None
+    missing_mask = typed_columns.missing_mask(column_id)
+    if not missing_mask.any():
+        return element_type
+    column_types = np.full(len(column), element_type, dtype=object)
+    column_types[missing_mask] = _column_element_types(column[missing_mask])
+    return column_types
+
+
 def find_mixed_types_columns(columns_info: dict):
     """ Search for columns with several types in them """
     columns_with_mixed_types = []
@@ -473,6 +545,13 @@ def apply_type_transformation(table: np.array, column_types: list, log: Log):
         return None
 
     n_rows, n_cols = table.shape
+    table_type = {'f': float, 'i': int, 'u': int}.get(table.dtype.kind)
+    if table_type is not None and all(type_by_name(column_types[column_id]) is table_type
+                                      for column_id in range(n_cols)):
+        # Homogeneous numeric table already has desired types, conversion is not required
+        return table
+
+    table = writable(table)
     for column_id in range(n_cols):
         current_column = table[:, column_id]
         current_type = type_by_name(column_types[column_id])
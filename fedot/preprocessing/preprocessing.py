@@ -24,7 +24,7 @@ from fedot.core.operations.evaluation.operation_implementations.data_operations.
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import TaskTypesEnum
 from fedot.preprocessing.categorical import BinaryCategoricalPreprocessor
-from fedot.preprocessing.data_types import NAME_CLASS_INT, TableTypesCorrector
+from fedot.preprocessing.data_types import NAME_CLASS_INT, TableTypesCorrector, is_passed_as_is
 # The allowed percent of empty samples in features.
 # Example: 90% objects in features are 'nan', then drop this feature from data.
 from fedot.preprocessing.structure import DEFAULT_SOURCE_NAME, PipelineStructureExplorer
@@ -167,8 +167,14 @@ class DataPreprocessor:
     def take_only_correct_features(self, data: InputData, source_name: str):
         """ Take only correct features in the table """
         current_relevant_ids = self.ids_relevant_features[source_name]
-        if current_relevant_ids:
-            data.features = data.features[:, current_relevant_ids]
+        if current_relevant_ids and len(current_relevant_ids) < data.features.shape[1]:
+            typed_columns = data.typed_columns
+            if typed_columns is not None:
+                typed_columns = typed_columns.select_columns(current_relevant_ids)
+                data.features = typed_columns.table
+                data.typed_columns = typed_columns
+            else:
+                data.features = data.features[:, current_relevant_ids]
 
     def _prepare_obligatory_unimodal_for_fit(self, data: InputData, source_name: str) -> InputData:
         """ Method process InputData for pipeline fit method """
@@ -179,6 +185,9 @@ class DataPreprocessor:
         # Fix tables / time series sizes
         data = self._correct_shapes(data)
 
+        if data_type_is_table(data) and is_passed_as_is(data.features):
+            return self._prepare_passed_as_is_for_fit(data, source_name)
+
         if data_type_is_table(data):
             replace_inf_with_nans(data)
 
@@ -213,6 +222,11 @@ class DataPreprocessor:
             return data
 
         data = self._correct_shapes(data)
+        if data_type_is_table(data) and is_passed_as_is(data.features):
+            self.types_correctors[source_name].convert_data_for_predict(data)
+            data.idx = np.array(data.idx)
+            return data
+
         if data_type_is_table(data):
             replace_inf_with_nans(data)
             self.take_only_correct_features(data, source_name)
@@ -228,6 +242,22 @@ class DataPreprocessor:
             self._apply_categorical_encoding(data, source_name)
         return data
 
+    def _prepare_passed_as_is_for_fit(self, data: InputData, source_name: str) -> InputData:
+        """ Sparse and memory-mapped features are numeric (see :func:`is_passed_as_is`), so they are passed as is
+        without the columns and types correction, only the target is processed """
+        self.ids_relevant_features[source_name] = []
+        self.ids_incorrect_features[source_name] = []
+        data = self._drop_rows_with_nan_in_target(data)
+
+        self.types_correctors[source_name].convert_data_for_fit(data)
+        if self.types_correctors[source_name].target_converting_has_errors:
+            data = self._drop_rows_with_nan_in_target(data)
+
+        self._train_target_encoder(data, source_name)
+        data.target = self._apply_target_encoding(data, source_name)
+        data.idx = np.array(data.idx)
+        return data
+
     def _prepare_optional_for_fit(self, pipeline, data: InputData, source_name: str):
         """ Perform optional preprocessing for unimodal data """
         if not data_type_is_table(data):
@@ -291,6 +321,9 @@ class DataPreprocessor:
 
         if len(non_nan_row_ids) == 0:
             raise ValueError('Data contains too much nans in the target column(s)')
+        if len(non_nan_row_ids) == len(target):
+            # All rows remain, so the features (that can be memory-mapped) are not copied
+            return data
         data.features = features[non_nan_row_ids, :]
         data.target = target[non_nan_row_ids, :]
         data.idx = np.array(data.idx)[non_nan_row_ids]
@@ -357,12 +390,15 @@ class DataPreprocessor:
         self.features_encoders.update({source_name: encoder})
 
     def cut_dataset(self, data: InputData, border: int):
-        """ Cutting large dataset based on border (number of objects to remain) """
-        self.log.info("Cut dataset due to it size is large")
-        data.shuffle()
-        data.idx = data.idx[:border]
-        data.features = data.features[:border]
-        data.target = data.target[:border]
+        """ Cutting large dataset based on border (number of objects to remain).
+        The objects are sampled randomly preserving their order, so only the sampled rows
+        of the memory-mapped features are read """
+        self.log.warn(f'Dataset is cut to {border} randomly sampled objects of {len(data.idx)} due to its size, '
+                      f'disable safe mode to use the whole dataset')
+        sampled_rows = np.sort(np.random.choice(len(data.idx), size=border, replace=False))
+        data.idx = np.asarray(data.idx)[sampled_rows]
+        data.features = data.features[sampled_rows]
+        data.target = data.target[sampled_rows]
 
     @staticmethod
     def _apply_imputation_unidata(data: InputData):
@@ -7,6 +7,7 @@ from examples.simple.classification.classification_pipelines import classificati
 from fedot.api.api_utils.api_composer import ApiComposer
 from fedot.api.api_utils.assumptions.assumptions_builder import AssumptionsBuilder
 from fedot.api.main import Fedot
+from fedot.core.composer.cache import DEFAULT_MAX_DISK_SIZE
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.log import default_log
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
@@ -159,3 +160,21 @@ def test_api_composer_available_operations():
                   )
     model.fit(train_data)
     assert model.params.api_params['available_operations'] == available_operations
+
+
+def test_api_cache_disk_size_limited():
+    train_data, _, _ = get_dataset(task_type='classification')
+    model = Fedot(problem='classification', use_cache=True, cache_max_disk_size=3000, cache_eviction_policy='lfu')
+    cache = model.api_composer.cache
+    try:
+        for operation_type in ('logit', 'knn', 'dt'):
+            pipeline = Pipeline(PrimaryNode(operation_type))
+            pipeline.fit(train_data)
+            cache.save_pipeline(pipeline)
+
+        effectiveness = cache._db.get_effectiveness()
+        assert cache._db.eviction_policy == 'lfu'
+        assert 0 < cache._db.size <= 3000 and effectiveness['disk_evicted'] > 0
+    finally:
+        cache.set_disk_limit(DEFAULT_MAX_DISK_SIZE)
+        cache.reset()
@@ -1,4 +1,5 @@
 import datetime
+import multiprocessing
 import os
 import random
 
@@ -16,8 +17,10 @@ from fedot.core.composer.gp_composer.gp_composer import PipelineComposerRequirem
 from fedot.core.composer.random_composer import RandomSearchComposer, RandomSearchOptimiser, RandomGraphFactory
 from fedot.core.data.data import InputData
 from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.fitness import SingleObjFitness
 from fedot.core.optimisers.gp_comp.gp_operators import random_graph
 from fedot.core.optimisers.gp_comp.gp_optimiser import GPGraphOptimiserParameters, GeneticSchemeTypesEnum
+from fedot.core.optimisers.gp_comp.individual import Individual
 from fedot.core.optimisers.gp_comp.operators.mutation import MutationStrengthEnum
 from fedot.core.optimisers.gp_comp.operators.selection import SelectionTypesEnum
 from fedot.core.optimisers.objective import Objective
@@ -276,6 +279,55 @@ def test_gp_composer_with_start_depth(data_fixture, request):
     assert composer.optimiser.max_depth == 2
 
 
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_gp_composer_with_async_steady_state_scheme(file_data_setup, monkeypatch, n_jobs):
+    monkeypatch.setattr(multiprocessing, 'cpu_count', lambda: 2)
+    random.seed(1)
+    np.random.seed(1)
+    pop_size, num_of_generations = 4, 2
+    req = PipelineComposerRequirements(primary=['logit', 'knn'], secondary=['logit', 'knn'],
+                                       max_arity=2, max_depth=2, pop_size=pop_size,
+                                       num_of_generations=num_of_generations, n_jobs=n_jobs)
+    optimiser_parameters = GPGraphOptimiserParameters(genetic_scheme_type=GeneticSchemeTypesEnum.steady_state_async)
+    builder = ComposerBuilder(task=Task(TaskTypesEnum.classification)).with_history() \
+        .with_requirements(req).with_metrics(ClassificationMetricsEnum.ROCAUC) \
+        .with_optimiser_params(parameters=optimiser_parameters)
+    composer = builder.build()
+    pipeline = composer.compose_pipeline(data=file_data_setup)
+
+    assert isinstance(pipeline, Pipeline)
+    # Generations are counted by the number of evaluations
+    optimiser = composer.optimiser
+    assert optimiser.generations.generation_num >= num_of_generations + 1
+    assert all(len(generation) == pop_size for generation in composer.history.individuals)
+    assert optimiser.eval_dispatcher.n_in_flight == 0
+
+
+def test_async_steady_state_replacement_skips_duplicates():
+    req = PipelineComposerRequirements(primary=['logit', 'knn'], secondary=['logit', 'knn'], pop_size=2)
+    optimiser_parameters = GPGraphOptimiserParameters(genetic_scheme_type=GeneticSchemeTypesEnum.steady_state_async)
+    composer = ComposerBuilder(task=Task(TaskTypesEnum.classification)).with_requirements(req) \
+        .with_metrics(ClassificationMetricsEnum.ROCAUC).with_optimiser_params(parameters=optimiser_parameters) \
+        .build()
+    optimiser = composer.optimiser
+    adapter = PipelineAdapter()
+    population = []
+    for fitness, pipeline in zip((-0.5, -0.6), (pipeline_first(), Pipeline(PrimaryNode('logit')))):
+        ind = Individual(adapter.adapt(pipeline))
+        ind.fitness = SingleObjFitness(fitness)
+        population.append(ind)
+
+    # The clone of the individual of the population (e.g. with the fitness from the archive) is skipped
+    clone = Individual(adapter.adapt(pipeline_first()))
+    clone.fitness = SingleObjFitness(-0.9)
+    assert optimiser._steady_state_replacement(population, clone, pop_size=2) == population
+
+    offspring = Individual(adapter.adapt(Pipeline(PrimaryNode('knn'))))
+    offspring.fitness = SingleObjFitness(-0.9)
+    replaced = optimiser._steady_state_replacement(population, offspring, pop_size=2)
+    assert [ind.uid for ind in replaced] == [offspring.uid, population[1].uid]
+
+
 @pytest.mark.parametrize('data_fixture', ['file_data_setup'])
 def test_gp_composer_saving_info_from_process(data_fixture, request):
     data = request.getfixturevalue(data_fixture)
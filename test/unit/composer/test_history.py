@@ -1,4 +1,6 @@
+import gc
 import os
+from copy import deepcopy
 from functools import partial
 from pathlib import Path
 
@@ -199,3 +201,62 @@ def test_history_backward_compatibility():
     # Assert that fitness and objective are valid
     assert all(isinstance(ind.fitness, SingleObjFitness) for gen in history.individuals for ind in gen)
     assert isinstance(history._objective, Objective)
+
+
+def _history_with_generations(history: OptHistory, generations_number: int = 3):
+    adapter = PipelineAdapter()
+    population = [Individual(adapter.adapt(Pipeline(PrimaryNode(operation))))
+                  for operation in ['linear', 'ridge']]
+    for gen_num in range(generations_number):
+        for ind_num, ind in enumerate(population):
+            ind.fitness = SingleObjFitness(float(gen_num + ind_num))
+        history.add_to_history(population)
+        history.add_to_archive_history(population[:1])
+        operator = ParentOperator(operator_type='mutation', operator_name='simple', parent_individuals=population[:1])
+        population = [Individual(deepcopy(ind.graph), parent_operators=[operator]) for ind in population]
+    return history
+
+
+def test_history_copies_share_parents():
+    history = _history_with_generations(OptHistory())
+
+    first_parent = history.individuals[0][0]
+    for ind in history.individuals[1]:
+        assert ind.parent_operators[0].parent_individuals[0] is first_parent
+
+    # Copies are not kept after they are removed from the history
+    del first_parent, ind
+    history.individuals.clear()
+    history.archive_history.clear()
+    gc.collect()
+    assert len(history._copied_individuals) == 0
+
+
+def test_history_saved_with_indent(tmp_path):
+    history = _history_with_generations(OptHistory())
+    history_path = tmp_path / 'history.json'
+    history.save(history_path)
+
+    assert history_path.read_text().startswith('{\n    ')
+    assert OptHistory.load(history_path).historical_fitness == history.historical_fitness
+
+
+def test_history_streamed_to_storage(tmp_path):
+    storage_path = tmp_path / 'history.jsonl'
+    in_memory_history = _history_with_generations(OptHistory())
+    stored_history = _history_with_generations(OptHistory(storage_path=storage_path))
+    loaded_history = OptHistory.load(storage_path)
+
+    assert storage_path.read_text().count('\n') == 1 + 2 * len(in_memory_history.individuals)
+    for history in [stored_history, loaded_history]:
+        assert len(history.individuals) == len(in_memory_history.individuals)
+        assert len(history.archive_history) == len(in_memory_history.archive_history)
+        assert history.historical_fitness == in_memory_history.historical_fitness
+        assert [ind.graph.descriptive_id for ind in history.individuals[-1]] == \
+               [ind.graph.descriptive_id for ind in in_memory_history.individuals[-1]]
+    # Parents from the previous generation are resolved lazily
+    last_gen = loaded_history.individuals[-1]
+    assert last_gen[0].parent_operators[0].parent_individuals[0] is loaded_history.individuals[-2][0]
+
+    restored_history = OptHistory.load(stored_history.save())
+    assert restored_history.historical_fitness == in_memory_history.historical_fitness
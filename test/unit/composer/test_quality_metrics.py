@@ -8,6 +8,7 @@ from sklearn.datasets import load_breast_cancer
 from fedot.core.composer.metrics import QualityMetric, ROCAUC
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.optimisers.objective import Objective
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -120,3 +121,30 @@ def test_roc_auc_multiclass_correct():
                                                pos_label=data.class_labels[i])
         roc_auc = ROCAUC.auc(fpr, tpr)
         assert roc_auc
+
+
+def test_objective_predicts_once_per_output_mode(data_setup):
+    train, test = data_setup
+    pipeline = default_valid_pipeline()
+    pipeline.fit(input_data=train)
+
+    predicted_modes = []
+    pipeline_predict = pipeline.predict
+
+    def counted_predict(input_data, output_mode='default'):
+        predicted_modes.append(output_mode)
+        return pipeline_predict(input_data, output_mode=output_mode)
+
+    pipeline.predict = counted_predict
+
+    metrics = [ClassificationMetricsEnum.ROCAUC, ClassificationMetricsEnum.logloss,
+               ClassificationMetricsEnum.f1, ClassificationMetricsEnum.accuracy,
+               ComplexityMetricsEnum.node_num]
+    fitness = Objective(metrics, is_multi_objective=True)(pipeline, reference_data=test)
+
+    assert fitness.valid
+    assert sorted(predicted_modes) == ['default', 'labels']
+    pipeline.predict = pipeline_predict
+    separate_fitness = [Objective(metric, is_multi_objective=True)(pipeline, reference_data=test).values[0]
+                        for metric in metrics]
+    assert np.allclose(fitness.values, separate_fitness)
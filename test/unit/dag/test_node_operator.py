@@ -41,3 +41,31 @@ def test_node_operator_distance_to_primary_level():
     distance = root._operator.distance_to_primary_level()
 
     assert distance == 2
+
+
+def test_node_operator_structural_hash():
+    # given
+    root, third_node, first_node, _ = get_nodes()
+    other_root = get_nodes()[0]
+    initial_hash = root.structural_hash
+
+    # then
+    assert initial_hash == other_root.structural_hash
+    assert initial_hash != third_node.structural_hash
+
+    # hash follows the changes of parameters of the parent (including in-place ones)
+    first_node.custom_params = {'n_neighbors': 3, 'p': 1}
+    changed_hash = root.structural_hash
+    assert changed_hash != initial_hash
+
+    first_node.content['params']['n_neighbors'] = 4
+    assert root.structural_hash != changed_hash
+
+    # order of the parameters does not matter
+    other_first_node = other_root.nodes_from[0].nodes_from[0]
+    other_first_node.custom_params = {'p': 1, 'n_neighbors': 4}
+    assert root.structural_hash == other_root.structural_hash
+
+    # hash follows the changes of edges
+    third_node.nodes_from.remove(first_node)
+    assert root.structural_hash != other_root.structural_hash
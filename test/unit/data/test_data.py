@@ -5,7 +5,11 @@ import numpy as np
 import pandas as pd
 import pytest
 from sklearn.datasets import load_iris
+from sklearn.linear_model import SGDRegressor
+from sklearn.preprocessing import StandardScaler
 
+from fedot.core.data import array_utilities
+from fedot.core.data.array_utilities import writable
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.pipelines.node import PrimaryNode
@@ -51,6 +55,22 @@ def test_data_subset_incorrect(data_setup):
         assert data_setup.subset_range(-1, -1)
 
 
+def test_data_subset_indices_correct(data_setup):
+    selected_idx = [10, 3, 150, 99]
+    subset = data_setup.subset_indices(selected_idx)
+
+    # Missing indices are skipped and the order of selected ones is preserved
+    assert np.array_equal(subset.idx, [10, 3, 99])
+    assert np.array_equal(subset.features, data_setup.features[[10, 3, 99]])
+    assert np.array_equal(subset.target, data_setup.target[[10, 3, 99]])
+    # Lookup over idx is built once and is shared with the views of data
+    assert data_setup.view().idx_lookup is data_setup.idx_lookup
+
+    # Indices of other types are compared by the string representation
+    data_setup.idx = np.array([str(i) for i in range(100)], dtype=object)
+    assert np.array_equal(data_setup.subset_indices(['5', 7]).idx, ['5', '7'])
+
+
 def test_data_from_csv():
     test_file_path = str(os.path.dirname(__file__))
     file = '../../data/simple_classification.csv'
@@ -238,3 +258,96 @@ def test_data_convert_dt_indexes_correct():
     assert np.all(train_data.supplementary_data.non_int_idx == old_train_data_idx)
     assert np.all(train_pred_data.supplementary_data.non_int_idx == old_train_pred_data_idx)
     assert np.all(test_data.supplementary_data.non_int_idx == old_test_data_idx)
+
+
+def test_data_view_shares_arrays_as_read_only(data_setup):
+    data = data_setup
+    data_view = data.view()
+
+    assert np.shares_memory(data_view.features, data.features)
+    assert np.shares_memory(data_view.target, data.target)
+    assert not data_view.features.flags.writeable
+    assert data.features.flags.writeable
+    assert data_view.supplementary_data is not data.supplementary_data
+    with pytest.raises(ValueError):
+        data_view.features[0, 0] = -1
+
+    # copy is materialised only before modification
+    data_view.features = writable(data_view.features)
+    data_view.features[0, 0] = -1
+    assert data.features[0, 0] != -1
+
+    multi_modal_view = MultiModalData({'data_source_table': data}).view()
+    assert np.shares_memory(multi_modal_view['data_source_table'].features, data.features)
+
+
+def test_pipeline_does_not_copy_input_arrays(data_setup):
+    data = data_setup
+    features_before = data.features.copy()
+    pipeline = Pipeline(PrimaryNode('scaling'))
+    pipeline.fit(data)
+    pipeline.predict(data)
+
+    assert np.array_equal(data.features, features_before)
+    assert data.features.flags.writeable
+
+
+def test_data_from_csv_memory_mapped(tmp_path):
+    file_path = os.path.join(str(os.path.dirname(__file__)), '../../data/simple_regression_train.csv')
+    task = Task(TaskTypesEnum.regression)
+    expected = InputData.from_csv(file_path, task=task, target_columns='target')
+    actual = InputData.from_csv(file_path, task=task, target_columns='target',
+                                mmap_folder=str(tmp_path), chunk_size=7)
+
+    assert isinstance(actual.features, np.memmap)
+    assert np.allclose(actual.features, expected.features.astype(float))
+    assert np.allclose(actual.target, expected.target.astype(float))
+    assert np.array_equal(actual.idx, expected.idx)
+
+    projected = InputData.from_npy(os.path.join(str(tmp_path), 'simple_regression_train_features.npy'),
+                                   task=task, columns=[1, 2, 3])
+    assert isinstance(projected.features, np.memmap)
+    assert np.allclose(projected.features, expected.features[:, 1:4].astype(float))
+
+
+def test_memory_mapped_data_fitted_by_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(array_utilities, 'CHUNK_ROWS', 8)
+    partial_fit_calls = []
+    partial_fit = SGDRegressor.partial_fit
+
+    def counted_partial_fit(model, *args, **kwargs):
+        partial_fit_calls.append(len(args[0]))
+        return partial_fit(model, *args, **kwargs)
+
+    monkeypatch.setattr(SGDRegressor, 'partial_fit', counted_partial_fit)
+    file_path = os.path.join(str(os.path.dirname(__file__)), '../../data/simple_regression_train.csv')
+    task = Task(TaskTypesEnum.regression)
+    data = InputData.from_csv(file_path, task=task, target_columns='target', mmap_folder=str(tmp_path))
+    rows_number = len(data.features)
+
+    scaling = Pipeline(PrimaryNode('scaling'))
+    scaled = scaling.fit(data)
+    model = Pipeline(PrimaryNode('sgdr'))
+    model.fit(data)
+    prediction = model.predict(data)
+
+    assert scaling.root_node.fitted_operation.operation.n_samples_seen_ == rows_number
+    assert np.allclose(scaled.predict, StandardScaler().fit_transform(data.features))
+    assert len(partial_fit_calls) == np.ceil(rows_number / 8)
+    assert model.root_node.fitted_operation.t_ == rows_number + 1
+    assert prediction.predict.shape[0] == rows_number
+
+
+def test_typed_columns_valid_for_same_table_only():
+    features_df = pd.DataFrame({'number': [1.0, np.nan, 3.0], 'category': ['a', 'b', None]})
+    data = InputData.from_dataframe(features_df, np.array([0, 1, 0]))
+    numerical_data = InputData.from_dataframe(features_df[['number']])
+
+    assert data.typed_columns is not None
+    assert data.view().typed_columns is data.typed_columns
+    assert list(data.typed_columns.missing_mask(1)) == [False, False, True]
+    # Types of the columns of the numerical table are known from its dtype
+    assert numerical_data.typed_columns is None
+
+    data.features = data.features.copy()
+    assert data.typed_columns is None
@@ -4,6 +4,7 @@ from typing import List
 
 import numpy as np
 import pytest
+from scipy import sparse
 
 from examples.simple.regression.regression_with_tuning import get_regression_dataset
 from fedot.core.data.data import InputData, OutputData
@@ -214,6 +215,21 @@ def test_data_merge_tables_with_equal_length_but_different_indices():
     assert all(np.isin(merged_data.idx, output.idx).all() for output in outputs)
 
 
+def test_data_merge_sparse_tables():
+    """ Test merge of the sparse and dense predicts keeps the result sparse """
+    outputs = generate_output_tables(input_lengths=[30, 20], overlapping=True)
+    dense_predicts = [np.random.sample((len(output.idx), 3)) for output in outputs]
+    outputs[0].predict = sparse.csr_matrix(dense_predicts[0])
+    outputs[1].predict = dense_predicts[1]
+
+    merged_data = DataMerger.get(outputs).merge()
+
+    assert sparse.isspmatrix_csr(merged_data.features)
+    expected_features = np.hstack([predict[np.isin(output.idx, merged_data.idx)]
+                                   for output, predict in zip(outputs, dense_predicts)])
+    assert np.allclose(merged_data.features.toarray(), expected_features)
+
+
 def test_data_merge_tables_with_unequal_nonunique_indices():
     outputs = generate_output_tables(input_lengths=[20, 25, 30], unique=False)
     with pytest.raises(ValueError, match='not equal and not unique'):
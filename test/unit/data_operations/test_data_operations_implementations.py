@@ -9,8 +9,10 @@ from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.data.supplementary_data import SupplementaryData
 from fedot.core.operations.evaluation.operation_implementations.data_operations. \
     sklearn_transformations import ImputationImplementation
+from fedot.core.operations.evaluation.operation_implementations.data_operations.lagged_tables import \
+    LaggedTablesCache
 from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
-    CutImplementation, LaggedTransformationImplementation
+    CutImplementation, LaggedTransformationImplementation, prepare_target, ts_to_table
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -527,6 +529,47 @@ def test_lagged_with_multi_ts_type():
     assert np.all(np.isclose(lagged_predict, correct_predict_output))
 
 
+def test_ts_to_table_and_prepare_target_correct():
+    time_series = np.arange(10, 20, dtype=float)
+    idx = np.arange(len(time_series))
+
+    new_idx, features = ts_to_table(idx, time_series, window_size=3, is_lag=True)
+    new_idx, features, target = prepare_target(idx, new_idx, features, time_series, forecast_length=2)
+
+    assert np.array_equal(features, [[10, 11, 12], [11, 12, 13], [12, 13, 14],
+                                     [13, 14, 15], [14, 15, 16], [15, 16, 17]])
+    assert np.array_equal(target, [[13, 14], [14, 15], [15, 16], [16, 17], [17, 18], [18, 19]])
+    assert np.array_equal(new_idx, [3, 4, 5, 6, 7, 8])
+    # lagged table is the read-only view of the time series
+    assert np.shares_memory(features, time_series)
+    assert not features.flags.writeable
+
+    # windows with gaps are removed
+    time_series[5] = np.nan
+    _, features = ts_to_table(idx, time_series, window_size=3)
+    assert np.array_equal(features[:, 0], [10, 11, 12, 16, 17])
+
+
+def test_lagged_tables_cache_extends_and_slices_tables():
+    cache = LaggedTablesCache()
+    time_series = np.arange(20, dtype=float)
+    time_series[5] = np.nan
+
+    prefix_table = cache.get(time_series[:10], window_size=3)
+    full_table = cache.get(time_series, window_size=3)
+    # the longer series extends the table of the prefix
+    assert len(cache) == 1
+    assert np.array_equal(full_table[:len(prefix_table)], prefix_table)
+    assert np.array_equal(full_table[:, 0], [0, 1, 2] + list(range(6, 18)))
+    assert np.array_equal(cache.get(time_series[:8], window_size=3), prefix_table[:3])
+
+    # changed series is not taken from the cache
+    changed_series = time_series.copy()
+    changed_series[0] = 100
+    assert cache.get(changed_series, window_size=3)[0, 0] == 100
+    assert np.array_equal(cache.get(time_series, window_size=3), full_table)
+
+
 def test_poly_features_on_big_datasets():
     """
     Use a table with a large number of features to run a poly features operation.
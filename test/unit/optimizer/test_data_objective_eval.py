@@ -153,3 +153,20 @@ def test_pipeline_objective_evaluate_with_invalid_metrics(classification_dataset
     objective_eval = PipelineObjectiveEvaluate(Objective(metrics), data_split, log=log)
     fitness = objective_eval(pipeline)
     assert not fitness.valid
+
+
+def test_pipeline_objective_evaluate_stops_on_failed_fold(classification_dataset):
+    pipeline = sample_pipeline()
+    log = default_log(__name__)
+
+    def data_split_with_failed_fold():
+        yield from OneFoldInputDataSplit().input_split(input_data=classification_dataset)
+        yield from empty_datasource()
+        yield from OneFoldInputDataSplit().input_split(input_data=classification_dataset)
+
+    objective_eval = PipelineObjectiveEvaluate(Objective(ClassificationMetricsEnum.ROCAUC_penalty),
+                                               data_split_with_failed_fold, log=log)
+    assert objective_eval.folds_number() == 3
+    assert objective_eval.evaluate_fold(deepcopy(pipeline), 0) is not None
+    assert objective_eval.evaluate_fold(deepcopy(pipeline), 1) is None
+    assert not objective_eval(pipeline).valid
@@ -1,15 +1,22 @@
 import datetime
+import multiprocessing
+from functools import partial
 
 import pytest
 
 from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.archive import FitnessArchive, canonical_graph_hash
 from fedot.core.optimisers.fitness import Fitness, null_fitness
-from fedot.core.optimisers.gp_comp.evaluation import MultiprocessingDispatcher, SimpleDispatcher
+from fedot.core.optimisers.gp_comp.evaluation import FITNESS_BUDGET_KEY, MultiprocessingDispatcher, \
+    SimpleDispatcher, racing_budgets
 from fedot.core.optimisers.gp_comp.individual import Individual
-from fedot.core.optimisers.objective import Objective
+from fedot.core.optimisers.objective import Objective, PipelineObjectiveEvaluate
 from fedot.core.optimisers.timer import OptimisationTimer
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.quality_metrics_repository import ClassificationMetricsEnum
+from fedot.core.utilities.worker_pool import WorkerPool
+from fedot.core.validation.split import tabular_cv_generator
 from test.unit.pipelines.test_node_cache import pipeline_first, pipeline_second, pipeline_third, pipeline_fourth
 from test.unit.validation.test_table_cv import get_classification_data
 
@@ -113,3 +120,211 @@ def test_simple_dispatcher_with_timeout(set_up_tests):
     fitness = [x.fitness for x in evaluated_population]
     assert all(x.valid for x in fitness), "At least one fitness value is invalid"
     assert len(population) == len(evaluated_population), "Not all pipelines was evaluated"
+
+
+def test_canonical_graph_hash_ignores_nodes_order_and_uids(set_up_tests):
+    adapter, population = set_up_tests
+    graph = population[0].graph
+    same_graph = adapter.adapt(pipeline_first())
+    same_graph.nodes = list(reversed(same_graph.nodes))
+
+    assert canonical_graph_hash(graph) == canonical_graph_hash(same_graph)
+    assert canonical_graph_hash(graph) != canonical_graph_hash(population[1].graph)
+
+
+def test_multiprocessing_dispatcher_with_fitness_archive(set_up_tests):
+    adapter, population = set_up_tests
+    evaluated_graphs = []
+
+    def counted_objective(pipeline: Pipeline) -> Fitness:
+        evaluated_graphs.append(pipeline)
+        return prepared_objective(pipeline)
+
+    archive = FitnessArchive()
+    evaluator = MultiprocessingDispatcher(adapter, fitness_archive=archive).dispatch(counted_objective)
+
+    # The same structure appears twice in one population
+    first_population = population + [Individual(adapter.adapt(pipeline_first()))]
+    evaluated_population = evaluator(first_population)
+    assert len(evaluated_population) == len(first_population)
+    assert len(evaluated_graphs) == len(population)
+
+    # Rediscovered structures are not evaluated again
+    second_population = [Individual(adapter.adapt(pipeline)) for pipeline in (pipeline_first(), pipeline_second())]
+    evaluated_population = evaluator(second_population)
+    assert len(evaluated_graphs) == len(population)
+    assert all(ind.fitness.valid and ind.metadata['fitness_from_archive'] for ind in evaluated_population)
+    assert archive.hits == 3
+    assert len(archive) == len(population)
+
+
+def test_multiprocessing_dispatcher_reuses_pool(set_up_tests, monkeypatch):
+    monkeypatch.setattr(multiprocessing, 'cpu_count', lambda: 2)
+    adapter, population = set_up_tests
+
+    dispatcher = MultiprocessingDispatcher(adapter, n_jobs=2)
+    evaluator = dispatcher.dispatch(prepared_objective)
+    evaluated_population = evaluator(population)
+    pool = dispatcher._worker_pool._pool
+    assert pool is not None
+    assert len(evaluated_population) == len(population)
+
+    # the next generation is evaluated by the same workers with the same published state
+    published_state = dispatcher._published_state
+    evaluated_population = evaluator([Individual(adapter.adapt(pipeline_first()))])
+    assert dispatcher._worker_pool._pool is pool
+    assert dispatcher._published_state is published_state
+    assert all(ind.fitness.valid for ind in evaluated_population)
+
+    # The state is published again after the next dispatch with the only finalizer of its shared memory
+    publisher_finalizer = dispatcher._publisher_finalizer
+    evaluator = dispatcher.dispatch(prepared_objective)
+    evaluator([Individual(adapter.adapt(pipeline_second()))])
+    assert not publisher_finalizer.alive and dispatcher._publisher_finalizer.alive
+
+    dispatcher.shutdown()
+    assert not dispatcher._worker_pool.is_started and dispatcher._published_state is None
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_multiprocessing_dispatcher_async_evaluation(monkeypatch, n_jobs):
+    monkeypatch.setattr(multiprocessing, 'cpu_count', lambda: 2)
+    adapter = PipelineAdapter()
+    # Individuals of the shared population are already changed by the evaluations of the previous tests
+    population = [Individual(adapter.adapt(pipeline)) for pipeline in
+                  (pipeline_first(), pipeline_second(), pipeline_third())]
+
+    dispatcher = MultiprocessingDispatcher(adapter, n_jobs=n_jobs, fitness_archive=FitnessArchive())
+    dispatcher.dispatch(prepared_objective)
+    for ind in population:
+        dispatcher.submit(ind)
+    assert dispatcher.n_in_flight == len(population)
+
+    results = [dispatcher.next_evaluated() for _ in population]
+    assert dispatcher.n_in_flight == 0
+    assert {submitted.uid for submitted, _ in results} == {ind.uid for ind in population}
+    assert all(evaluated.fitness.valid for _, evaluated in results)
+
+    # Fitness of the evaluated structure is taken from archive
+    dispatcher.submit(Individual(adapter.adapt(pipeline_first())))
+    _, evaluated = dispatcher.next_evaluated()
+    assert evaluated.metadata['fitness_from_archive']
+    dispatcher.shutdown()
+
+
+def test_multiprocessing_dispatcher_cancels_lost_evaluations(monkeypatch):
+    monkeypatch.setattr(multiprocessing, 'cpu_count', lambda: 2)
+    adapter = PipelineAdapter()
+    dispatcher = MultiprocessingDispatcher(adapter, n_jobs=2)
+    dispatcher.dispatch(prepared_objective)
+    dispatcher.submit(Individual(adapter.adapt(pipeline_first())))
+
+    # The evaluation is not finished at once, as the workers are only started
+    with pytest.raises(TimeoutError):
+        dispatcher.next_evaluated(timeout=0)
+    assert dispatcher.cancel_in_flight() == 1
+    assert dispatcher.n_in_flight == 0
+
+    # Late result of the cancelled evaluation is ignored
+    ind = Individual(adapter.adapt(pipeline_second()))
+    dispatcher.submit(ind)
+    submitted, evaluated = dispatcher.next_evaluated()
+    assert submitted.uid == ind.uid and evaluated is not None
+    assert dispatcher.n_in_flight == 0
+    dispatcher.shutdown()
+
+
+def test_multiprocessing_dispatcher_with_shared_worker_pool(set_up_tests, monkeypatch):
+    monkeypatch.setattr(multiprocessing, 'cpu_count', lambda: 2)
+    adapter, population = set_up_tests
+
+    with WorkerPool(n_jobs=2) as worker_pool:
+        worker_pool.warm_up()
+        pool = worker_pool.get()
+        dispatcher = MultiprocessingDispatcher(adapter, n_jobs=2)
+        dispatcher.set_worker_pool(worker_pool)
+        evaluated_population = dispatcher.dispatch(prepared_objective)(population)
+        assert len(evaluated_population) == len(population)
+
+        # the shared pool is not stopped by the dispatcher
+        dispatcher.shutdown()
+        assert worker_pool.get() is pool
+
+
+def test_worker_pool_finalizer_is_detached_on_shutdown(monkeypatch):
+    monkeypatch.setattr(multiprocessing, 'cpu_count', lambda: 2)
+    worker_pool = WorkerPool(n_jobs=2)
+    worker_pool.get()
+    first_finalizer = worker_pool._pool_finalizer
+
+    # Restarted pool has the only finalizer
+    worker_pool.get(n_jobs=1)
+    second_finalizer = worker_pool._pool_finalizer
+    assert not first_finalizer.alive and second_finalizer.alive
+
+    worker_pool.shutdown()
+    assert not second_finalizer.alive and worker_pool._pool_finalizer is None
+
+
+def test_multiprocessing_dispatcher_evaluates_folds_in_parallel(monkeypatch):
+    monkeypatch.setattr(multiprocessing, 'cpu_count', lambda: 2)
+    adapter = PipelineAdapter()
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('scaling')]))
+    objective_eval = PipelineObjectiveEvaluate(Objective(ClassificationMetricsEnum.ROCAUC),
+                                               partial(tabular_cv_generator, get_classification_data(), folds=3))
+
+    sequential_dispatcher = MultiprocessingDispatcher(adapter, n_jobs=1)
+    sequential_ind = sequential_dispatcher.dispatch(objective_eval)([Individual(adapter.adapt(pipeline))])[0]
+
+    evaluate_by_folds = MultiprocessingDispatcher._evaluate_by_folds
+    folds_calls = []
+    monkeypatch.setattr(MultiprocessingDispatcher, '_evaluate_by_folds',
+                        lambda *args: folds_calls.append(args) or evaluate_by_folds(*args))
+    dispatcher = MultiprocessingDispatcher(adapter, n_jobs=2)
+    evaluated_population = dispatcher.dispatch(objective_eval)([Individual(adapter.adapt(pipeline))])
+    dispatcher.shutdown()
+
+    assert len(folds_calls) == 1
+    assert len(evaluated_population) == 1
+    evaluated_ind = evaluated_population[0]
+    assert evaluated_ind.fitness.valid
+    assert evaluated_ind.fitness.value == pytest.approx(sequential_ind.fitness.value)
+    assert evaluated_ind.graph.root_node.descriptive_id == sequential_ind.graph.root_node.descriptive_id
+    assert evaluated_ind.metadata['computation_time_in_seconds'] > 0
+
+
+@pytest.mark.parametrize('folds_number, reduction_factor, expected_budgets',
+                         [(5, 3, [1, 5]), (4, 2, [1, 2, 4]), (9, 3, [1, 3, 9]), (1, 2, [1])])
+def test_racing_budgets(folds_number, reduction_factor, expected_budgets):
+    assert racing_budgets(folds_number, reduction_factor) == expected_budgets
+
+
+def test_multiprocessing_dispatcher_races_individuals_on_folds():
+    adapter = PipelineAdapter()
+    pipelines = [Pipeline(PrimaryNode('logit')),
+                 Pipeline(PrimaryNode('bernb')),
+                 Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('scaling')])),
+                 Pipeline(PrimaryNode('dt')),
+                 Pipeline(PrimaryNode('knn'))]
+    population = [Individual(adapter.adapt(pipeline)) for pipeline in pipelines]
+    objective_eval = PipelineObjectiveEvaluate(Objective(ClassificationMetricsEnum.ROCAUC),
+                                               partial(tabular_cv_generator, get_classification_data(), folds=4))
+    fitness_archive = FitnessArchive()
+    dispatcher = MultiprocessingDispatcher(adapter, n_jobs=1, fitness_archive=fitness_archive,
+                                           racing_reduction_factor=2)
+    evaluated_population = dispatcher.dispatch(objective_eval)(population)
+
+    assert len(evaluated_population) == len(population)
+    partially_evaluated = [ind for ind in evaluated_population if FITNESS_BUDGET_KEY in ind.metadata]
+    fully_evaluated = [ind for ind in evaluated_population if FITNESS_BUDGET_KEY not in ind.metadata]
+    assert partially_evaluated and fully_evaluated
+    assert all(0 < ind.metadata[FITNESS_BUDGET_KEY] < 1 for ind in partially_evaluated)
+    # Partial fitness may be overestimated, so the best one is confirmed on all folds
+    assert FITNESS_BUDGET_KEY not in max(evaluated_population, key=lambda ind: ind.fitness).metadata
+    assert all(fitness_archive.get(ind.graph) is None for ind in partially_evaluated)
+    assert all(fitness_archive.get(ind.graph) == ind.fitness for ind in fully_evaluated)
+
+
+def test_multiprocessing_dispatcher_checks_racing_reduction_factor():
+    with pytest.raises(ValueError):
+        MultiprocessingDispatcher(PipelineAdapter(), racing_reduction_factor=1)
@@ -471,6 +471,31 @@ def test_pipeline_adapters_params_correct():
     assert np.isclose(init_alpha, restored_alpha)
 
 
+def test_pipeline_adapters_do_not_share_nodes_state():
+    """ Checking that the conversion through adapter drops the fitted state
+    and the converted graphs do not change the source ones
+    """
+    init_alpha = 12.1
+    pipeline = pipeline_with_custom_parameters(init_alpha)
+    pipeline.fit(get_synthetic_regression_data(n_samples=10, n_features=2, random_state=2021))
+
+    adapter = PipelineAdapter()
+    opt_graph = adapter.adapt(pipeline)
+    assert pipeline.is_fitted
+    assert [node.uid for node in opt_graph.nodes] == [node.uid for node in pipeline.nodes]
+    assert all(getattr(node, '_fitted_operation', None) is None for node in opt_graph.nodes)
+    assert all(parent in opt_graph.nodes for node in opt_graph.nodes for parent in node.nodes_from)
+
+    restored_pipeline = adapter.restore(opt_graph)
+    assert not restored_pipeline.is_fitted
+    assert restored_pipeline.root_node.descriptive_id == pipeline.root_node.descriptive_id
+
+    restored_pipeline.root_node.custom_params['alpha'] = 1.0
+    restored_pipeline.root_node.metadata.metric = 1.0
+    assert opt_graph.root_node.content['params']['alpha'] == init_alpha
+    assert opt_graph.root_node.content['metadata'].metric is None
+
+
 def test_preds_before_and_after_convert_equal():
     """ Check if the pipeline predictions change before and after conversion
     through the adapter
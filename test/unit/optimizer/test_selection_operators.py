@@ -1,17 +1,26 @@
 from functools import partial
+from typing import List
+
+import numpy as np
+import pytest
 
 from fedot.core.composer.advisor import PipelineChangeAdvisor
 from fedot.core.composer.gp_composer.gp_composer import PipelineComposerRequirements
 from fedot.core.debug.metrics import RandomMetric
 from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.archive import ParetoFront
 from fedot.core.optimisers.fitness.fitness import SingleObjFitness
+from fedot.core.optimisers.fitness.multi_objective_fitness import MultiObjFitness
 from fedot.core.optimisers.gp_comp.gp_operators import random_graph
 from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.gp_comp.operators.multi_objective import dominance_matrix, non_dominated_sort
 from fedot.core.optimisers.gp_comp.operators.selection import (
     SelectionTypesEnum,
     individuals_selection,
+    nsga2_selection,
     random_selection,
     selection,
+    spea2_selection,
     tournament_selection
 )
 from fedot.core.optimisers.optimizer import GraphGenerationParams
@@ -36,6 +45,13 @@ def rand_population_gener_and_eval(pop_size=4):
     return population
 
 
+def multi_objective_population(fitness_values) -> List[Individual]:
+    population = rand_population_gener_and_eval(pop_size=len(fitness_values))
+    for ind, values in zip(population, fitness_values):
+        ind.fitness = MultiObjFitness(values=values, weights=1)
+    return population
+
+
 def obj_function() -> float:
     metric_function = RandomMetric.get_value
     return metric_function()
@@ -98,3 +114,50 @@ def test_individuals_selection_equality_individuals():
     selected_individuals_ref = [str(ind) for ind in selected_individuals]
     assert (len(selected_individuals) == num_of_inds and
             len(set(selected_individuals_ref)) == 1)
+
+
+@pytest.mark.parametrize('selection_func', [spea2_selection, nsga2_selection])
+def test_multi_objective_selection(selection_func):
+    # The first three individuals form the Pareto front (the objectives are minimised)
+    fitness_values = [(0.1, 0.9), (0.5, 0.5), (0.9, 0.1), (0.1, 0.95), (0.6, 0.6), (0.7, 0.7)]
+    population = multi_objective_population(fitness_values)
+
+    dominance = dominance_matrix(population)
+    assert dominance[0, 3] and not dominance[3, 0] and not dominance[0, 1]
+    assert [list(front) for front in non_dominated_sort(dominance)] == [[0, 1, 2], [3, 4], [5]]
+
+    selected_individuals = selection_func(population, pop_size=5)
+    assert len(selected_individuals) == 5
+    assert all(ind in selected_individuals for ind in population[:5])
+
+    # Extreme individuals of the front are preserved after truncation
+    selected_individuals = selection_func(population, pop_size=2)
+    assert len(selected_individuals) == 2
+    assert population[0] in selected_individuals and population[2] in selected_individuals
+
+
+def test_pareto_front_update():
+    fitness_values = [(0.5, 0.5), (0.6, 0.6), (0.4, 0.7), (0.3, 0.3)]
+    population = multi_objective_population(fitness_values)
+    archive = ParetoFront()
+
+    archive.update(population[:3])
+    assert sorted(ind.fitness.values for ind in archive) == [(0.4, 0.7), (0.5, 0.5)]
+
+    # The new individual dominates the whole front, its twin is not added
+    archive.update([population[3], population[3]])
+    assert len(archive) == 1
+    assert archive[0].fitness.values == (0.3, 0.3)
+
+
+def test_pareto_front_keeps_fitness_values_of_members():
+    fitness_values = [tuple(values) for values in np.random.default_rng(1).random((50, 2))]
+    population = multi_objective_population(fitness_values)
+    archive = ParetoFront()
+
+    archive.update(population[:1])
+    for ind in population[1:]:
+        archive.update([ind])
+        # The matrix of the fitness values is updated with the members instead of being rebuilt
+        assert archive._values is not None
+        assert np.array_equal(archive._values, [hof_member.fitness.values for hof_member in archive])
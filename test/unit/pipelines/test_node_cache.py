@@ -1,11 +1,14 @@
+import gc
 import glob
 import os
+import weakref
 
 import numpy as np
 import pytest
 from sklearn.datasets import load_breast_cancer
 
-from fedot.core.composer.cache import OperationsCache
+from fedot.core.composer.cache import CachedState, MemoryCacheTier, OperationsCache
+from fedot.core.composer.cache_db import OperationsCacheDB
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
@@ -318,4 +321,82 @@ def test_multi_pipeline_caching_with_cache(data_setup, cache_cleanup):
     cache.try_load_nodes(nodes_with_actual_cache)
     assert all(node.fitted_operation is not None for node in nodes_with_actual_cache)
 
+
+def test_cache_db_lookup_order_and_effectiveness(data_setup, cache_cleanup):
+    train, _ = data_setup
+    cache = OperationsCache()
+
+    pipeline = pipeline_first()
+    pipeline.fit(input_data=train)
+    cache.save_pipeline(pipeline)
+    # identical subtrees are stored once
+    unique_nodes_num = len({node.descriptive_id for node in pipeline.nodes})
+    assert len(cache) == unique_nodes_num
+
+    cache.save_pipeline(pipeline)
+    assert len(cache) == unique_nodes_num
+
+    saved_operation = pipeline.root_node.fitted_operation
+    not_fitted_node = PrimaryNode('scaling')
+    nodes = [pipeline.root_node, not_fitted_node, pipeline.root_node]
+    cache.try_load_nodes(nodes)
+    assert nodes[0].fitted_operation is not None and nodes[2].fitted_operation is not None
+    # each load restores the separate copy of the operation
+    assert pipeline.root_node.fitted_operation is not saved_operation
+    assert not_fitted_node.fitted_operation is None
+    assert cache.effectiveness_ratio == {'pipelines': 0., 'nodes': round(2 / 3, 3),
+                                         'memory_nodes': round(2 / 3, 3), 'disk_nodes': 0.}
+
+    cache.try_load_into_pipeline(pipeline)
+    assert cache.effectiveness_ratio == {'pipelines': 0.5, 'nodes': round(9 / 10, 3),
+                                         'memory_nodes': round(9 / 10, 3), 'disk_nodes': 0.}
+
+
+def test_memory_cache_tier_lru_eviction():
+    memory = MemoryCacheTier(max_size=10)
+    memory.put('first', b'1111')
+    memory.put('second', b'2222')
+    # the first state becomes the most recently used
+    assert memory.get('first') == b'1111'
+    memory.put('third', b'3333')
+    assert 'second' not in memory
+    assert 'first' in memory and 'third' in memory
+    assert memory.size == 8
+
+    # too large states are not stored
+    memory.put('large', b'0' * 11)
+    assert 'large' not in memory and len(memory) == 2
+
+
+@pytest.mark.parametrize('eviction_policy, evicted_uid', [('lru', 'second'), ('lfu', 'third')])
+def test_cache_db_eviction_by_size(eviction_policy, evicted_uid):
+    db = OperationsCacheDB(None, max_size=3000, eviction_policy=eviction_policy)
+    operations = {uid: CachedState(np.zeros(100)) for uid in ('first', 'second', 'third')}
+    for uid in ('first', 'second'):
+        db.add_operations([(uid, operations[uid])])
+    db.get_operations(['second', 'second'])
+    db.get_operations(['first', 'first', 'first'])
+    db.add_operations([('third', operations['third'])])
+    db.get_operations(['third'])
+
+    # the limit is exceeded with the next record
+    db.add_operations([('fourth', CachedState(np.zeros(100)))])
+    assert db.size <= 3000
+    assert db.get_operations([evicted_uid]) == [None]
+    assert db.get_effectiveness()['disk_evicted'] == 1
+
+def test_cache_db_flushes_stats_when_collected(tmp_path):
+    db_path = str(tmp_path / 'cache')
+    db = OperationsCacheDB(db_path)
+    db.add_effectiveness(nodes_hit=1, nodes_total=2)
+    db_ref = weakref.ref(db)
+    del db
+    gc.collect()
+
+    # Connection finalizer does not keep the storage alive and flushes its statistics
+    assert db_ref() is None
+    effectiveness = OperationsCacheDB(db_path).get_effectiveness()
+    assert effectiveness['nodes_hit'] == 1 and effectiveness['nodes_total'] == 2
+
+
 # TODO Add changed data case for cache
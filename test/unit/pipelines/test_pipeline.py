@@ -449,6 +449,51 @@ def test_pipeline_unfit(data_fixture, request):
         assert pipeline.predict(data)
 
 
+def test_shared_parent_node_runs_once_per_pass(data_setup):
+    """ Node with several children must be fitted and applied only once per pipeline pass """
+    train, test = train_test_data_setup(data_setup)
+
+    shared_node = PrimaryNode('scaling')
+    first = SecondaryNode('logit', nodes_from=[shared_node])
+    second = SecondaryNode('lda', nodes_from=[shared_node])
+    third = SecondaryNode('knn', nodes_from=[shared_node])
+    final = SecondaryNode('rf', nodes_from=[first, second, third])
+    pipeline = Pipeline(final)
+
+    calls = {'fit': 0, 'predict': 0}
+
+    def counted(method_name):
+        method = getattr(shared_node, method_name)
+
+        def wrapper(*args, **kwargs):
+            calls[method_name] += 1
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    shared_node.fit = counted('fit')
+    shared_node.predict = counted('predict')
+
+    pipeline.fit(train)
+    pipeline.predict(test)
+
+    assert calls == {'fit': 1, 'predict': 1}
+
+
+def test_nodes_with_same_uid_are_fitted_separately(data_setup):
+    """ Copied nodes keep the uid of the original, but they are different nodes of the pipeline """
+    train, test = train_test_data_setup(data_setup)
+
+    first = SecondaryNode('logit', nodes_from=[PrimaryNode('scaling')])
+    second = SecondaryNode('logit', nodes_from=[PrimaryNode('normalization')])
+    second.uid = first.uid
+    pipeline = Pipeline(SecondaryNode('rf', nodes_from=[first, second]))
+
+    pipeline.fit(train)
+    assert pipeline.is_fitted
+    assert pipeline.predict(test) is not None
+
+
 def test_ts_forecasting_pipeline_with_poly_features():
     """ Test pipeline with polynomial features in ts forecasting task """
     lagged_node = PrimaryNode('lagged')
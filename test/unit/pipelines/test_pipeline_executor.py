@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.pipelines.executor import LevelParallelExecutor, topological_levels
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.utilities.worker_pool import WorkerPool
+from test.unit.pipelines.test_pipeline import data_setup
+
+
+def multi_branch_pipeline() -> Pipeline:
+    first_scaling = PrimaryNode('scaling')
+    second_scaling = PrimaryNode('normalization')
+    logit = SecondaryNode('logit', nodes_from=[first_scaling])
+    lda = SecondaryNode('lda', nodes_from=[first_scaling, second_scaling])
+    knn = SecondaryNode('knn', nodes_from=[second_scaling])
+    final = SecondaryNode('logit', nodes_from=[logit, lda, knn])
+    return Pipeline(final)
+
+
+def test_topological_levels_correct():
+    pipeline = multi_branch_pipeline()
+
+    levels = topological_levels(pipeline.nodes)
+
+    assert [len(level) for level in levels] == [2, 3, 1]
+    assert levels[-1] == [pipeline.root_node]
+    for level_num, level in enumerate(levels):
+        for node in level:
+            assert node.distance_to_primary_level == level_num
+
+
+@pytest.mark.parametrize('backend, with_worker_pool', [('thread', False), ('process', False), ('process', True)])
+def test_level_parallel_executor_same_as_sequential(data_setup, backend, with_worker_pool):
+    train, test = train_test_data_setup(data_setup)
+
+    sequential_pipeline = multi_branch_pipeline()
+    sequential_pipeline.fit(train)
+    sequential_predict = sequential_pipeline.predict(test)
+
+    worker_pool = WorkerPool(n_jobs=2) if with_worker_pool else None
+    executor = LevelParallelExecutor(n_jobs=2, backend=backend, worker_pool=worker_pool)
+    parallel_pipeline = multi_branch_pipeline()
+    parallel_pipeline.fit(train, executor=executor)
+    parallel_predict = parallel_pipeline.predict(test, executor=executor)
+    if worker_pool is not None:
+        # the shared pool is reused by the passes and is stopped by its owner
+        assert worker_pool.is_started
+        worker_pool.shutdown()
+
+    assert parallel_pipeline.is_fitted
+    assert np.allclose(sequential_predict.predict, parallel_predict.predict)
+    # Fitted pipeline can be applied without executor as well
+    assert np.allclose(sequential_predict.predict, parallel_pipeline.predict(test).predict)
+
+
+def test_level_parallel_executor_splits_n_jobs():
+    executor = LevelParallelExecutor(n_jobs=2)
+
+    assert executor.n_jobs_per_node(4) == 2
+    assert executor.n_jobs_per_node(1) == 1
+    with pytest.raises(ValueError):
+        LevelParallelExecutor(backend='unknown')
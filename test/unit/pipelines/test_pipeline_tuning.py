@@ -1,4 +1,6 @@
+import multiprocessing
 import os
+from copy import deepcopy
 from time import time
 from random import seed
 
@@ -16,9 +18,12 @@ from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.tuning.search_space import SearchSpace
 from fedot.core.pipelines.tuning.sequential import SequentialTuner
-from fedot.core.pipelines.tuning.tuner_interface import _greater_is_better, _calculate_loss_function
+from fedot.core.pipelines.tuning.tuner_interface import _TrialsEvaluator, _greater_is_better, \
+    _calculate_loss_function
 from fedot.core.pipelines.tuning.unified import PipelineTuner
 from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.utilities.worker_pool import WorkerPool
+from fedot.core.validation.tune.cache import FittedNodesCache
 from test.unit.tasks.test_forecasting import get_ts_data
 
 seed(1)
@@ -429,6 +434,87 @@ def test_early_stop_in_tuning(data_fixture, request):
     assert time() - start_node_tuner < 1
 
 
+def test_pipeline_tuner_evaluates_trials_by_batches(regression_dataset, monkeypatch):
+    monkeypatch.setattr(multiprocessing, 'cpu_count', lambda: 2)
+    train_data, _ = train_test_data_setup(data=regression_dataset)
+    evaluate = _TrialsEvaluator.evaluate
+    batches = []
+
+    def evaluate_batch(evaluator, parameters):
+        batches.append(len(parameters))
+        return evaluate(evaluator, parameters)
+
+    monkeypatch.setattr(_TrialsEvaluator, 'evaluate', evaluate_batch)
+
+    with WorkerPool(2) as worker_pool:
+        pipeline_tuner = PipelineTuner(pipeline=get_complex_regr_pipeline(),
+                                       task=train_data.task,
+                                       iterations=5,
+                                       worker_pool=worker_pool,
+                                       batch_size=2)
+        tuned_pipeline = pipeline_tuner.tune_pipeline(input_data=train_data, loss_function=mse)
+
+    assert batches == [2, 2, 1]
+    assert pipeline_tuner.obtained_metric is not None
+    assert tuned_pipeline.is_fitted
+
+
+def test_sequential_tuner_tunes_independent_nodes_together(regression_dataset):
+    train_data, _ = train_test_data_setup(data=regression_dataset)
+    pipeline = Pipeline(SecondaryNode('rfr', nodes_from=[PrimaryNode('ridge'), PrimaryNode('linear'),
+                                                         SecondaryNode('lasso', nodes_from=[PrimaryNode('scaling')])]))
+    sequential_tuner = SequentialTuner(pipeline=pipeline,
+                                       task=train_data.task,
+                                       iterations=8,
+                                       batch_size=2)
+    nodes_order = [node.operation.operation_type for node in pipeline.nodes]
+
+    groups = sequential_tuner.get_independent_groups(sequential_tuner.get_nodes_order(len(pipeline.nodes)))
+    assert [sorted(nodes_order[node_id] for node_id in group) for group in groups] == \
+           [['rfr'], ['lasso', 'linear', 'ridge'], ['scaling']]
+
+    sequential_tuner.tune_pipeline(input_data=train_data, loss_function=mse)
+    assert sequential_tuner.obtained_metric is not None
+
+
+def test_early_stop_in_batched_tuning(tiny_classification_dataset):
+    train_data, _ = train_test_data_setup(data=tiny_classification_dataset)
+    pipeline_tuner = PipelineTuner(pipeline=get_class_pipelines()[0],
+                                   task=train_data.task,
+                                   iterations=1000,
+                                   early_stopping_rounds=1,
+                                   batch_size=4)
+    start_time = time()
+    pipeline_tuner.tune_pipeline(input_data=train_data, loss_function=roc)
+    assert time() - start_time < 5
+
+
+def test_fitted_nodes_cache_refits_only_changed_nodes(regression_dataset):
+    train_data, test_data = train_test_data_setup(data=regression_dataset)
+    pca_node = SecondaryNode('pca', nodes_from=[PrimaryNode('scaling')])
+    pipeline = Pipeline(SecondaryNode('ridge', nodes_from=[pca_node]))
+    cache = FittedNodesCache()
+
+    cache.fit_predict(pipeline, train_data, test_data, fold_key=0)
+    fitted_pca = pca_node.fitted_operation
+    assert len(cache) == 2
+
+    pipeline.root_node.custom_params = {'alpha': 5.0}
+    prediction = cache.fit_predict(pipeline, train_data, test_data, fold_key=0)
+    assert pca_node.fitted_operation is fitted_pca
+    assert pipeline.is_fitted
+    expected_pipeline = deepcopy(pipeline)
+    expected_pipeline.fit_from_scratch(train_data)
+    assert np.allclose(prediction.predict, expected_pipeline.predict(test_data).predict)
+
+    cache.fit_predict(pipeline, train_data, test_data, fold_key=1)
+    assert pca_node.fitted_operation is not fitted_pca
+
+    pca_node.custom_params = {'n_components': 0.5}
+    cache.fit_predict(pipeline, train_data, test_data, fold_key=0)
+    assert pca_node.fitted_operation is not fitted_pca
+
+
 def test_search_space_correctness_after_customization():
     default_search_space = SearchSpace()
 
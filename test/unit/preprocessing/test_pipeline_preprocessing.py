@@ -1,8 +1,12 @@
 import numpy as np
+from scipy import sparse
 
+from fedot.core.data import array_utilities
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.data.supplementary_data import SupplementaryData
+from fedot.core.operations.evaluation.operation_implementations.data_operations.categorical_encoders import \
+    OneHotEncodingImplementation
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -266,3 +270,40 @@ def test_data_with_mixed_types_per_column_processed_correctly():
     assert len(importances) == 6
     # Target must contain 4 labels
     assert predicted.predict.shape[-1] == 4
+
+
+def test_sparse_features_pass_through_pipeline():
+    """ Sparse features are preprocessed and split without densifying,
+    the operations that can't process them get the dense features """
+    features = sparse.random(100, 30, density=0.1, format='csr', random_state=0)
+    target = np.asarray(features.sum(axis=1)).reshape((-1, 1))
+    input_data = InputData(idx=np.arange(100), features=features, target=target,
+                           task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+    train_data, test_data = train_test_data_setup(input_data)
+    assert sparse.issparse(train_data.features)
+
+    pipeline = Pipeline(SecondaryNode('rfr', nodes_from=[PrimaryNode('ridge'), PrimaryNode('scaling')]))
+    pipeline.fit(train_data)
+    predicted = pipeline.predict(test_data)
+
+    assert predicted.predict.shape[0] == len(test_data.idx)
+    assert pipeline.nodes[0].fitted_operation.n_features_in_ == 31
+
+
+def test_one_hot_encoding_output_is_sparse(monkeypatch):
+    """ Large one hot encoded table is kept as the sparse matrix and is processed by the next model """
+    monkeypatch.setattr(array_utilities, 'SPARSE_MIN_SIZE', 0)
+    monkeypatch.setattr(array_utilities, 'SPARSE_MAX_DENSITY', 1)
+    input_data = get_mixed_data(task=Task(TaskTypesEnum.classification), extended=True)
+
+    encoder = OneHotEncodingImplementation()
+    encoder.fit(input_data)
+    encoded = encoder.transform(input_data, True)
+
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('one_hot_encoding')]))
+    pipeline.fit(input_data)
+    predicted = pipeline.predict(input_data)
+
+    assert sparse.isspmatrix_csr(encoded.predict)
+    assert encoded.predict.shape[1] == len(encoded.supplementary_data.column_types['features'])
+    assert predicted.predict.shape[0] == len(input_data.idx)
@@ -9,7 +9,8 @@ from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import TaskTypesEnum, Task
-from fedot.preprocessing.data_types import TableTypesCorrector
+from fedot.preprocessing.data_types import NAME_CLASS_FLOAT, NAME_CLASS_INT, NAME_CLASS_NONE, NAME_CLASS_STR, \
+    TableTypesCorrector, define_column_types
 from fedot.preprocessing.structure import DEFAULT_SOURCE_NAME
 from test.unit.api.test_api_cli_params import project_root_path
 from test.unit.preprocessing.test_pipeline_preprocessing import data_with_mixed_types_in_each_column, \
@@ -173,3 +174,69 @@ def test_numerical_column_with_string_nans():
 
     n_rows, n_cols = data.features.shape
     assert n_cols == 1
+
+
+def test_define_column_types_correct():
+    """ Types of elements are determined per columns, np.nan and None elements are considered as NoneType """
+    table = np.array([[1, 'a', 1.5, 'b'],
+                      [2, np.nan, None, 'c'],
+                      [3, 4, np.nan, 'd'],
+                      ['5', 0.5, 2.5, 'e']], dtype=object)
+
+    columns_info = define_column_types(table)
+
+    assert set(columns_info[0]['types']) == {NAME_CLASS_INT, NAME_CLASS_STR}
+    assert columns_info[0]['int_number'] == 3 and columns_info[0]['str_number'] == 1
+    assert set(columns_info[1]['types']) == {NAME_CLASS_INT, NAME_CLASS_STR, NAME_CLASS_FLOAT, NAME_CLASS_NONE}
+    assert list(columns_info[1]['nan_ids']) == [1]
+    assert set(columns_info[2]['types']) == {NAME_CLASS_FLOAT, NAME_CLASS_NONE}
+    assert columns_info[2]['float_number'] == 2 and list(columns_info[2]['nan_ids']) == [1, 2]
+    assert columns_info[3] == {'types': [NAME_CLASS_STR]}
+    # Elements of the numerical table are numpy scalars of the table type
+    assert define_column_types(np.array([[1.0, np.nan]])) == {0: {'types': [str(np.float64)]},
+                                                              1: {'types': [str(np.float64)]}}
+
+
+def test_define_column_types_by_typed_columns():
+    """ Types of the columns defined by their dtypes are the same as the types defined by their elements """
+    features_df = pd.DataFrame({'float': [1.5, np.nan, 2.0, np.inf],
+                                'int': [1, 2, 3, 4],
+                                'str': [' a', None, 'b ', np.nan],
+                                'mixed': [1, 'a', 2.5, None],
+                                'numpy_str': [np.str_('a'), 'b', None, 'c'],
+                                'bool': [True, False, True, True],
+                                'empty': [None] * 4})
+    data = InputData.from_dataframe(features_df)
+    table = data.features.astype(object)
+
+    columns_info = define_column_types(table, data.typed_columns)
+
+    assert data.typed_columns is not None
+    assert str(columns_info) == str(define_column_types(table))
+    assert columns_info[1] == {'types': [NAME_CLASS_INT]}
+
+
+def test_table_with_typed_columns_preprocessed_correctly():
+    """ Data with the typed columns is preprocessed the same way as the data with the table only """
+    train_data, test_data = data_with_complicated_types()
+    train_df = pd.DataFrame(train_data.features).infer_objects()
+    train_data.features = train_df.to_numpy()
+    typed_train_data = InputData.from_dataframe(train_df, train_data.target, idx=train_data.idx,
+                                                task=train_data.task)
+    assert typed_train_data.typed_columns is not None
+
+    pipelines_predictions = []
+    for data in (train_data, typed_train_data):
+        pipeline = correct_preprocessing_params(Pipeline(PrimaryNode('dt')), categorical_max_classes_th=13)
+        # The tree chooses between the equally good splits randomly
+        np.random.seed(1)
+        train_predicted = pipeline.fit(data, use_fitted=True)
+        features_columns_info = pipeline.preprocessor.types_correctors[DEFAULT_SOURCE_NAME].features_columns_info
+        pipelines_predictions.append((str(features_columns_info), train_predicted.features,
+                                      pipeline.predict(test_data).predict))
+
+    (columns_info, train_features, predicted), (typed_columns_info, typed_train_features, typed_predicted) = \
+        pipelines_predictions
+    assert typed_columns_info == columns_info
+    assert np.array_equal(typed_train_features, train_features)
+    assert np.array_equal(typed_predicted, predicted)
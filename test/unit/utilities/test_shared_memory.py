@@ -0,0 +1,44 @@
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.utilities import shared_memory
+from fedot.core.utilities.shared_memory import SharedMemoryPublisher, load_shared, release_shared_blocks
+
+
+def test_shared_memory_publisher_shares_arrays_once():
+    features = np.random.rand(100, 10)
+    data = InputData(idx=np.arange(100), features=features, target=np.zeros(100),
+                     task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+    publisher = SharedMemoryPublisher(min_array_size=1000)
+    try:
+        # the same array is placed into shared memory only once
+        payload = publisher.dumps((data, features))
+        assert publisher.size == features.nbytes
+        assert len(payload) < features.nbytes
+
+        restored_data, restored_features = load_shared(payload)
+        assert np.array_equal(restored_data.features, features)
+        assert np.array_equal(restored_data.target, data.target)
+        assert not restored_features.flags.writeable
+        # small arrays are pickled as usual
+        assert restored_data.idx.flags.writeable
+        del restored_data, restored_features
+    finally:
+        release_shared_blocks()
+        publisher.close()
+    assert publisher.size == 0
+
+
+def test_shared_memory_publisher_pickles_arrays_without_shared_memory(monkeypatch):
+    # Shared memory is not supported on Python < 3.8
+    monkeypatch.setattr(shared_memory, 'SharedMemory', None)
+    features = np.random.rand(100, 10)
+    publisher = SharedMemoryPublisher(min_array_size=1000)
+
+    restored_features = load_shared(publisher.dumps(features))
+
+    assert publisher.size == 0
+    assert np.array_equal(restored_features, features)
+    assert restored_features.flags.writeable
@@ -1,7 +1,9 @@
+import multiprocessing
 import os
 from datetime import timedelta
 from functools import partial
 
+import numpy as np
 import pytest
 from sklearn.metrics import roc_auc_score as roc_auc
 from sklearn.model_selection import KFold, StratifiedKFold
@@ -18,6 +20,7 @@ from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.operation_types_repository import OperationTypesRepository
 from fedot.core.repository.quality_metrics_repository import ClassificationMetricsEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.utilities.worker_pool import WorkerPool
 from fedot.core.optimisers.objective.objective import Objective
 from fedot.core.optimisers.objective import PipelineObjectiveEvaluate, DataObjectiveBuilder
 from fedot.core.validation.split import tabular_cv_generator
@@ -108,6 +111,26 @@ def test_cv_tabular_predictions_correct():
     assert dataset_size == target_size
 
 
+def test_cv_tabular_predictions_with_worker_pool_correct(monkeypatch):
+    monkeypatch.setattr(multiprocessing, 'cpu_count', lambda: 2)
+    folds = 2
+    dataset = get_iris_data()
+
+    expected_predictions, expected_target = cv_tabular_predictions(pipeline=pipeline_simple(),
+                                                                   reference_data=dataset,
+                                                                   cv_folds=folds)
+    with WorkerPool(n_jobs=2) as worker_pool:
+        predictions, target = cv_tabular_predictions(pipeline=pipeline_simple(),
+                                                     reference_data=dataset,
+                                                     cv_folds=folds,
+                                                     worker_pool=worker_pool)
+        assert worker_pool.is_started
+    assert not worker_pool.is_started
+    # folds are gathered in the same order as in the sequential validation
+    assert np.array_equal(target, expected_target)
+    assert predictions.shape == expected_predictions.shape
+
+
 def test_composer_with_cv_optimization_correct():
     task = Task(task_type=TaskTypesEnum.classification)
     dataset_to_compose, dataset_to_validate = train_test_data_setup(get_classification_data())